@@ -1,9 +1,9 @@
 import { Link } from "wouter";
 import { format } from "date-fns";
-import type { Post } from "@shared/schema";
+import type { PostListItem } from "@shared/schema";
 import { Badge } from "@/components/ui/badge";
 
-export function FeaturedCard({ post }: { post: Post }) {
+export function FeaturedCard({ post }: { post: PostListItem }) {
   return (
     <Link href={`/article/${post.id}`} className="group block h-full">
       <article className="relative h-[500px] md:h-[600px] w-full overflow-hidden rounded-xl shadow-xl hover:shadow-2xl transition-all duration-500">
@@ -1,9 +1,9 @@
 import { Link } from "wouter";
 import { format } from "date-fns";
-import type { Post } from "@shared/schema";
+import type { PostListItem } from "@shared/schema";
 import { Badge } from "@/components/ui/badge";
 
-export function NewsCard({ post }: { post: Post }) {
+export function NewsCard({ post }: { post: PostListItem }) {
   return (
     <Link href={`/article/${post.id}`} className="group block">
       <article className="bg-card h-full flex flex-col overflow-hidden border-b border-border/50 pb-6 group-hover:border-primary/20 transition-colors">
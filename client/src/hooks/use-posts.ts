@@ -1,4 +1,9 @@
-import { useQuery, useMutation, useQueryClient } from "@tanstack/react-query";
+import {
+  useInfiniteQuery,
+  useQuery,
+  useMutation,
+  useQueryClient,
+} from "@tanstack/react-query";
 import { api, buildUrl, type PostInput } from "@shared/routes";
 
 // API 베이스 URL 설정
@@ -11,19 +16,29 @@ export function usePosts(params?: { category?: string; search?: string }) {
     params?.search,
   ].filter(Boolean);
 
-  return useQuery({
+  // 서버는 한 번에 최대 limit개(기본 50)만 주고 다음 페이지는 X-Next-Cursor 헤더로 알려줌
+  return useInfiniteQuery({
     queryKey,
-    queryFn: async () => {
+    initialPageParam: undefined as string | undefined,
+    queryFn: async ({ pageParam }) => {
       // Build query string manually since fetch URL needs it
       const url = new URL(API_BASE_URL + api.posts.list.path);
       if (params?.category)
         url.searchParams.append("category", params.category);
       if (params?.search) url.searchParams.append("search", params.search);
+      // 목록 화면에는 본문이 필요 없으므로 카드용 필드만 요청
+      url.searchParams.append("fields", "list");
+      if (pageParam) url.searchParams.append("cursor", pageParam);
 
       const res = await fetch(url.toString(), { credentials: "include" });
       if (!res.ok) throw new Error("Failed to fetch posts");
-      return api.posts.list.responses[200].parse(await res.json());
+      return {
+        posts: api.posts.list.responses[200].parse(await res.json()),
+        nextCursor: res.headers.get("X-Next-Cursor") ?? undefined,
+      };
     },
+    getNextPageParam: (lastPage) => lastPage.nextCursor,
+    select: (data) => data.pages.flatMap((page) => page.posts),
   });
 }
 
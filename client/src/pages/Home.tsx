@@ -2,13 +2,20 @@ import { usePosts } from "@/hooks/use-posts";
 import { Header } from "@/components/Header";
 import { Link, useSearch } from "wouter";
 import { Loader2 } from "lucide-react";
+import { Button } from "@/components/ui/button";
 
 export default function Home() {
   const searchString = useSearch();
   const params = new URLSearchParams(searchString);
   const search = params.get("search") || undefined;
 
-  const { data: posts, isLoading } = usePosts({ search });
+  const {
+    data: posts,
+    isLoading,
+    hasNextPage,
+    fetchNextPage,
+    isFetchingNextPage,
+  } = usePosts({ search });
 
   // Sort by newest first
   const sortedPosts = posts
@@ -29,18 +36,35 @@ export default function Home() {
             <Loader2 className="w-8 h-8 animate-spin text-primary" />
           </div>
         ) : sortedPosts.length > 0 ? (
-          <ul className="space-y-4">
-            {sortedPosts.map((post) => (
-              <li key={post.id}>
-                <Link
-                  href={`/article/${post.id}`}
-                  className="text-lg text-foreground hover:text-primary transition-colors block py-2 border-b border-border/30 hover:border-primary"
+          <>
+            <ul className="space-y-4">
+              {sortedPosts.map((post) => (
+                <li key={post.id}>
+                  <Link
+                    href={`/article/${post.id}`}
+                    className="text-lg text-foreground hover:text-primary transition-colors block py-2 border-b border-border/30 hover:border-primary"
+                  >
+                    {post.title}
+                  </Link>
+                </li>
+              ))}
+            </ul>
+            {hasNextPage && (
+              <div className="flex justify-center pt-8">
+                <Button
+                  variant="outline"
+                  onClick={() => fetchNextPage()}
+                  disabled={isFetchingNextPage}
                 >
-                  {post.title}
-                </Link>
-              </li>
-            ))}
-          </ul>
+                  {isFetchingNextPage ? (
+                    <Loader2 className="w-4 h-4 animate-spin" />
+                  ) : (
+                    "더 보기"
+                  )}
+                </Button>
+              </div>
+            )}
+          </>
         ) : (
           <p className="text-center text-muted-foreground py-20">
             검색 결과를 찾을 수 없습니다.
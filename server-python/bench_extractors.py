@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+본문 추출기 벤치마크 (BeautifulSoup vs lxml vs Trafilatura)
+
+사용법:
+    python bench_extractors.py                # 내장 합성 코퍼스
+    python bench_extractors.py saved_pages/   # 저장해 둔 기사 HTML(*.html) 디렉터리
+"""
+
+import sys
+import time
+from pathlib import Path
+
+from extractors import AVAILABLE_EXTRACTORS
+
+
+def _paragraphs(prefix: str, count: int) -> str:
+    return "".join(
+        f"<p>{prefix} {i}번째 문단입니다. 정부는 {i}차 발표에서 내년 경제 성장률 전망을 조정했다고 밝혔다.</p>"
+        for i in range(count)
+    )
+
+
+def build_corpus():
+    """한국 뉴스 사이트에서 흔한 구조를 흉내 낸 페이지들"""
+    sidebar = "<aside>" + _paragraphs("사이드바 많이 본 뉴스", 30) + "</aside>"
+    menu = "<nav>" + "".join(f"<a href='/s{i}'>섹션 {i}</a>" for i in range(80)) + "</nav>"
+    pages = {
+        "nested_article": f"<html><body>{menu}<div id='wrap'><div class='article_wrap'><div id='articleBody' class='article_body'><div class='inner'>{_paragraphs('중첩 본문', 25)}</div></div></div></div>{sidebar}</body></html>",
+        "naver_style": f"<html><body>{menu}<div id='ct'><div id='newsct_article'><article id='dic_area'>{_paragraphs('네이버형 본문', 20)}</article></div></div><div class='related_content'>{_paragraphs('관련 기사', 10)}</div></body></html>",
+        "div_only": f"<html><body>{menu}<div class='content'>" + "".join(
+            f"<div class='text'>div 문단 {i}: 한국은행은 {i}차 회의에서 기준금리를 동결했다고 설명했다.</div>" for i in range(30)
+        ) + f"</div>{sidebar}</body></html>",
+        "euc_kr": (f"<html><head><meta charset='euc-kr'></head><body><article>{_paragraphs('EUC-KR 본문', 20)}</article></body></html>").encode("cp949"),
+        "large_portal": f"<html><body>{menu * 5}<main><div class='article-content'>{_paragraphs('대형 포털 본문', 60)}</div></main>" + sidebar * 10 + "</body></html>",
+    }
+    return {name: html if isinstance(html, bytes) else html.encode("utf-8") for name, html in pages.items()}
+
+
+def load_corpus(directory: str):
+    return {path.name: path.read_bytes() for path in sorted(Path(directory).glob("*.html"))}
+
+
+def duplicate_ratio(text: str) -> float:
+    """같은 문장이 반복되는 비율 (중첩 컨테이너 중복 추출 정도)"""
+    sentences = [s.strip() for s in text.split(".") if len(s.strip()) > 10]
+    if not sentences:
+        return 0.0
+    return 1 - len(set(sentences)) / len(sentences)
+
+
+def main():
+    corpus = load_corpus(sys.argv[1]) if len(sys.argv) > 1 else build_corpus()
+    if not corpus:
+        print("코퍼스가 비어 있습니다")
+        return
+    print(f"코퍼스: {len(corpus)}개 페이지, 총 {sum(map(len, corpus.values())) // 1024}KB\n")
+
+    rounds = 20
+    print(f"{'extractor':<14} {'ms/page':>9} {'성공':>6} {'평균 글자수':>10} {'중복 비율':>8}")
+    for name, extractor in AVAILABLE_EXTRACTORS.items():
+        started = time.perf_counter()
+        for _ in range(rounds):
+            for html in corpus.values():
+                extractor(html)
+        elapsed = time.perf_counter() - started
+        results = {page: extractor(html) for page, html in corpus.items()}
+
+        succeeded = [text for text in results.values() if text]
+        avg_chars = sum(map(len, succeeded)) / len(succeeded) if succeeded else 0
+        dup = sum(map(duplicate_ratio, succeeded)) / len(succeeded) if succeeded else 0
+        per_page_ms = elapsed / (rounds * len(corpus)) * 1000
+        print(f"{name:<14} {per_page_ms:9.2f} {len(succeeded):>4}/{len(corpus)} {avg_chars:10.0f} {dup:8.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Google News 기사 ID 오프라인 디코딩 벤치마크
+기존 base64 + 정규식 스캔 방식과 gnews_id의 protobuf 파서를 비교
+
+기록된 실제 ID와 스크립트가 만든 예전 형식 ID를 따로 보고한다.
+합성 ID는 파서 속도/정확도 비교용일 뿐이고, 실제 피드에서 네트워크 없이 풀리는 비율은
+기록된 ID 결과를 봐야 한다 (현재 피드의 AU_yqL 토큰은 오프라인으로 풀 수 없음).
+
+사용법:
+    python bench_gnews_id.py                 # 내장 코퍼스
+    python bench_gnews_id.py recorded.txt    # 한 줄에 URL(또는 기사 ID) 하나씩 기록한 파일
+"""
+
+import base64
+import re
+import sys
+import time
+
+from gnews_id import decode_article_id, extract_article_id
+
+# 테스트 스크립트들에 기록된 실제 ID (새 형식 AU_yqL 토큰)
+RECORDED_IDS = [
+    "CBMiT0FVX3lxTFBhNmY4UVlHaVNkbEdabDhDUnlfaU1BX3lBTGtXSk5taE1SendEdjRBM0VUVFpBUlV0WlZOWUx6d2dMMkFnd1V3VU1nSHdRV2s",
+    "CBMiVkFVX3lxTE9WUjlNZ0psX0hZMW5mVlQyZFhRblQ4TVFaRVdUMmdIMXNKbXUzZ284MmVuWDhRcVV6eFBHdWWhmMkhON1lEMFRwWnMxNDdMMU1Qb3BsdEZB",
+    "CBMiXkFVX3lxTFA0NWw4ZFpfeEtCS3pZLWl0R19neGE2b2ZaMWxQeGRlSHJNREJYNERWZXcyS0t4blNnODZOMzdOOHYzUWJVNUhqUmdUWmpLSnRPWTFpR2l5NHRpbEh2SEE",
+    "CBMiZEFVX3lxTE1ZQWRTR3JmZ2thcW1tczcyMU5PUEFvT1NZdWVyLTN3RFdoZXNBT0g2eWpGc0IzOUx2Q2dmemVUd0N2V2FzX0pQZTFPN3VseTFqSlNnbDY0ZTJSRXhNSWhjM2ZjUFY",
+]
+
+
+def _legacy_id(url: str, amp_url: str = "") -> str:
+    """예전 형식 ID 생성 (field 4에 URL, 선택적으로 field 26에 AMP URL)"""
+    body = url.encode()
+    data = b"\x08\x13\x22" + _varint(len(body)) + body
+    if amp_url:
+        amp = amp_url.encode()
+        data += b"\xd2\x01" + _varint(len(amp)) + amp
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def build_synthetic_corpus():
+    corpus = []
+    for i in range(200):
+        url = f"https://www.news{i % 7}.co.kr/article/view/2025{i:06d}?section=economy&page={i}"
+        amp = f"https://m.news{i % 7}.co.kr/amp/2025{i:06d}" if i % 3 == 0 else ""
+        corpus.append(_legacy_id(url, amp))
+    return corpus
+
+
+def legacy_regex_decode(article_id: str):
+    """main.py에 있던 기존 방식: base64를 텍스트로 풀고 http 패턴 검색"""
+    try:
+        decoded_text = base64.urlsafe_b64decode(article_id + "=" * (-len(article_id) % 4)).decode("utf-8", errors="ignore")
+    except Exception:
+        return None
+    for pattern in (r'https?://[^\s\'"<>(){}\[\]]+', r'https?://[^\s\'"<>\s]+'):
+        for match in re.findall(pattern, decoded_text):
+            real_url = re.sub(r'[<>,"\'\s]+$', '', match)
+            if len(real_url) > 20 and "google.com" not in real_url:
+                return real_url
+    return None
+
+
+def protobuf_decode(article_id: str):
+    decoded = decode_article_id(article_id)
+    if decoded is None:
+        return None
+    return decoded.url or decoded.amp_url
+
+
+def bench(name, func, corpus, rounds=200) -> int:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for article_id in corpus:
+            func(article_id)
+    elapsed = time.perf_counter() - started
+    per_id_us = elapsed / (rounds * len(corpus)) * 1e6
+    resolved = sum(1 for article_id in corpus if func(article_id))
+    print(f"  {name:<16} {per_id_us:8.2f} µs/id   오프라인 복원 {resolved}/{len(corpus)}")
+    return resolved
+
+
+def report(title, corpus, recorded):
+    parsed = [decode_article_id(article_id) for article_id in corpus]
+    opaque = sum(1 for decoded in parsed if decoded is not None and decoded.is_opaque)
+    invalid = sum(1 for decoded in parsed if decoded is None)
+    print(f"[{title}] {len(corpus)}개 (AU_yqL 토큰 {opaque}개, 해석 불가 {invalid}개)")
+
+    bench("regex scan", legacy_regex_decode, corpus)
+    resolved = bench("protobuf", protobuf_decode, corpus)
+    if recorded and resolved < len(corpus):
+        print(f"  -> 기록된 ID {len(corpus) - resolved}개는 오프라인으로 못 풂 (디코딩 서버/리다이렉트 네트워크 필요)")
+
+    # 정확도: 두 방식이 다른 결과를 내는 ID
+    mismatches = [
+        (article_id, legacy_regex_decode(article_id), protobuf_decode(article_id))
+        for article_id in corpus
+        if legacy_regex_decode(article_id) != protobuf_decode(article_id)
+    ]
+    print(f"  결과가 다른 ID: {len(mismatches)}개")
+    for article_id, legacy, decoded_url in mismatches[:3]:
+        print(f"    {article_id[:40]}...\n      regex:    {legacy}\n      protobuf: {decoded_url}")
+
+
+def main():
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], encoding="utf-8") as f:
+            lines = [line.strip() for line in f if line.strip()]
+        report(f"기록된 ID: {sys.argv[1]}", [extract_article_id(line) or line for line in lines], recorded=True)
+        return
+
+    report("기록된 실제 ID", list(RECORDED_IDS), recorded=True)
+    print()
+    # 예전 형식 ID는 스크립트가 만든 것 - 실제 피드의 오프라인 복원율로 읽으면 안 됨
+    report("합성 예전 형식 ID (파서 비교용)", build_synthetic_corpus(), recorded=False)
+
+
+if __name__ == "__main__":
+    main()
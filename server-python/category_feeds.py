@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+분류별 최신 글 피드 (목록 화면용) 미리 만들어 두기
+분류마다 최신 N개를 메모리에 두고, 새 글이 저장될 때 해당 분류만 갱신한다.
+기본 페이지 응답은 직렬화된 바이트로 보관해서 요청은 dict 조회 + 바이트 쓰기로 끝난다.
+피드는 만들 때의 데이터 버전(data_version, 워커 간 공유)을 기억하고, 다른 워커가 글을 저장해서
+버전이 앞서 나가면 page()가 None을 돌려준다 (호출한 쪽이 DB에서 다시 만든다).
+선택적으로 JSON 파일로 저장해 두었다가 DB가 그대로면 재시작 때 다시 읽는다.
+"""
+
+import json
+import os
+import tempfile
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from response_cache import CachedResponse, make_etag
+
+ALL_CATEGORIES = ""  # 분류 없이 전체 최신 글 피드 키
+
+# (분류, limit, 페이지 항목들, 다음 페이지 존재 여부) -> 응답 헤더 (X-Next-Cursor 등)
+HeadersBuilder = Callable[[str, int, List[Dict], bool], Dict[str, str]]
+
+
+def _sort_key(item: Dict):
+    return (item.get("created_at") or "", item["id"])
+
+
+class CategoryFeeds:
+    def __init__(self, size: int, default_limit: int, headers_for: HeadersBuilder):
+        self.size = size
+        self.default_limit = min(default_limit, size)
+        self._headers_for = headers_for
+        self._lock = threading.Lock()
+        # 분류 -> 최신순 항목 (size + 1개까지 보관해서 다음 페이지 여부를 알 수 있게)
+        self._items: Dict[str, List[Dict]] = {}
+        # 분류 -> {limit: 직렬화된 응답}
+        self._pages: Dict[str, Dict[int, CachedResponse]] = {}
+        self.version: Optional[int] = None  # 피드에 반영된 데이터 버전, rebuild() 전에는 None (DB 조회로 처리)
+
+    def _serialize_locked(self, category: str, limit: int) -> CachedResponse:
+        items = self._items.get(category, [])
+        page = items[:limit]
+        body = json.dumps(page, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        cached = CachedResponse(make_etag(body), body, self._headers_for(category, limit, page, len(items) > limit))
+        if category in self._items:
+            self._pages.setdefault(category, {})[limit] = cached
+        return cached
+
+    def rebuild(self, feeds: Dict[str, List[Dict]], version: int) -> None:
+        """분류별 최신 항목 전체 교체 (version: DB에서 항목을 읽기 전에 확인한 데이터 버전)"""
+        with self._lock:
+            self._items = {
+                category: sorted(items, key=_sort_key, reverse=True)[:self.size + 1]
+                for category, items in {ALL_CATEGORIES: [], **feeds}.items()
+            }
+            self._pages = {}
+            self.version = version
+            for category in self._items:
+                self._serialize_locked(category, self.default_limit)
+
+    def add(self, items: Iterable[Dict], version: int) -> None:
+        """
+        이 워커가 저장한 글 반영 - 해당 분류와 전체 피드만 다시 직렬화
+        그 사이 다른 워커가 올린 버전이 있으면 반영하지 않는다 (다음 요청에서 다시 만듦)
+        """
+        touched = set()
+        with self._lock:
+            if self.version is None or version != self.version + 1:
+                return
+            self.version = version
+            for item in items:
+                for category in (item["category"], ALL_CATEGORIES):
+                    feed = self._items.setdefault(category, [])
+                    feed.append(item)
+                    touched.add(category)
+            for category in touched:
+                self._items[category] = sorted(self._items[category], key=_sort_key, reverse=True)[:self.size + 1]
+                self._pages.pop(category, None)
+                self._serialize_locked(category, self.default_limit)
+
+    def page(self, category: Optional[str], limit: int, version: int) -> Optional[CachedResponse]:
+        """미리 만든 피드가 데이터 버전 version 이상이면 응답, 아니면 None (DB 조회)"""
+        if limit > self.size:
+            return None
+        key = category or ALL_CATEGORIES
+        with self._lock:
+            if self.version is None or self.version < version:
+                return None
+            # 글이 없는 분류는 빈 피드
+            cached = self._pages.get(key, {}).get(limit)
+            return cached or self._serialize_locked(key, limit)
+
+    def is_stale(self, version: int) -> bool:
+        return self.version is None or self.version < version
+
+    def save(self, path: str, marker: Tuple[int, int]) -> None:
+        """
+        JSON 파일로 저장 (marker: DB의 (최대 id, 글 수) - 다시 읽을 때 같은지 확인용)
+        여러 워커가 동시에 종료해도 섞이지 않게 프로세스마다 다른 임시 파일에 쓰고 교체
+        """
+        with self._lock:
+            data = json.dumps({"marker": list(marker), "size": self.size, "feeds": self._items}, ensure_ascii=False)
+        fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=os.path.dirname(path) or ".")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def load(self, path: str, marker: Tuple[int, int], version: int) -> bool:
+        """저장해 둔 피드가 현재 DB와 같으면 읽어서 사용"""
+        try:
+            with open(path, encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if state.get("marker") != list(marker) or state.get("size") != self.size:
+            return False
+        self.rebuild(state["feeds"], version)
+        return True
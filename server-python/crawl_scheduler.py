@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+도메인별 크롤링 예의(politeness) 스케줄러
+고정 sleep 대신 호스트마다 토큰 버킷(초당 요청 수 + 버스트)과 동시 요청 수 제한을 둔다.
+서로 다른 언론사 도메인은 병렬로 받고, 같은 호스트는 간격을 지킨다.
+- 429/503 응답: Retry-After를 지키고, 그 호스트의 요청 속도를 절반씩 낮춤 (최대 max_backoff배)
+- 정상 응답: 낮춘 속도를 조금씩 원래대로 되돌림
+스레드(동기 requests)와 asyncio 양쪽에서 쓸 수 있다: slot()/run(), aslot()/arun()
+"""
+
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterator, Optional, TypeVar
+from urllib.parse import urlsplit
+
+# 호스트가 과부하/요청 제한을 알리는 상태 코드
+THROTTLE_STATUSES = (429, 503)
+
+# 동시 요청 수 제한에 걸렸을 때 다시 확인하는 간격(초)
+_SLOT_POLL_SECONDS = 0.05
+
+R = TypeVar("R")
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """Retry-After 헤더 (초 또는 HTTP 날짜) -> 기다릴 초, 해석할 수 없으면 None"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at - (time.time() if now is None else now))
+
+
+class _HostState:
+    __slots__ = ("tokens", "refilled_at", "active", "blocked_until", "backoff")
+
+    def __init__(self, burst: float, now: float):
+        self.tokens = burst
+        self.refilled_at = now
+        self.active = 0
+        self.blocked_until = 0.0
+        self.backoff = 1.0  # 1이면 원래 속도, 2면 절반 속도
+
+
+class DomainScheduler:
+    def __init__(
+        self,
+        rate_per_host: float = 1.0,
+        burst: float = 2.0,
+        max_per_host: int = 2,
+        max_backoff: float = 16.0,
+        default_retry_after: float = 5.0,
+        max_retry_after: float = 60.0,
+        max_retries: int = 2,
+    ):
+        self.rate_per_host = rate_per_host  # 초당 요청 수 (토큰 충전 속도)
+        self.burst = burst  # 쉬고 있던 호스트에 바로 보낼 수 있는 요청 수
+        self.max_per_host = max_per_host  # 같은 호스트 동시 요청 수
+        self.max_backoff = max_backoff
+        self.default_retry_after = default_retry_after  # 429/503에 Retry-After가 없을 때
+        self.max_retry_after = max_retry_after  # 이보다 긴 Retry-After는 이 값까지만 대기
+        self.max_retries = max_retries  # 429/503 재시도 횟수 (run/arun)
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, _HostState] = {}
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        return (urlsplit(url).hostname or "").lower()
+
+    def _state(self, host: str, now: float) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostState(self.burst, now)
+        return state
+
+    def _try_acquire(self, host: str) -> float:
+        """요청을 보내도 되면 자리를 잡고 0, 아니면 다시 시도할 때까지 기다릴 초"""
+        now = time.monotonic()
+        with self._lock:
+            state = self._state(host, now)
+            rate = self.rate_per_host / state.backoff
+            state.tokens = min(self.burst, state.tokens + (now - state.refilled_at) * rate)
+            state.refilled_at = now
+            if now < state.blocked_until:
+                return state.blocked_until - now
+            if state.active >= self.max_per_host:
+                return _SLOT_POLL_SECONDS
+            if state.tokens < 1.0:
+                return (1.0 - state.tokens) / rate
+            state.tokens -= 1.0
+            state.active += 1
+            return 0.0
+
+    def _release(self, host: str) -> None:
+        with self._lock:
+            self._hosts[host].active -= 1
+
+    @contextmanager
+    def slot(self, url: str) -> Iterator[None]:
+        """with scheduler.slot(url): 요청 - 차례가 올 때까지 현재 스레드에서 대기"""
+        host = self.host_of(url)
+        while True:
+            wait = self._try_acquire(host)
+            if wait <= 0:
+                break
+            time.sleep(wait)
+        try:
+            yield
+        finally:
+            self._release(host)
+
+    @asynccontextmanager
+    async def aslot(self, url: str) -> AsyncIterator[None]:
+        """async with scheduler.aslot(url): 요청 - 이벤트 루프를 막지 않고 대기"""
+        host = self.host_of(url)
+        while True:
+            wait = self._try_acquire(host)
+            if wait <= 0:
+                break
+            await asyncio.sleep(wait)
+        try:
+            yield
+        finally:
+            self._release(host)
+
+    def report(self, url: str, status: int, retry_after: Optional[str] = None) -> None:
+        """
+        응답 상태 반영
+        429/503이면 Retry-After(없으면 현재 백오프 기준 시간)까지 그 호스트를 막고 속도를 절반으로,
+        그 외 응답이면 백오프를 조금씩 줄임
+        """
+        now = time.monotonic()
+        with self._lock:
+            state = self._state(self.host_of(url), now)
+            if status in THROTTLE_STATUSES:
+                state.backoff = min(self.max_backoff, state.backoff * 2)
+                delay = parse_retry_after(retry_after)
+                if delay is None:
+                    delay = self.default_retry_after * state.backoff / 2
+                delay = min(delay, self.max_retry_after)
+                state.blocked_until = max(state.blocked_until, now + delay)
+                state.tokens = 0.0
+            elif state.backoff > 1.0:
+                state.backoff = max(1.0, state.backoff * 0.75)
+
+    def run(self, url: str, send: Callable[[], R]) -> R:
+        """
+        send()로 요청 (응답에 status_code, headers 필요)
+        429/503이면 report 후 max_retries번까지 다시 차례를 기다려 재시도, 마지막 응답 반환
+        """
+        for attempt in range(self.max_retries + 1):
+            with self.slot(url):
+                response = send()
+            self.report(url, response.status_code, response.headers.get("Retry-After"))
+            if response.status_code not in THROTTLE_STATUSES or attempt == self.max_retries:
+                return response
+        return response
+
+    async def arun(self, url: str, send: Callable[[], Awaitable[R]]) -> R:
+        """run의 비동기 버전"""
+        for attempt in range(self.max_retries + 1):
+            async with self.aslot(url):
+                response = await send()
+            self.report(url, response.status_code, response.headers.get("Retry-After"))
+            if response.status_code not in THROTTLE_STATUSES or attempt == self.max_retries:
+                return response
+        return response
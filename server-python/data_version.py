@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+여러 uvicorn 워커가 공유하는 데이터 버전 (app_meta.data_version)
+글을 저장하는 트랜잭션 안에서 bump()로 올리고, 각 워커는 poll_seconds마다 한 번 읽어서
+자기 메모리 캐시(목록 응답, 분류별 피드)가 최신인지 확인한다.
+다른 워커가 저장한 글은 최대 poll_seconds 늦게 보인다.
+"""
+
+import time
+from typing import Optional
+
+from sqlalchemy import Integer, String, cast, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import AppMeta
+
+DATA_VERSION_KEY = "data_version"
+
+
+def bump_statement():
+    """UPDATE app_meta SET value = value + 1 (행 잠금이라 동시에 올려도 빠지지 않음)"""
+    return (
+        update(AppMeta)
+        .where(AppMeta.key == DATA_VERSION_KEY)
+        .values(value=cast(cast(AppMeta.value, Integer) + 1, String))
+    )
+
+
+def select_statement():
+    return select(AppMeta.value).where(AppMeta.key == DATA_VERSION_KEY)
+
+
+class DataVersion:
+    def __init__(self, poll_seconds: float = 1.0):
+        self.poll_seconds = poll_seconds
+        self.value: Optional[int] = None  # 마지막으로 확인한 버전
+        self._checked_at = 0.0
+
+    async def bump(self, db: AsyncSession) -> int:
+        """글 저장과 같은 트랜잭션에서 버전을 올리고 새 값 반환 (커밋은 호출한 쪽에서)"""
+        await db.execute(bump_statement())
+        return int(await db.scalar(select_statement()))
+
+    async def current(self, db: AsyncSession) -> int:
+        """현재 버전 - poll_seconds 안에 확인했으면 DB를 읽지 않는다"""
+        now = time.monotonic()
+        if self.value is None or now - self._checked_at >= self.poll_seconds:
+            value = await db.scalar(select_statement())
+            self.observe(int(value or 0))
+            self._checked_at = now
+        return self.value
+
+    def observe(self, version: int) -> None:
+        """이 워커가 커밋한 버전 반영 (더 최신일 때만)"""
+        if self.value is None or version > self.value:
+            self.value = version
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+수집 기사 중복 판별용 키
+정규화한 기사 URL + 정규화한 제목 해시를 합쳐서 고정 길이 키를 만든다.
+posts.dedup_key(유니크 인덱스)에 저장하고 배치 단위로 한 번에 조회한다.
+"""
+
+import hashlib
+import re
+import unicodedata
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# 같은 기사인데 유입 경로만 다른 쿼리 파라미터
+_TRACKING_PARAMS = {"oc", "fbclid", "gclid", "ref", "from", "cmpid", "rss"}
+# Google News 제목 끝의 " - 언론사명"
+_PUBLISHER_SUFFIX_RE = re.compile(r'\s+[-|]\s+[^-|]{1,40}$')
+
+
+def canonical_url(url: str) -> str:
+    """스킴/호스트 소문자, www. 제거, 추적용 쿼리와 fragment 제거, 끝 슬래시 제거"""
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in _TRACKING_PARAMS and not key.lower().startswith("utm_")
+    ]
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), host, path, urlencode(sorted(query)), ""))
+
+
+def normalize_title(title: str) -> str:
+    """유니코드 정규화(NFKC), 소문자, 공백 정리, 언론사 접미사 제거"""
+    title = unicodedata.normalize("NFKC", title or "").strip()
+    title = _PUBLISHER_SUFFIX_RE.sub("", title)
+    return " ".join(title.lower().split())
+
+
+def make_dedup_key(url: Optional[str], title: str) -> str:
+    """sha256(정규화 URL + 제목 해시) 16진수 64자"""
+    title_hash = hashlib.sha256(normalize_title(title).encode("utf-8")).hexdigest()
+    return hashlib.sha256(f"{canonical_url(url or '')}\n{title_hash}".encode("utf-8")).hexdigest()
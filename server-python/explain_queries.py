@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+목록 API의 주요 ORM 쿼리 실행 계획 확인 (인덱스를 타는지)
+
+사용법:
+    alembic upgrade head
+    python explain_queries.py            # DATABASE_URL (.env) 또는 ./news.db
+"""
+
+import os
+from datetime import datetime
+
+from dotenv import load_dotenv
+from sqlalchemy import and_, create_engine, or_, text
+from sqlalchemy.orm import Session
+
+from models import Post
+
+LIST_COLUMNS = (Post.id, Post.title, Post.summary, Post.category, Post.image_url, Post.created_at)
+ORDER = (Post.created_at.desc(), Post.id.desc())
+
+
+def hot_queries(session: Session):
+    cursor_at, cursor_id = datetime(2030, 1, 1), 1_000_000
+    after_cursor = or_(Post.created_at < cursor_at, and_(Post.created_at == cursor_at, Post.id < cursor_id))
+    return {
+        "최신 목록 첫 페이지": session.query(*LIST_COLUMNS).order_by(*ORDER).limit(51),
+        "최신 목록 다음 페이지": session.query(*LIST_COLUMNS).filter(after_cursor).order_by(*ORDER).limit(51),
+        "분류 첫 페이지": session.query(*LIST_COLUMNS).filter(Post.category == "Technology").order_by(*ORDER).limit(51),
+        "분류 다음 페이지": session.query(*LIST_COLUMNS)
+            .filter(Post.category == "Technology", after_cursor).order_by(*ORDER).limit(51),
+        "중복 키 조회": session.query(Post.dedup_key).filter(Post.dedup_key.in_(["a" * 64, "b" * 64])),
+        "상세 조회": session.query(Post).filter(Post.id == 1),
+    }
+
+
+def main():
+    load_dotenv()
+    engine = create_engine(os.getenv("DATABASE_URL") or "sqlite:///./news.db")
+    explain = "EXPLAIN QUERY PLAN" if engine.dialect.name == "sqlite" else "EXPLAIN"
+    with Session(engine) as session:
+        for name, query in hot_queries(session).items():
+            compiled = query.statement.compile(engine, compile_kwargs={"literal_binds": True})
+            print(f"== {name}")
+            for row in session.execute(text(f"{explain} {compiled}")):
+                print("   ", row[-1])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+뉴스 본문 추출기 모음 (다운로드한 HTML만 받아서 처리, 네트워크 없음)
+기사 페이지는 한 번만 받고, 같은 바이트에 추출기들을 순서대로 적용한다.
+"""
+
+import codecs
+import logging
+import os
+import re
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import lxml.html
+import trafilatura
+from bs4 import BeautifulSoup
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+# 본문 최대 길이
+MAX_CONTENT_LENGTH = 2000
+
+# 한국 뉴스 사이트용 본문 선택자들
+CONTENT_SELECTORS = [
+    'article',
+    '[id*="article"]',
+    '[class*="article"]',
+    '[id*="content"]',
+    '[class*="content"]',
+    '#articleBody',
+    '#newsct_article',
+    '.article_body',
+    '.news_body',
+    'div[itemprop="articleBody"]',
+    '.article-content',
+    'main'
+]
+
+
+# lxml 추출기: 본문 컨테이너로 보이는 id/class (CONTENT_SELECTORS와 같은 힌트)
+_CONTAINER_HINT_RE = re.compile(r'article|content|newsct|news_body', re.IGNORECASE)
+_REMOVED_TAGS = ('script', 'style', 'nav', 'footer', 'header', 'aside')
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([A-Za-z0-9_\-]+)', re.IGNORECASE)
+
+
+class ExtractionResult(NamedTuple):
+    text: Optional[str]
+    extractor: Optional[str]  # 본문 추출에 성공한 추출기 이름 (모두 실패하면 None)
+    timings: Dict[str, float]  # 추출기별 소요 시간(초) - 실행된 것만
+
+
+def clean_korean_news_text(content_text: str) -> str:
+    """한국 뉴스 사이트 흔한 아티팩트 제거"""
+    content_text = re.sub(r'▶.*?\n', '', content_text)
+    content_text = re.sub(r'\[.*?\]', '', content_text)
+    content_text = re.sub(r'사진.*?\n', '', content_text)
+    content_text = re.sub(r'\s+', ' ', content_text)
+    return content_text.strip()
+
+
+def extract_with_beautifulsoup(html) -> Optional[str]:
+    """BeautifulSoup + 한국 뉴스 사이트 선택자로 본문 추출"""
+    soup = BeautifulSoup(html, 'html.parser')
+
+    # 불필요한 요소 제거
+    for element in soup.find_all(['script', 'style', 'nav', 'footer', 'header', 'aside']):
+        element.decompose()
+
+    content_text = ""
+    for selector in CONTENT_SELECTORS:
+        elements = soup.select(selector)
+        if elements:
+            texts = []
+            for elem in elements:
+                paragraphs = elem.find_all(['p', 'div'])
+                for p in paragraphs:
+                    text = p.get_text(strip=True)
+                    if len(text) > 30:  # 의미있는 길이의 텍스트만
+                        texts.append(text)
+
+            if texts:
+                content_text = '\n\n'.join(texts)
+                break
+
+    # 추가 정리
+    if content_text:
+        content_text = clean_korean_news_text(content_text)
+
+    if len(content_text) > 100:
+        logger.debug("✅ BeautifulSoup 추출 성공: %d자", len(content_text))
+        return content_text[:MAX_CONTENT_LENGTH]
+    else:
+        logger.debug("❌ BeautifulSoup 추출 실패: 텍스트가 너무 짧음")
+        return None
+
+
+def extract_with_trafilatura(html) -> Optional[str]:
+    """Trafilatura로 다운로드된 HTML에서 본문 추출"""
+    # 본문 텍스트 추출 (정밀 모드, 댓글 제외)
+    text = trafilatura.extract(
+        html,
+        output_format='txt',
+        include_comments=False,
+        favor_precision=True
+    )
+
+    if text and len(text.strip()) > 100:
+        # 성공: 텍스트 정리
+        cleaned_text = ' '.join(text.split())  # 연속 공백 제거
+        logger.debug("Trafilatura 추출 성공: %d자", len(cleaned_text))
+        return cleaned_text[:MAX_CONTENT_LENGTH]  # 길이 제한
+    else:
+        logger.debug("Trafilatura 추출 실패")
+        return None
+
+
+def _container_bonus(element) -> float:
+    """본문 컨테이너일 가능성이 높은 요소에 가중치"""
+    if element.tag in ('article', 'main') or element.get('itemprop') == 'articleBody':
+        return 1.5
+    hint = f"{element.get('id', '')} {element.get('class', '')}"
+    return 1.5 if _CONTAINER_HINT_RE.search(hint) else 1.0
+
+
+def _lxml_parser_for(html: bytes) -> lxml.html.HTMLParser:
+    """meta charset -> UTF-8 -> CP949(EUC-KR) 순서로 인코딩을 정해서 파서 생성"""
+    match = _META_CHARSET_RE.search(html[:4096])
+    encoding = match.group(1).decode('ascii').lower() if match else None
+    if encoding in ('euc-kr', 'ks_c_5601-1987'):
+        encoding = 'cp949'
+    if encoding:
+        try:
+            codecs.lookup(encoding)
+        except LookupError:
+            encoding = None
+    if encoding is None:
+        try:
+            html.decode('utf-8')
+            encoding = 'utf-8'
+        except UnicodeDecodeError:
+            encoding = 'cp949'
+    return lxml.html.HTMLParser(encoding=encoding)
+
+
+def extract_with_lxml(html) -> Optional[str]:
+    """
+    lxml 기반 빠른 본문 추출
+    트리를 한 번 만들고 한 번 순회하면서 가장 안쪽 p/div 블록(리프)의 텍스트 길이로
+    부모/조부모 컨테이너 점수를 매긴 뒤, 최고 점수 컨테이너의 리프 텍스트만 모은다.
+    리프만 쓰기 때문에 중첩 컨테이너에서 같은 문단이 여러 번 나오지 않는다.
+    """
+    if isinstance(html, str):
+        html = html.encode('utf-8')
+    try:
+        root = lxml.html.fromstring(html, parser=_lxml_parser_for(html))
+    except (etree.ParserError, ValueError):
+        return None
+
+    etree.strip_elements(root, *_REMOVED_TAGS, with_tail=False)
+
+    # 1. p/div를 문서 순서대로 한 번 순회하면서 블록 자식을 가진 요소 표시
+    blocks = list(root.iter('p', 'div'))
+    has_block_child = set()
+    for element in blocks:
+        parent = element.getparent()
+        while parent is not None and parent not in has_block_child:
+            has_block_child.add(parent)
+            parent = parent.getparent()
+
+    # 2. 리프 블록 텍스트로 컨테이너 점수 계산
+    leaf_texts = {}
+    scores: Dict[object, float] = {}
+    for element in blocks:
+        if element in has_block_child:
+            continue
+        text = ' '.join(element.text_content().split())
+        if len(text) <= 30:  # 의미있는 길이의 텍스트만
+            continue
+        leaf_texts[element] = text
+        parent = element.getparent()
+        if parent is not None:
+            scores[parent] = scores.get(parent, 0.0) + len(text)
+            grandparent = parent.getparent()
+            if grandparent is not None:
+                scores[grandparent] = scores.get(grandparent, 0.0) + len(text) / 2
+
+    if not scores:
+        logger.debug("❌ lxml 추출 실패: 본문 블록 없음")
+        return None
+
+    best = max(scores, key=lambda element: scores[element] * _container_bonus(element))
+
+    # 3. 최고 점수 컨테이너 안의 리프 텍스트를 문서 순서대로
+    texts = [leaf_texts[element] for element in best.iter('p', 'div') if element in leaf_texts]
+    content_text = clean_korean_news_text('\n\n'.join(texts))
+
+    if len(content_text) > 100:
+        logger.debug("✅ lxml 추출 성공: %d자", len(content_text))
+        return content_text[:MAX_CONTENT_LENGTH]
+    logger.debug("❌ lxml 추출 실패: 텍스트가 너무 짧음")
+    return None
+
+
+AVAILABLE_EXTRACTORS: Dict[str, Callable[[bytes], Optional[str]]] = {
+    "beautifulsoup": extract_with_beautifulsoup,
+    "lxml": extract_with_lxml,
+    "trafilatura": extract_with_trafilatura,
+}
+
+
+# 기본: BeautifulSoup 우선 - 더 안정적
+DEFAULT_EXTRACTORS = ("beautifulsoup", "trafilatura")
+
+
+def _configured_extractors() -> List[Tuple[str, Callable[[bytes], Optional[str]]]]:
+    """
+    EXTRACTORS 환경 변수(쉼표 구분)로 적용 순서 선택, 예: EXTRACTORS=lxml,trafilatura
+    빈 항목("lxml," 등)은 무시하고, 비어 있으면 기본 순서
+    """
+    names = [name.strip() for name in os.getenv("EXTRACTORS", "").split(",") if name.strip()] or list(DEFAULT_EXTRACTORS)
+    unknown = [name for name in names if name not in AVAILABLE_EXTRACTORS]
+    if unknown:
+        raise ValueError(f"Unknown extractor(s) in EXTRACTORS: {unknown}")
+    return [(name, AVAILABLE_EXTRACTORS[name]) for name in names]
+
+
+# 적용 순서대로
+EXTRACTORS: List[Tuple[str, Callable[[bytes], Optional[str]]]] = _configured_extractors()
+
+
+def run_extractors(html: bytes) -> ExtractionResult:
+    """같은 HTML 바이트에 추출기를 순서대로 적용, 처음 성공한 결과 반환"""
+    timings: Dict[str, float] = {}
+    for name, extractor in EXTRACTORS:
+        started = time.perf_counter()
+        try:
+            text = extractor(html)
+        except Exception as e:
+            logger.warning("💥 %s 추출 오류: %s", name, e)
+            text = None
+        timings[name] = time.perf_counter() - started
+        if text:
+            return ExtractionResult(text, name, timings)
+    return ExtractionResult(None, None, timings)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+RSS 피드 변경 감지용 상태 저장소
+- 피드별 ETag / Last-Modified / 본문 해시 -> 조건부 요청과 변경 없는 피드 건너뛰기
+- 이미 수집한 기사 guid -> 디코딩/본문 추출 전에 걸러내기
+"""
+
+import sqlite3
+import threading
+import time
+from typing import Iterable, NamedTuple, Optional, Set
+
+
+class FeedValidators(NamedTuple):
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body_hash: Optional[str]
+
+
+class FeedStateStore:
+    def __init__(self, path: str = "feed_state.db", seen_ttl_seconds: float = 30 * 24 * 3600):
+        self.path = path
+        self.seen_ttl_seconds = seen_ttl_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS feeds (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                body_hash TEXT,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS seen_entries (
+                guid TEXT PRIMARY KEY,
+                seen_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ix_seen_entries_seen_at ON seen_entries (seen_at)")
+
+    def get_validators(self, url: str) -> FeedValidators:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, body_hash FROM feeds WHERE url = ?", (url,)
+            ).fetchone()
+        return FeedValidators(*row) if row else FeedValidators(None, None, None)
+
+    def save_validators(self, url: str, validators: FeedValidators) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO feeds (url, etag, last_modified, body_hash, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (url, validators.etag, validators.last_modified, validators.body_hash, time.time()),
+            )
+
+    def filter_unseen(self, guids: Iterable[str]) -> Set[str]:
+        """아직 수집하지 않은 guid만 반환"""
+        guids = list(dict.fromkeys(g for g in guids if g))
+        if not guids:
+            return set()
+        seen: Set[str] = set()
+        with self._lock:
+            # SQLite 바인딩 변수 개수 제한을 넘지 않도록 나눠서 조회
+            for start in range(0, len(guids), 500):
+                chunk = guids[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT guid FROM seen_entries WHERE guid IN ({placeholders})", chunk
+                ).fetchall()
+                seen.update(row[0] for row in rows)
+        return set(guids) - seen
+
+    def mark_seen(self, guids: Iterable[str]) -> None:
+        now = time.time()
+        rows = [(guid, now) for guid in guids if guid]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.execute("BEGIN")
+            self._conn.executemany("INSERT OR REPLACE INTO seen_entries (guid, seen_at) VALUES (?, ?)", rows)
+            # 오래된 guid 정리 (피드에서 이미 사라졌을 기간)
+            self._conn.execute("DELETE FROM seen_entries WHERE seen_at < ?", (now - self.seen_ttl_seconds,))
+            self._conn.execute("COMMIT")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
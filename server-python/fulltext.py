@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+posts 전문 검색 (/api/posts?search=)
+- SQLite: FTS5 trigram 가상 테이블 posts_fts + 트리거로 posts와 동기화, bm25 순위와 snippet()
+- PostgreSQL: pg_trgm GIN 인덱스로 ILIKE를 인덱스 검색으로, word_similarity로 순위
+한국어는 복합어 안에 공백이 없어서 단어 단위 토크나이저(tsvector 'simple' 등)보다
+글자 trigram이 부분 일치를 잘 찾는다.
+"""
+
+import logging
+import re
+from typing import List, NamedTuple, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+SNIPPET_CHARS = 80  # snippet 대략 길이 (글자)
+MARK_OPEN, MARK_CLOSE = "<mark>", "</mark>"
+
+# trigram 인덱스는 3글자 이상 검색어에만 쓸 수 있음
+MIN_INDEXED_TERM_LENGTH = 3
+
+# detect_backend()가 정하는 검색 방식: "fts5", "pg_trgm" 또는 None(ILIKE)
+_backend: Optional[str] = None
+
+
+class SearchHit(NamedTuple):
+    post_id: int
+    score: float  # 클수록 관련도 높음
+    snippet: str
+
+
+def detect_backend(engine: Engine) -> Optional[str]:
+    """마이그레이션으로 만들어진 검색 인덱스 확인, 사용할 방식 반환 (없으면 ILIKE)"""
+    global _backend
+    dialect = engine.dialect.name
+    with engine.connect() as conn:
+        if dialect == "sqlite":
+            found = conn.execute(text("SELECT 1 FROM sqlite_master WHERE name = 'posts_fts'")).first()
+            _backend = "fts5" if found else None
+        elif dialect == "postgresql":
+            found = conn.execute(
+                text("SELECT 1 FROM pg_indexes WHERE indexname = 'ix_posts_content_trgm'")
+            ).first()
+            _backend = "pg_trgm" if found else None
+        else:
+            _backend = None
+    if _backend is None:
+        logger.warning("⚠️ Full-text index not found, search will use ILIKE")
+    return _backend
+
+
+def search_terms(query: str) -> List[str]:
+    return [term for term in query.split() if term]
+
+
+def is_indexable(query: str) -> bool:
+    """인덱스로 처리 가능한 검색어인지 (모든 단어가 3글자 이상)"""
+    terms = search_terms(query)
+    return bool(terms) and _backend is not None and all(len(term) >= MIN_INDEXED_TERM_LENGTH for term in terms)
+
+
+def _fts5_query(terms: List[str]) -> str:
+    """각 단어를 구문(phrase)으로 감싸서 AND 검색 - 따옴표 등 특수문자 이스케이프"""
+    return " ".join('"' + term.replace('"', '""') + '"' for term in terms)
+
+
+def make_snippet(body: str, terms: List[str], width: int = SNIPPET_CHARS) -> str:
+    """첫 일치 위치 주변을 잘라서 검색어를 <mark>로 감싼 snippet"""
+    body = " ".join((body or "").split())
+    if not body or not terms:
+        return body[:width]
+    pattern = re.compile("|".join(re.escape(term) for term in terms), re.IGNORECASE)
+    match = pattern.search(body)
+    start = max(0, match.start() - width // 3) if match else 0
+    window = body[start:start + width]
+    highlighted = pattern.sub(lambda m: f"{MARK_OPEN}{m.group(0)}{MARK_CLOSE}", window)
+    return ("…" if start > 0 else "") + highlighted + ("…" if start + width < len(body) else "")
+
+
+async def search(db: AsyncSession, query: str, limit: int, category: Optional[str] = None) -> List[SearchHit]:
+    """
+    관련도 순 검색 결과 (is_indexable(query)가 참일 때만 호출)
+    제목 > 요약 > 본문 순으로 가중치
+    """
+    terms = search_terms(query)
+    params = {"limit": limit, "category": category}
+    category_filter = "AND p.category = :category" if category else ""
+
+    if _backend == "fts5":
+        result = await db.execute(
+            text(
+                f"""
+                SELECT p.id, -bm25(posts_fts, 10.0, 4.0, 1.0) AS score,
+                       snippet(posts_fts, -1, '{MARK_OPEN}', '{MARK_CLOSE}', '…', 24) AS snippet
+                FROM posts_fts JOIN posts p ON p.id = posts_fts.rowid
+                WHERE posts_fts MATCH :match {category_filter}
+                ORDER BY bm25(posts_fts, 10.0, 4.0, 1.0), p.id DESC
+                LIMIT :limit
+                """
+            ),
+            {**params, "match": _fts5_query(terms)},
+        )
+        return [SearchHit(row.id, row.score, row.snippet) for row in result]
+
+    # pg_trgm: 단어마다 ILIKE (GIN 인덱스 사용), word_similarity로 순위
+    conditions = []
+    for i, term in enumerate(terms):
+        params[f"term{i}"] = f"%{term}%"
+        conditions.append(
+            f"(p.title ILIKE :term{i} OR p.summary ILIKE :term{i} OR p.content ILIKE :term{i})"
+        )
+    params["query"] = query
+    result = await db.execute(
+        text(
+            f"""
+            SELECT p.id, p.content,
+                   word_similarity(:query, p.title) * 10
+                   + word_similarity(:query, p.summary) * 4
+                   + word_similarity(:query, p.content) AS score
+            FROM posts p
+            WHERE {" AND ".join(conditions)} {category_filter}
+            ORDER BY score DESC, p.id DESC
+            LIMIT :limit
+            """
+        ),
+        params,
+    )
+    return [SearchHit(row.id, float(row.score), make_snippet(row.content, terms)) for row in result]
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Google News 기사 ID(CBMi..., CAIi...) 오프라인 디코더
+기사 ID는 base64url로 인코딩된 protobuf 메시지이다.
+
+    08 13             field 1 (varint)   - 타입 값
+    22 <len> <bytes>  field 4 (string)   - 원본 기사 URL 또는 AU_yqL... 토큰
+    d2 01 <len> ...   field 26 (string)  - AMP URL (있을 때만)
+
+예전 형식은 field 4에 URL이 그대로 들어 있어서 네트워크 없이 복원할 수 있다.
+새 형식(AU_yqL...)은 서버에서만 풀 수 있는 토큰이므로 opaque로 표시하고
+호출측이 디코딩 API/리다이렉트로 넘어가도록 한다.
+"""
+
+import base64
+import re
+from typing import List, NamedTuple, Optional, Tuple, Union
+
+_ARTICLE_ID_RE = re.compile(r'/(?:rss/)?articles/([A-Za-z0-9_\-]+)')
+
+# protobuf wire type
+WIRE_VARINT = 0
+WIRE_FIXED64 = 1
+WIRE_LEN = 2
+WIRE_FIXED32 = 5
+
+FIELD_URL = 4
+FIELD_AMP_URL = 26
+
+OPAQUE_TOKEN_PREFIX = "AU_yq"
+
+
+class ArticleId(NamedTuple):
+    url: Optional[str]      # 원본 기사 URL (복원 가능할 때)
+    amp_url: Optional[str]  # AMP URL (있을 때)
+    token: Optional[str]    # 새 형식 불투명 토큰 (네트워크 디코딩 필요)
+
+    @property
+    def is_opaque(self) -> bool:
+        return self.url is None and self.token is not None
+
+
+class ProtobufError(ValueError):
+    pass
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        if pos >= len(data):
+            raise ProtobufError("truncated varint")
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+        if shift > 63:
+            raise ProtobufError("varint too long")
+
+
+def parse_protobuf(data: bytes) -> List[Tuple[int, int, Union[int, bytes]]]:
+    """스키마 없이 protobuf 메시지를 (field 번호, wire type, 값) 목록으로 파싱"""
+    fields = []
+    pos = 0
+    while pos < len(data):
+        key, pos = _read_varint(data, pos)
+        field, wire = key >> 3, key & 0x07
+        if wire == WIRE_VARINT:
+            value, pos = _read_varint(data, pos)
+        elif wire == WIRE_LEN:
+            length, pos = _read_varint(data, pos)
+            if pos + length > len(data):
+                raise ProtobufError("truncated length-delimited field")
+            value = data[pos:pos + length]
+            pos += length
+        elif wire == WIRE_FIXED64:
+            value = int.from_bytes(data[pos:pos + 8], "little")
+            pos += 8
+        elif wire == WIRE_FIXED32:
+            value = int.from_bytes(data[pos:pos + 4], "little")
+            pos += 4
+        else:
+            raise ProtobufError(f"unsupported wire type {wire}")
+        if field == 0 or pos > len(data):
+            raise ProtobufError("invalid field")
+        fields.append((field, wire, value))
+    return fields
+
+
+def extract_article_id(url: str) -> Optional[str]:
+    """Google News URL에서 기사 ID 부분만 추출"""
+    match = _ARTICLE_ID_RE.search(url)
+    return match.group(1) if match else None
+
+
+def _b64decode(article_id: str) -> bytes:
+    return base64.urlsafe_b64decode(article_id + "=" * (-len(article_id) % 4))
+
+
+def _as_text(value: bytes) -> Optional[str]:
+    try:
+        return value.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+
+
+def decode_article_id(article_id: str) -> Optional[ArticleId]:
+    """기사 ID를 해석 - 형식이 맞지 않으면 None"""
+    try:
+        fields = parse_protobuf(_b64decode(article_id))
+    except (ValueError, ProtobufError):
+        return None
+
+    url = amp_url = token = None
+    for field, wire, value in fields:
+        if wire != WIRE_LEN:
+            continue
+        text = _as_text(value)
+        if not text:
+            continue
+        if field == FIELD_URL:
+            if text.startswith(("http://", "https://")):
+                url = text
+            elif text.startswith(OPAQUE_TOKEN_PREFIX):
+                token = text
+        elif field == FIELD_AMP_URL and text.startswith(("http://", "https://")):
+            amp_url = text
+
+    if url is None and amp_url is None and token is None:
+        return None
+    return ArticleId(url=url, amp_url=amp_url, token=token)
+
+
+def decode_google_news_url_offline(url: str) -> Optional[str]:
+    """네트워크 없이 Google News URL에서 원본 기사 URL 복원 (불가능하면 None)"""
+    article_id = extract_article_id(url)
+    if not article_id:
+        return None
+    decoded = decode_article_id(article_id)
+    if decoded is None:
+        return None
+    return decoded.url or decoded.amp_url
@@ -7,9 +7,17 @@ googlenewsdecoder 라이브러리를 사용하여 Google News RSS URL을 실제
 """
 
 from fastapi import FastAPI, Request, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+import asyncio
+import json
+import os
 import ssl
+import threading
+import time
 import logging
 
 # SSL 인증서 검증 우회 (googlenewsdecoder가 SSL 검증을 하기 때문)
@@ -21,11 +29,81 @@ logger = logging.getLogger(__name__)
 
 class DecodeRequest(BaseModel):
     source_url: str
-    interval_time: int = 5
+    interval_time: int = 5  # 사용하지 않음 (예전 클라이언트 호환용, 업스트림 간격은 rate limiter가 관리)
 
 class BatchDecodeRequest(BaseModel):
     urls: list[str]
-    interval_time: int = 5
+    interval_time: int = 5  # 배치에서는 사용하지 않음 (업스트림 간격은 rate limiter가 관리)
+    stream: bool = True  # True: 완료되는 순서대로 NDJSON 스트리밍, False: 전체 결과를 JSON으로
+
+
+# 배치 디코딩 설정
+DECODER_WORKERS = int(os.getenv("DECODER_WORKERS", "8"))  # 동시에 실행할 디코딩 수
+UPSTREAM_RATE_LIMIT = float(os.getenv("DECODER_UPSTREAM_RATE", "2"))  # 업스트림 호스트당 초당 요청 수 (0이면 제한 없음)
+
+decode_executor = ThreadPoolExecutor(max_workers=DECODER_WORKERS, thread_name_prefix="decoder")
+
+
+class UpstreamRateLimiter:
+    """
+    업스트림 호스트별 요청 간격 보장
+    워커 스레드가 호출 전에 wait()로 자기 차례(slot)를 예약하고 그때까지 대기
+    """
+
+    def __init__(self, rate_per_second: float):
+        self.interval = 1.0 / rate_per_second if rate_per_second > 0 else 0.0
+        self._next_slot: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, host: str) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+upstream_limiter = UpstreamRateLimiter(UPSTREAM_RATE_LIMIT)
+
+
+def _load_decoder():
+    """googlenewsdecoder 임포트 (런타임에)"""
+    try:
+        from googlenewsdecoder import new_decoderv1
+    except ImportError as e:
+        logger.error(f"googlenewsdecoder not installed: {e}")
+        raise HTTPException(status_code=500, detail="googlenewsdecoder library not installed")
+    return new_decoderv1
+
+
+def _decode_one(new_decoderv1, url: str) -> dict:
+    """워커 스레드에서 URL 하나 디코딩 (업스트림 rate limit 적용)"""
+    try:
+        upstream_limiter.wait(urlparse(url).netloc)
+        decoded_result = new_decoderv1(url, interval=None)
+        if decoded_result.get("status"):
+            return {
+                "original_url": url,
+                "decoded_url": decoded_result["decoded_url"],
+                "success": True
+            }
+        return {
+            "original_url": url,
+            "decoded_url": url,  # 실패시 원본 사용
+            "success": False,
+            "error": decoded_result.get("message", "Decoding failed")
+        }
+    except Exception as e:
+        return {
+            "original_url": url,
+            "decoded_url": url,
+            "success": False,
+            "error": str(e)
+        }
 
 app = FastAPI(
     title="Google News URL Decoder API",
@@ -58,17 +136,17 @@ async def health_check():
 async def decode_url(request: DecodeRequest):
     """단일 URL 디코딩"""
     try:
-        logger.info(f"Decoding URL: {request.source_url}, Interval: {request.interval_time}")
+        logger.info(f"Decoding URL: {request.source_url}")
 
-        # googlenewsdecoder 임포트 (런타임에)
-        try:
-            from googlenewsdecoder import new_decoderv1
-        except ImportError as e:
-            logger.error(f"googlenewsdecoder not installed: {e}")
-            raise HTTPException(status_code=500, detail="googlenewsdecoder library not installed")
+        new_decoderv1 = _load_decoder()
+
+        def decode():
+            # 요청 간격은 rate limiter만 정함 (디코더 자체 sleep 없음, _decode_one과 같음)
+            upstream_limiter.wait(urlparse(request.source_url).netloc)
+            return new_decoderv1(request.source_url, interval=None)
 
-        # URL 디코딩
-        decoded_result = new_decoderv1(request.source_url, interval=request.interval_time)
+        # URL 디코딩 (블로킹 호출이므로 스레드 풀에서 실행)
+        decoded_result = await asyncio.get_running_loop().run_in_executor(decode_executor, decode)
 
         if decoded_result.get("status"):
             logger.info(f"Successfully decoded: {decoded_result['decoded_url'][:80]}...")
@@ -99,45 +177,35 @@ async def decode_url(request: DecodeRequest):
 
 @app.post("/decode_batch/")
 async def decode_batch(request: BatchDecodeRequest):
-    """여러 URL 일괄 디코딩"""
-    try:
-        logger.info(f"Batch decoding {len(request.urls)} URLs")
-
+    """
+    여러 URL 일괄 디코딩
+    중복 URL은 한 번만 디코딩하고, 스레드 풀에서 동시에 실행한다.
+    기본은 완료되는 순서대로 한 줄에 결과 하나씩 NDJSON으로 스트리밍.
+    """
+    unique_urls = list(dict.fromkeys(request.urls))
+    logger.info(f"Batch decoding {len(unique_urls)} URLs ({len(request.urls) - len(unique_urls)} duplicates skipped)")
+
+    new_decoderv1 = _load_decoder()
+    loop = asyncio.get_running_loop()
+    futures = [
+        loop.run_in_executor(decode_executor, _decode_one, new_decoderv1, url)
+        for url in unique_urls
+    ]
+
+    if not request.stream:
+        return {"results": list(await asyncio.gather(*futures))}
+
+    async def stream_results():
         try:
-            from googlenewsdecoder import new_decoderv1
-        except ImportError as e:
-            raise HTTPException(status_code=500, detail="googlenewsdecoder library not installed")
-
-        results = []
-        for url in request.urls:
-            try:
-                decoded_result = new_decoderv1(url, interval=request.interval_time)
-                if decoded_result.get("status"):
-                    results.append({
-                        "original_url": url,
-                        "decoded_url": decoded_result["decoded_url"],
-                        "success": True
-                    })
-                else:
-                    results.append({
-                        "original_url": url,
-                        "decoded_url": url,  # 실패시 원본 사용
-                        "success": False,
-                        "error": decoded_result.get("message", "Decoding failed")
-                    })
-            except Exception as e:
-                results.append({
-                    "original_url": url,
-                    "decoded_url": url,
-                    "success": False,
-                    "error": str(e)
-                })
-
-        return {"results": results}
-
-    except Exception as e:
-        logger.error(f"Batch decoding error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+            for next_done in asyncio.as_completed(futures):
+                result = await next_done
+                yield json.dumps(result, ensure_ascii=False) + "\n"
+        finally:
+            # 클라이언트가 중간에 끊으면 아직 시작하지 않은 작업은 취소
+            for future in futures:
+                future.cancel()
+
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
 
 if __name__ == "__main__":
     import uvicorn
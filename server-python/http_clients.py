@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+외부 HTTP 연결 관리 (피드/기사 다운로드, Google 리다이렉트, 디코딩 서버)
+- 비동기: 프로세스에 하나인 httpx.AsyncClient를 계속 재사용 (keep-alive, h2가 있으면 HTTP/2)
+  호스트별 요청 간격/동시 요청 수는 DomainScheduler가 정한다 (host_slot)
+- 디코딩 서버(google_decoder.py)는 별도 클라이언트로 연결을 유지 (기사마다 새 연결 없음)
+- 동기 경로(예전 API, 본문 추출 테스트)는 호스트별 풀 크기를 정한 requests.Session 공유
+TLS 핸드셰이크는 호스트당 처음 한 번만 하고 이후 기사들은 같은 연결을 쓴다.
+"""
+
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from crawl_scheduler import DomainScheduler
+
+try:
+    import h2  # noqa: F401 - httpx HTTP/2 지원 (httpx[http2])
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# 기사/리다이렉트 요청에 공통으로 쓰는 브라우저 헤더
+BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+}
+
+
+class HttpClients:
+    def __init__(
+        self,
+        decoder_url: str,
+        timeout: float = 20.0,
+        max_connections: int = 100,
+        max_per_host: int = 6,
+        host_pools: int = 64,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
+        scheduler: Optional[DomainScheduler] = None,
+    ):
+        self.decoder_url = decoder_url.rstrip("/")
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_per_host = max_per_host
+        self.host_pools = host_pools  # 동기 세션이 연결 풀을 유지할 호스트 수
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self.scheduler = scheduler or DomainScheduler(max_per_host=max_per_host)
+
+        # 비동기 클라이언트는 만든 이벤트 루프에서만 쓸 수 있어서 루프가 바뀌면 새로 만든다
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._decoder: Optional[httpx.AsyncClient] = None
+
+        self._sync_lock = threading.Lock()
+        self._session: Optional[requests.Session] = None
+        self._decoder_session: Optional[requests.Session] = None
+
+    # 비동기
+    def _ensure_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._client = None
+            self._decoder = None
+
+    def client(self) -> httpx.AsyncClient:
+        """피드/기사/리다이렉트용 공유 클라이언트 (닫지 말 것 - aclose()에서 정리)"""
+        self._ensure_loop()
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers=BROWSER_HEADERS,
+                timeout=self.timeout,
+                follow_redirects=True,
+                verify=False,
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                    keepalive_expiry=self.keepalive_expiry,
+                ),
+            )
+        return self._client
+
+    def decoder(self) -> httpx.AsyncClient:
+        """디코딩 서버 전용 클라이언트 - 경로만 넘기면 됨 ("/decode/", "/decode_batch/")"""
+        self._ensure_loop()
+        if self._decoder is None:
+            self._decoder = httpx.AsyncClient(
+                base_url=self.decoder_url,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=self.max_per_host, keepalive_expiry=None),
+            )
+        return self._decoder
+
+    @asynccontextmanager
+    async def host_slot(self, url: str) -> AsyncIterator[None]:
+        """async with clients.host_slot(url): ... - 호스트별 요청 간격/동시 요청 수를 지켜서 요청"""
+        async with self.scheduler.aslot(url):
+            yield
+
+    def report(self, url: str, response) -> None:
+        """응답 상태를 스케줄러에 알림 (429/503이면 Retry-After/백오프 적용)"""
+        self.scheduler.report(url, response.status_code, response.headers.get("Retry-After"))
+
+    async def aclose(self) -> None:
+        for client in (self._client, self._decoder):
+            if client is not None:
+                await client.aclose()
+        self._client = None
+        self._decoder = None
+        self.close_sessions()
+
+    # 동기
+    def session(self) -> requests.Session:
+        """동기 경로용 공유 세션 (호스트마다 max_per_host개 연결 유지)"""
+        with self._sync_lock:
+            if self._session is None:
+                session = requests.Session()
+                session.headers.update(BROWSER_HEADERS)
+                session.verify = False
+                adapter = HTTPAdapter(pool_connections=self.host_pools, pool_maxsize=self.max_per_host)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._session = session
+            return self._session
+
+    def decoder_session(self) -> requests.Session:
+        """디코딩 서버 전용 동기 세션 - decoder_url 기준 경로로 요청"""
+        with self._sync_lock:
+            if self._decoder_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_per_host)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._decoder_session = session
+            return self._decoder_session
+
+    def decoder_endpoint(self, path: str) -> str:
+        return f"{self.decoder_url}{path}"
+
+    def close_sessions(self) -> None:
+        with self._sync_lock:
+            for session in (self._session, self._decoder_session):
+                if session is not None:
+                    session.close()
+            self._session = None
+            self._decoder_session = None
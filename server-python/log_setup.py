@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+서버 로깅 설정
+- LOG_LEVEL (기본 INFO) 아래 레벨은 로그 레코드를 만들기 전에 버려진다
+- 출력은 QueueHandler -> 별도 스레드의 QueueListener (요청/이벤트 루프는 큐에 넣기만 함)
+- LOG_FORMAT=json이면 한 줄에 JSON 하나 (수집기로 보낼 때), 기본은 사람이 읽는 텍스트
+- 기사마다 찍히는 로그는 extra=SAMPLED를 붙이면 LOG_SAMPLE_RATE 비율만 남긴다 (WARNING 이상은 항상)
+- 만드는 데 비용이 드는 값은 lazy(lambda: ...)로 넘기면 실제로 출력될 때만 계산
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text").lower()
+LOG_SAMPLE_RATE = float(os.getenv("LOG_SAMPLE_RATE", "1.0"))
+
+# logger.info(..., extra=SAMPLED) - 샘플링 대상 표시
+SAMPLED = {"sampled": True}
+
+# 요청마다 INFO를 찍는 라이브러리 로거 - WARNING 미만은 LOG_LEVEL=DEBUG일 때만
+NOISY_LOGGERS = ("httpx", "httpcore", "urllib3", "trafilatura")
+
+TEXT_FORMAT = "%(asctime)s %(levelname)-7s %(name)s: %(message)s"
+
+# 레코드 기본 속성 (JSON 출력에서 extra로 넘긴 필드만 골라내기 위함)
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "sampled"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class lazy:
+    """str()될 때 한 번만 계산되는 로그 인자 - 레벨/샘플링으로 버려지면 계산하지 않음"""
+
+    __slots__ = ("_func", "_value")
+
+    def __init__(self, func: Callable[[], object]):
+        self._func = func
+        self._value = None
+
+    def __str__(self) -> str:
+        if self._func is not None:
+            self._value = str(self._func())
+            self._func = None
+        return self._value
+
+
+class SamplingFilter(logging.Filter):
+    """extra=SAMPLED 레코드 중 rate 비율만 통과 (WARNING 이상은 항상 통과)"""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not getattr(record, "sampled", False):
+            return True
+        return self.rate >= 1.0 or random.random() < self.rate
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        data.update({key: value for key, value in vars(record).items() if key not in _RECORD_ATTRS})
+        if record.exc_info:
+            data["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+def _make_formatter() -> logging.Formatter:
+    return JsonFormatter() if LOG_FORMAT == "json" else logging.Formatter(TEXT_FORMAT)
+
+
+def setup_logging() -> None:
+    """
+    루트 로거에 큐 핸들러 연결하고 출력 스레드 시작 (여러 번 불러도 한 번만)
+    uvicorn 로거도 같은 큐를 거치도록 자체 핸들러를 떼어 낸다
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(_make_formatter())
+    _listener = logging.handlers.QueueListener(log_queue, output, respect_handler_level=False)
+
+    handler = logging.handlers.QueueHandler(log_queue)
+    handler.addFilter(SamplingFilter(LOG_SAMPLE_RATE))
+
+    root = logging.getLogger()
+    root.handlers[:] = [handler]
+    root.setLevel(LOG_LEVEL)
+    for name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
+        logger = logging.getLogger(name)
+        logger.handlers.clear()
+        logger.propagate = True
+    for name in NOISY_LOGGERS:
+        logging.getLogger(name).setLevel(LOG_LEVEL if LOG_LEVEL == "DEBUG" else "WARNING")
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """큐에 남은 로그를 모두 출력하고 출력 스레드 종료"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def setup_worker_logging() -> None:
+    """
+    본문 추출 프로세스 풀 initializer
+    fork된 자식에는 부모의 큐 핸들러가 복사되지만 출력 스레드가 없으므로 바로 쓰는 핸들러로 교체
+    """
+    global _listener
+    _listener = None
+    output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(_make_formatter())
+    output.addFilter(SamplingFilter(LOG_SAMPLE_RATE))
+    root = logging.getLogger()
+    root.handlers[:] = [output]
+    root.setLevel(LOG_LEVEL)
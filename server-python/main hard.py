@@ -24,6 +24,8 @@ from newspaper import Article, Config
 import ssl
 import urllib3
 import certifi
+from concurrent.futures import ThreadPoolExecutor
+from crawl_scheduler import DomainScheduler
 
 # SSL 환경 설정 개선 (더 강력한 SSL 우회)
 os.environ['SSL_CERT_FILE'] = certifi.where()
@@ -61,6 +63,9 @@ def get_sort_key(article):
     return datetime.min
 
 
+GOOGLE_NEWS_URL = "https://news.google.com/"
+
+
 def decode_google_news_url(url: str, session=None) -> str:
     """
     Comprehensive Google News URL decoder with multiple fallback strategies.
@@ -76,8 +81,10 @@ def decode_google_news_url(url: str, session=None) -> str:
         print(f"🧹 Removed US redirect params from URL")
 
     # Strategy 0: googlenewsdecoder 라이브러리 먼저 시도 (가장 효과적!)
+    # news.google.com 요청 간격은 고정 interval 대신 crawl_scheduler 토큰 버킷이 정함 (워커 스레드 공유)
     try:
-        result = gnewsdecoder(url, interval=1)
+        with crawl_scheduler.slot(GOOGLE_NEWS_URL):
+            result = gnewsdecoder(url)
         if result.get("status") and result.get("decoded_url"):
             decoded = result["decoded_url"]
             # Google URL이 아닌 실제 뉴스 URL인지 확인
@@ -93,7 +100,8 @@ def decode_google_news_url(url: str, session=None) -> str:
         clean_url = re.sub(r'&hl=[^&]*&gl=[^&]*&ceid=[^&]*', '', url)
         if clean_url != url:
             print(f"🧹 Cleaned US redirect params, retrying...")
-            result = gnewsdecoder(clean_url, interval=1)
+            with crawl_scheduler.slot(GOOGLE_NEWS_URL):
+                result = gnewsdecoder(clean_url)
             if result.get("status") and result.get("decoded_url"):
                 decoded = result["decoded_url"]
                 if "google.com" not in decoded and decoded.startswith('http'):
@@ -246,15 +254,16 @@ def extract_news_content(article_url: str, session=None) -> str:
         print(f"📄 Fetching content from: {real_url[:80]}...")
 
         # Step 2: Fetch the actual article
-        time.sleep(1)  # Be polite
-
+        # Be polite: per-domain spacing, Retry-After and 429/503 backoff (crawl_scheduler)
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
         }
 
-        response = session.get(real_url, headers=headers, timeout=15, verify=False)
+        response = crawl_scheduler.run(
+            real_url, lambda: session.get(real_url, headers=headers, timeout=15, verify=False)
+        )
         response.raise_for_status()
 
         soup = BeautifulSoup(response.content, 'html.parser')
@@ -329,6 +338,15 @@ def extract_news_content(article_url: str, session=None) -> str:
 # 환경 변수 로드
 load_dotenv()
 
+# 크롤링 예의: 고정 sleep 대신 도메인별 토큰 버킷 + 동시 요청 수 제한
+# 다른 언론사 도메인은 병렬로, 같은 호스트는 간격을 두고 요청
+crawl_scheduler = DomainScheduler(
+    rate_per_host=float(os.getenv("CRAWL_RATE_PER_HOST", "1")),  # 호스트당 초당 요청 수
+    burst=float(os.getenv("CRAWL_BURST", "2")),
+    max_per_host=int(os.getenv("CRAWL_MAX_PER_HOST", "2")),
+)
+CRAWL_WORKERS = int(os.getenv("CRAWL_WORKERS", "8"))  # 본문을 동시에 받을 스레드 수
+
 
 # 데이터베이스 설정
 DATABASE_URL = os.getenv("DATABASE_URL") or "sqlite:///./news.db"
@@ -489,10 +507,8 @@ class GoogleNewsRSSClient:
     def extract_article_content(self, url: str) -> str:
         """뉴스 기사 URL에서 전체 내용을 추출"""
         try:
-            # 요청 간 딜레이 추가 (크롤링 예의)
-            time.sleep(1)
-
-            response = self.session.get(url, timeout=10)
+            # 크롤링 예의: 도메인별 요청 간격은 crawl_scheduler가 지킴
+            response = crawl_scheduler.run(url, lambda: self.session.get(url, timeout=10))
             response.raise_for_status()
 
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -682,11 +698,19 @@ async def fetch_and_store_news(db: Session):
             articles = articles[:5]
         print(f"📊 Processing {len(articles)} most recent articles for {category}")  # 디버깅 로그
 
+        # 본문은 미리 병렬로 받아 둠 (기사마다 sleep 하지 않음)
+        # 같은 도메인 요청 간격과 429/503 대응은 crawl_scheduler가 처리
+        news_urls = [article.get("url", "") for article in articles]
+        with ThreadPoolExecutor(max_workers=CRAWL_WORKERS) as pool:
+            fetched = list(pool.map(
+                lambda url: extract_news_content(url, category_session) if url else None,
+                news_urls,
+            ))
+        prefetched_content = dict(zip(news_urls, fetched))
+
         try:
 
             for i, article in enumerate(articles):
-                # 봇 감지 방지를 위한 딜레이 (세션은 카테고리별로 새로 생성하므로 쿠키 클리어 불필요)
-                time.sleep(2)
                 title = article.get("title", "").strip()
                 description = article.get("description", "").strip()
 
@@ -710,9 +734,9 @@ async def fetch_and_store_news(db: Session):
                 news_url = article.get("url", "")
                 print(f"🔗 News URL: {news_url}")  # 디버깅 로그
 
-                # 실제 뉴스 페이지에서 본문 추출
+                # 실제 뉴스 페이지에서 본문 추출 (위에서 병렬로 받아 둔 결과)
                 if news_url:
-                    full_content = extract_news_content(news_url, category_session)
+                    full_content = prefetched_content.get(news_url)
 
                 # content 설정 (실제 본문 우선, 없으면 description 사용)
                 if full_content:
@@ -768,7 +792,8 @@ async def fetch_and_store_news(db: Session):
                 if should_extract and news_url:
                     print(f"🛠️ Extracting full content from: {news_url}")  # 디버깅 로그
                     try:
-                        full_article_content = extract_news_content(news_url, category_session)
+                        # 같은 URL을 다시 받지 않고 미리 받아 둔 결과 사용
+                        full_article_content = prefetched_content.get(news_url)
                         if full_article_content and len(full_article_content) > len(content):
                             content = full_article_content
                             print(f"✅ Successfully extracted content ({len(content)} chars)")  # 디버깅 로그
@@ -1,24 +1,102 @@
-from fastapi import FastAPI, HTTPException, Query, Depends
+from fastapi import FastAPI, HTTPException, Query, Depends, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field, field_serializer
-from datetime import datetime
-from typing import Optional, List, AsyncGenerator, Dict
-from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Optional, List, AsyncGenerator, Dict, Tuple
+from contextlib import asynccontextmanager, contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import os
+import logging
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, Column, Integer, String, Text, TIMESTAMP, func
-from sqlalchemy.orm import declarative_base
+from sqlalchemy import create_engine, and_, event, func, make_url, or_, select, update
+from sqlalchemy.engine import URL
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import sessionmaker, Session
+from alembic import command as alembic_command
+from alembic.config import Config as AlembicConfig
 import uvicorn
 import feedparser
 import requests
 from bs4 import BeautifulSoup
 import time
-import re
-import trafilatura
+import asyncio
+import base64
+import hashlib
+import json
+import uuid
+from urllib.parse import urlencode, urlsplit
+import httpx
+from url_cache import DecodedUrlCache
+from gnews_id import decode_google_news_url_offline
+from feed_state import FeedStateStore, FeedValidators
+from extractors import ExtractionResult, extract_with_beautifulsoup, run_extractors
+from dedup import make_dedup_key
+from models import AppMeta, IngestJobRecord, Post
+from startup_lock import INGEST_LOCK_KEY, startup_lock
+import fulltext
+from response_cache import CACHE_CONTROL, CachedResponse, ResponseCache, etag_matches
+from data_version import DataVersion, bump_statement, select_statement
+from ngram_index import NgramIndex
+from category_feeds import ALL_CATEGORIES, CategoryFeeds
+from http_clients import HttpClients
+from crawl_scheduler import THROTTLE_STATUSES, DomainScheduler
+from log_setup import SAMPLED, lazy, setup_logging, setup_worker_logging
+import metrics
 
-# 간단 버전에서는 기본 세션만 사용
-session = requests.Session()
+# 환경 변수 로드
+load_dotenv()
+setup_logging()
+logger = logging.getLogger(__name__)
+
+# 서버 폴더 - 캐시/상태 파일과 잠금 파일의 기본 위치 (실행한 작업 디렉터리와 무관)
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 디코딩 API 서버 (google_decoder.py)
+DECODER_API_URL = os.getenv("DECODER_API_URL", "http://127.0.0.1:5000")
+
+# 비동기 수집 파이프라인 설정
+INGEST_CONCURRENCY = int(os.getenv("INGEST_CONCURRENCY", "8"))  # 동시에 처리할 기사 수
+INGEST_HTTP_TIMEOUT = float(os.getenv("INGEST_HTTP_TIMEOUT", "20"))
+
+# 외부 HTTP 연결 (피드/기사/디코딩 서버 모두 여기서 만든 클라이언트만 사용)
+HTTP_MAX_PER_HOST = int(os.getenv("HTTP_MAX_PER_HOST", "6"))  # 호스트당 동시 연결(요청) 수
+http_clients = HttpClients(
+    decoder_url=DECODER_API_URL,
+    timeout=INGEST_HTTP_TIMEOUT,
+    max_connections=int(os.getenv("HTTP_MAX_CONNECTIONS", "100")),
+    max_per_host=HTTP_MAX_PER_HOST,
+    keepalive_expiry=float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30")),
+    http2=os.getenv("HTTP2", "1").lower() not in ("0", "false", "no"),
+    # 호스트별 요청 간격 (토큰 버킷), 429/503이면 Retry-After와 백오프 적용
+    scheduler=DomainScheduler(
+        rate_per_host=float(os.getenv("CRAWL_RATE_PER_HOST", "4")),
+        burst=float(os.getenv("CRAWL_BURST", "4")),
+        max_per_host=HTTP_MAX_PER_HOST,
+    ),
+)
+MAX_ARTICLE_BYTES = int(os.getenv("MAX_ARTICLE_BYTES", str(2 * 1024 * 1024)))  # 기사 페이지 다운로드 상한
+# HTML 파싱(BeautifulSoup/Trafilatura)을 돌릴 프로세스 수 (0이면 프로세스 풀 대신 스레드에서 실행)
+INGEST_WRITE_CHUNK = int(os.getenv("INGEST_WRITE_CHUNK", "50"))  # 한 트랜잭션에 넣을 기사 수
+EXTRACT_PROCESSES = int(os.getenv("EXTRACT_PROCESSES", str(min(4, os.cpu_count() or 1))))
+
+# 디코딩 결과 영구 캐시 (같은 기사 ID는 네트워크 없이 재사용)
+url_cache = DecodedUrlCache(
+    path=os.getenv("URL_CACHE_PATH", os.path.join(BASE_DIR, "url_cache.db")),
+    ttl_seconds=float(os.getenv("URL_CACHE_TTL", str(30 * 24 * 3600))),
+    negative_ttl_seconds=float(os.getenv("URL_CACHE_NEGATIVE_TTL", "3600")),
+    max_entries=int(os.getenv("URL_CACHE_MAX_ENTRIES", "50000")),
+)
+
+# 피드 ETag/Last-Modified/본문 해시와 이미 수집한 기사 guid 저장소
+# 한국어 n-gram 검색 색인 (SEARCH_INDEX=ngram일 때만 사용, 시작 시 스냅샷에서 복구)
+SEARCH_INDEX = os.getenv("SEARCH_INDEX", "").lower()
+SEARCH_INDEX_PATH = os.getenv("SEARCH_INDEX_PATH", os.path.join(BASE_DIR, "search_index.snapshot"))
+search_index: Optional[NgramIndex] = None
+search_index_version: Optional[int] = None  # 색인에 반영된 데이터 버전 (다른 워커가 저장하면 뒤처짐)
+
+feed_state = FeedStateStore(path=os.getenv("FEED_STATE_PATH", os.path.join(BASE_DIR, "feed_state.db")))
 
 def get_sort_key(article):
     """기사 정렬을 위한 키 함수 - 최신순 정렬"""
@@ -30,53 +108,81 @@ def get_sort_key(article):
                 published_date = published_date.replace('Z', '+00:00')
             return datetime.fromisoformat(published_date)
         except Exception as e:
-            print(f"⚠️ Date parsing error for article: {article.get('title', '')[:30]}... - {e}")
+            logger.warning("⚠️ Date parsing error for article: %.30s... - %s", article.get('title', ''), e)
             return datetime.min
     return datetime.min
 
 
+def _decode_article_id_offline(url: str) -> Optional[str]:
+    """기사 ID(CBMi...)의 protobuf를 직접 파싱해서 URL 복원 (네트워크 없음)"""
+    real_url = decode_google_news_url_offline(url)
+    if real_url and "google.com" not in real_url:
+        logger.debug("✅ 기사 ID에서 URL 복원: %.80s...", real_url)
+        return real_url
+    return None
+
+
 def decode_google_news_url(url: str, session=None) -> str:
     """
-    Google News URL 디코딩 (외부 디코딩 API 우선 사용)
-    별도 디코딩 서버를 호출하여 URL 변환
+    Google News URL 디코딩 (캐시 -> 오프라인 ID 파싱 -> 외부 디코딩 API -> 리다이렉트)
+    이전에 처리한 기사 ID는 url_cache에서 바로 반환 (실패도 일정 시간 캐시)
     """
     if not url or "google.com" not in url:
         return url
 
+    cached = url_cache.get(url)
+    if cached is not None:
+        metrics.URL_DECODES.inc(method="cache")
+        return cached
+
+    with metrics.INGEST_STAGE_SECONDS.time(stage="decode.single"):
+        decoded = _decode_google_news_url_uncached(url, session)
+    url_cache.put(url, decoded)
+    return decoded
+
+
+def _decode_google_news_url_uncached(url: str, session=None) -> str:
+    """
+    Google News URL 디코딩 (오프라인 ID 파싱 -> 외부 디코딩 API -> 리다이렉트)
+    새 형식(AU_yqL) ID처럼 오프라인으로 풀 수 없을 때만 네트워크 사용
+    """
+    # 0. 기사 ID 오프라인 디코딩 (네트워크 없음)
+    real_url = _decode_article_id_offline(url)
+    if real_url:
+        metrics.URL_DECODES.inc(method="offline")
+        return real_url
+
     try:
-        # 0. 외부 디코딩 API 우선 시도
+        # 1. 외부 디코딩 API 시도
         try:
-            print(f"🔗 외부 디코딩 API 호출...")
-            import requests
-
-            # 디코딩 API 서버 호출 (로컬호스트)
-            api_url = "http://127.0.0.1:5000/decode/"
-            payload = {
-                "source_url": url,
-                "interval_time": 3  # 빠른 응답을 위해 짧게 설정
-            }
+            logger.debug("🔗 외부 디코딩 API 호출...")
+
+            # 디코딩 API 서버 호출 (로컬호스트, 연결 유지)
+            payload = {"source_url": url}  # 요청 간격은 디코딩 서버의 rate limiter가 관리
 
-            response = requests.post(api_url, json=payload, timeout=10)
+            response = http_clients.decoder_session().post(
+                http_clients.decoder_endpoint("/decode/"), json=payload, timeout=10
+            )
 
             if response.status_code == 200:
                 data = response.json()
                 if data.get("success") and data.get("decoded_url"):
                     decoded_url = data["decoded_url"]
                     if decoded_url != url and "google.com" not in decoded_url:
-                        print(f"✅ 외부 API 디코딩 성공: {decoded_url[:80]}...")
+                        logger.debug("✅ 외부 API 디코딩 성공: %.80s...", decoded_url)
+                        metrics.URL_DECODES.inc(method="api")
                         return decoded_url
 
-            print(f"⚠️ 외부 API 호출 실패 또는 유효하지 않은 결과: {response.status_code}")
+            logger.warning("⚠️ 외부 API 호출 실패 또는 유효하지 않은 결과: %s", response.status_code)
 
         except requests.exceptions.RequestException as api_error:
-            print(f"⚠️ 외부 API 서버 연결 실패 (서버가 실행 중인지 확인): {api_error}")
+            logger.warning("⚠️ 외부 API 서버 연결 실패 (서버가 실행 중인지 확인): %s", api_error)
         except Exception as api_error:
-            print(f"⚠️ 외부 API 호출 오류: {api_error}")
+            logger.warning("⚠️ 외부 API 호출 오류: %s", api_error)
 
-        # 1. HTTP 리다이렉트 시도 (fallback)
+        # 2. HTTP 리다이렉트 시도 (fallback)
         if session is None:
-            session = requests.Session()
-            session.verify = False
+            session = http_clients.session()
 
         try:
             headers = {
@@ -86,116 +192,199 @@ def decode_google_news_url(url: str, session=None) -> str:
                 'Referer': 'https://news.google.com/',
             }
 
-            print(f"🔗 HTTP 리다이렉트 시도...")
+            logger.debug("🔗 HTTP 리다이렉트 시도...")
             response = session.get(url, headers=headers, allow_redirects=True, timeout=15, verify=False)
 
             final_url = response.url
             if final_url != url and "google.com" not in final_url and final_url.startswith('http'):
-                print(f"✅ HTTP 리다이렉트 성공: {final_url[:80]}...")
+                logger.debug("✅ HTTP 리다이렉트 성공: %.80s...", final_url)
+                metrics.URL_DECODES.inc(method="redirect")
                 return final_url
             else:
-                print(f"⚠️ 리다이렉트 결과가 유효하지 않음: {final_url[:60]}...")
+                logger.info("⚠️ 리다이렉트 결과가 유효하지 않음: %.60s...", final_url, extra=SAMPLED)
 
         except Exception as redirect_error:
-            print(f"⚠️ HTTP 리다이렉트 실패: {redirect_error}")
-
-        # 2. Base64 디코딩 시도 (최후의 수단)
-        import base64
-        import re
-
-        match = re.search(r'/rss/articles/(CBMi[^?]+)', url)
-        if match:
-            encoded_part = match.group(1)
-            print(f"🔍 Base64 디코딩 시도...")
+            logger.warning("⚠️ HTTP 리다이렉트 실패: %s", redirect_error)
 
-            try:
-                # 패딩 추가
-                missing_padding = len(encoded_part) % 4
-                if missing_padding:
-                    encoded_part += '=' * (4 - missing_padding)
-
-                decoded_bytes = base64.urlsafe_b64decode(encoded_part)
-                decoded_text = decoded_bytes.decode('utf-8', errors='ignore')
-
-                # URL 패턴 찾기
-                url_patterns = [
-                    r'https?://[^\s\'"<>(){}\[\]]+',
-                    r'https?://[^\s\'"<>\s]+',
-                ]
-
-                for pattern in url_patterns:
-                    matches = re.findall(pattern, decoded_text)
-                    for match in matches:
-                        real_url = re.sub(r'[<>,"\'\s]+$', '', match)
-                        if len(real_url) > 20 and "google.com" not in real_url and real_url.startswith('http'):
-                            print(f"✅ Base64에서 URL 발견: {real_url[:80]}...")
-                            return real_url
-
-            except Exception as b64_error:
-                print(f"⚠️ Base64 디코딩 실패: {b64_error}")
-
-        print(f"⚠️ 모든 디코딩 방법 실패, 원본 URL 사용")
+        logger.warning("⚠️ 모든 디코딩 방법 실패, 원본 URL 사용")
+        metrics.URL_DECODES.inc(method="failed")
         return url
 
     except Exception as e:
-        print(f"💥 URL 디코딩 오류: {e}, 원본 사용")
+        logger.error("💥 URL 디코딩 오류: %s, 원본 사용", e)
         return url
 
+
+async def decode_google_news_url_async(url: str, http: httpx.AsyncClient) -> str:
+    """
+    decode_google_news_url의 비동기 버전
+    수집 파이프라인에서 이벤트 루프를 막지 않도록 httpx.AsyncClient 사용
+    """
+    if not url or "google.com" not in url:
+        return url
+
+    cached = url_cache.get(url)
+    if cached is not None:
+        metrics.URL_DECODES.inc(method="cache")
+        return cached
+
+    with metrics.INGEST_STAGE_SECONDS.time(stage="decode.single"):
+        decoded = await _decode_google_news_url_uncached_async(url, http)
+    url_cache.put(url, decoded)
+    return decoded
+
+
+async def _decode_google_news_url_uncached_async(url: str, http: httpx.AsyncClient) -> str:
+    """캐시를 거치지 않는 실제 디코딩 (오프라인 ID 파싱 -> 외부 API -> 리다이렉트)"""
+    # 0. 기사 ID 오프라인 디코딩 (네트워크 없음)
+    real_url = _decode_article_id_offline(url)
+    if real_url:
+        metrics.URL_DECODES.inc(method="offline")
+        return real_url
+
+    # 1. 외부 디코딩 API 시도
+    try:
+        response = await http_clients.decoder().post(
+            "/decode/",
+            json={"source_url": url},
+            timeout=10,
+        )
+        if response.status_code == 200:
+            data = response.json()
+            decoded_url = data.get("decoded_url")
+            if data.get("success") and decoded_url and decoded_url != url and "google.com" not in decoded_url:
+                logger.debug("✅ 외부 API 디코딩 성공: %.80s...", decoded_url)
+                metrics.URL_DECODES.inc(method="api")
+                return decoded_url
+        logger.warning("⚠️ 외부 API 호출 실패 또는 유효하지 않은 결과: %s", response.status_code)
+    except httpx.HTTPError as api_error:
+        logger.warning("⚠️ 외부 API 서버 연결 실패 (서버가 실행 중인지 확인): %r", api_error)
+    except Exception as api_error:
+        logger.warning("⚠️ 외부 API 호출 오류: %s", api_error)
+
+    # 2. HTTP 리다이렉트 시도 (fallback)
+    final_url = await _resolve_by_redirect_async(url, http)
+    if final_url:
+        metrics.URL_DECODES.inc(method="redirect")
+        return final_url
+
+    logger.warning("⚠️ 모든 디코딩 방법 실패, 원본 URL 사용")
+    metrics.URL_DECODES.inc(method="failed")
+    return url
+
+
+async def _resolve_by_redirect_async(url: str, http: httpx.AsyncClient) -> Optional[str]:
+    """Google News 링크를 직접 요청해서 리다이렉트된 최종 URL 확인"""
+    try:
+        response = await http_clients.scheduler.arun(
+            url, lambda: http.get(url, headers={"Referer": "https://news.google.com/"}, timeout=15)
+        )
+        final_url = str(response.url)
+        if final_url != url and "google.com" not in final_url and final_url.startswith('http'):
+            logger.debug("✅ HTTP 리다이렉트 성공: %.80s...", final_url)
+            return final_url
+        logger.info("⚠️ 리다이렉트 결과가 유효하지 않음: %.60s...", final_url, extra=SAMPLED)
+    except Exception as redirect_error:
+        logger.warning("⚠️ HTTP 리다이렉트 실패: %r", redirect_error)
+    return None
+
+
+async def _decode_batch_async(urls: List[str], http: httpx.AsyncClient) -> Dict[str, str]:
+    """
+    디코딩 서버의 /decode_batch/를 한 번 호출해서 여러 URL 변환
+    NDJSON으로 스트리밍되는 결과를 읽으며 성공한 것만 {원본: 실제 URL}로 반환
+    """
+    results: Dict[str, str] = {}
+    try:
+        async with http_clients.decoder().stream(
+            "POST",
+            "/decode_batch/",
+            json={"urls": urls},
+            timeout=httpx.Timeout(INGEST_HTTP_TIMEOUT, read=60),
+        ) as response:
+            if response.status_code != 200:
+                logger.warning("⚠️ 배치 디코딩 API 호출 실패: %s", response.status_code)
+                return results
+            async for line in response.aiter_lines():
+                if not line.strip():
+                    continue
+                item = json.loads(line)
+                decoded_url = item.get("decoded_url")
+                if item.get("success") and decoded_url and "google.com" not in decoded_url:
+                    results[item["original_url"]] = decoded_url
+    except httpx.HTTPError as api_error:
+        logger.warning("⚠️ 배치 디코딩 API 서버 연결 실패 (서버가 실행 중인지 확인): %r", api_error)
+    except ValueError as parse_error:
+        logger.warning("⚠️ 배치 디코딩 응답 파싱 오류: %s", parse_error)
+    logger.info("🔗 배치 디코딩: %d/%d개 성공", len(results), len(urls))
+    return results
+
 def extract_news_content(article_url: str, session=None) -> str:
     """
     개선된 뉴스 본문 추출 (BeautifulSoup 우선)
-    Google News URL 디코딩 후 본문 자동 추출
+    Google News URL 디코딩 후 페이지를 한 번만 받아서 추출기들을 순서대로 적용
     """
     try:
         # 1. Google News URL 디코딩
         real_url = decode_google_news_url(article_url, session)
 
         if not real_url:
-            print(f"URL 처리 실패: {article_url}")
+            logger.warning("URL 처리 실패: %s", article_url)
             return None
 
         # Google News URL인 경우에도 시도 (리다이렉트될 것임)
         target_url = real_url if real_url != article_url else article_url
 
-        # 2. BeautifulSoup로 우선 추출 시도 (더 안정적)
-        print(f"BeautifulSoup로 본문 추출 시도: {target_url[:80]}...")
-        result = _extract_with_beautifulsoup(target_url, session)
-        if result:
-            return result
+        # 2. 페이지 다운로드 (한 번만)
+        logger.debug("본문 추출 시도: %.80s...", target_url)
+        html = _download_article_html(target_url, session)
+        if html is None:
+            logger.warning("페이지 다운로드 실패: %s", target_url)
+            return None
 
-        # 3. BeautifulSoup 실패시 Trafilatura 대안 시도
-        print(f"BeautifulSoup 실패, Trafilatura 대안 시도")
-        downloaded = trafilatura.fetch_url(target_url)
+        # 3. 같은 HTML에 BeautifulSoup -> Trafilatura 순서로 적용
+        result = run_extractors(html)
+        if result.extractor:
+            logger.debug("추출기 %s 성공 (%s)", result.extractor, lazy(lambda: _format_timings(result.timings)))
+        return result.text
 
-        if not downloaded:
-            print(f"페이지 다운로드 실패: {target_url}")
-            return None
+    except Exception as e:
+        logger.warning("본문 추출 오류: %s", e)
+        return None
 
-        # 본문 텍스트 추출 (정밀 모드, 댓글 제외)
-        text = trafilatura.extract(
-            downloaded,
-            output_format='txt',
-            include_comments=False,
-            favor_precision=True
-        )
 
-        if text and len(text.strip()) > 100:
-            # 성공: 텍스트 정리
-            cleaned_text = ' '.join(text.split())  # 연속 공백 제거
-            print(f"Trafilatura 추출 성공: {len(cleaned_text)}자")
-            return cleaned_text[:2000]  # 길이 제한
-        else:
-            print(f"Trafilatura 추출 실패")
-            return None
+def _format_timings(timings: Dict[str, float]) -> str:
+    return ", ".join(f"{name} {seconds * 1000:.0f}ms" for name, seconds in timings.items())
+
 
+def _download_article_html(url: str, session=None) -> Optional[bytes]:
+    """기사 페이지를 MAX_ARTICLE_BYTES까지만 받아서 반환 (실패시 None)"""
+    if session is None:
+        session = http_clients.session()
+
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'DNT': '1',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+    }
+
+    try:
+        with session.get(url, headers=headers, timeout=20, verify=False, allow_redirects=True, stream=True) as response:
+            response.raise_for_status()
+            buffer = bytearray()
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                buffer.extend(chunk)
+                if len(buffer) >= MAX_ARTICLE_BYTES:
+                    logger.info("⚠️ 페이지가 너무 커서 %d바이트까지만 사용", MAX_ARTICLE_BYTES, extra=SAMPLED)
+                    break
+            return bytes(buffer[:MAX_ARTICLE_BYTES])
     except Exception as e:
-        print(f"본문 추출 오류: {e}")
-        # 최종 Fallback: BeautifulSoup 재시도
-        try:
-            return _extract_with_beautifulsoup(target_url, session)
-        except Exception as fallback_e:
-            print(f"Fallback도 실패: {fallback_e}")
-            return None
+        logger.warning("💥 페이지 다운로드 오류: %s", e)
+        return None
 
 
 def _extract_with_beautifulsoup(url: str, session=None) -> str:
@@ -203,125 +392,201 @@ def _extract_with_beautifulsoup(url: str, session=None) -> str:
     BeautifulSoup를 사용한 대안 본문 추출
     Trafilatura 실패시 사용
     """
+    html = _download_article_html(url, session)
+    if html is None:
+        return None
     try:
-        if session is None:
-            session = requests.Session()
-            session.verify = False
-
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        }
+        return extract_with_beautifulsoup(html)
+    except Exception as e:
+        logger.warning("💥 BeautifulSoup 추출 오류: %s", e)
+        return None
 
-        # SSL 검증 완전 우회 및 타임아웃 증가 - 강화된 SSL 처리
-        try:
-            response = session.get(url, headers=headers, timeout=20, verify=False, allow_redirects=True)
-            response.raise_for_status()
-        except Exception as ssl_error:
-            print(f"⚠️ SSL 오류 발생, 인증서 검증 완전 우회 시도: {ssl_error}")
-            try:
-                import ssl
-                response = session.get(
-                    url,
-                    headers=headers,
-                    timeout=20,
-                    verify=False,
-                    allow_redirects=True,
-                    cert_reqs=ssl.CERT_NONE
-                )
-                response.raise_for_status()
-            except Exception as fallback_error:
-                print(f"💥 SSL 우회 실패: {fallback_error}")
-                raise fallback_error
-
-        soup = BeautifulSoup(response.content, 'html.parser')
-
-        # 불필요한 요소 제거
-        for element in soup.find_all(['script', 'style', 'nav', 'footer', 'header', 'aside']):
-            element.decompose()
-
-        # 한국 뉴스 사이트용 본문 선택자들
-        content_selectors = [
-            'article',
-            '[id*="article"]',
-            '[class*="article"]',
-            '[id*="content"]',
-            '[class*="content"]',
-            '#articleBody',
-            '#newsct_article',
-            '.article_body',
-            '.news_body',
-            'div[itemprop="articleBody"]',
-            '.article-content',
-            'main'
-        ]
 
-        content_text = ""
-        for selector in content_selectors:
-            elements = soup.select(selector)
-            if elements:
-                texts = []
-                for elem in elements:
-                    paragraphs = elem.find_all(['p', 'div'])
-                    for p in paragraphs:
-                        text = p.get_text(strip=True)
-                        if len(text) > 30:  # 의미있는 길이의 텍스트만
-                            texts.append(text)
-
-                if texts:
-                    content_text = '\n\n'.join(texts)
-                    break
+class ArticleThrottled(Exception):
+    """재시도 후에도 기사 호스트가 429/503으로 응답 - 이번 실행에서는 저장하지 않고 다음 실행에서 다시 처리"""
 
-        # 추가 정리
-        if content_text:
-            # 한국 뉴스 사이트 흔한 아티팩트 제거
-            content_text = re.sub(r'▶.*?\n', '', content_text)
-            content_text = re.sub(r'\[.*?\]', '', content_text)
-            content_text = re.sub(r'사진.*?\n', '', content_text)
-            content_text = re.sub(r'\s+', ' ', content_text)
-            content_text = content_text.strip()
-
-        if len(content_text) > 100:
-            print(f"✅ BeautifulSoup 추출 성공: {len(content_text)}자")
-            return content_text[:2000]
-        else:
-            print(f"❌ BeautifulSoup 추출 실패: 텍스트가 너무 짧음")
-            return None
 
-    except Exception as e:
-        print(f"💥 BeautifulSoup 추출 오류: {e}")
+async def _download_article_html_async(url: str, http: httpx.AsyncClient) -> Optional[bytes]:
+    """
+    _download_article_html의 비동기 버전 - 스트리밍으로 받다가 상한에서 중단
+    429/503이면 scheduler.arun처럼 Retry-After만큼 기다렸다가 max_retries번까지 재시도,
+    그래도 막히면 ArticleThrottled
+    호스트별 다운로드 시간/결과는 metrics에 기록
+    """
+    host = urlsplit(url).hostname or "unknown"
+    started = time.perf_counter()
+    outcome = "error"
+    max_retries = http_clients.scheduler.max_retries
+    try:
+        for attempt in range(max_retries + 1):
+            # report()가 Retry-After까지 호스트를 막아 두므로 다음 host_slot()에서 기다리게 됨
+            async with http_clients.host_slot(url), http.stream("GET", url) as response:
+                http_clients.report(url, response)
+                if response.status_code in THROTTLE_STATUSES:
+                    if attempt < max_retries:
+                        continue
+                    outcome = "throttled"
+                    raise ArticleThrottled(f"{response.status_code} from {host}")
+                response.raise_for_status()
+                buffer = bytearray()
+                async for chunk in response.aiter_bytes():
+                    buffer.extend(chunk)
+                    if len(buffer) >= MAX_ARTICLE_BYTES:
+                        logger.info("⚠️ 페이지가 너무 커서 %d바이트까지만 사용", MAX_ARTICLE_BYTES, extra=SAMPLED)
+                        break
+                outcome = "ok"
+                return bytes(buffer[:MAX_ARTICLE_BYTES])
+    except httpx.HTTPError as e:
+        logger.warning("💥 페이지 다운로드 오류: %r", e)
         return None
+    finally:
+        metrics.ARTICLE_DOWNLOAD_SECONDS.observe(time.perf_counter() - started, host=host)
+        metrics.ARTICLE_DOWNLOADS.inc(host=host, outcome=outcome)
 
 
+_extract_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_extract_pool() -> ProcessPoolExecutor:
+    """본문 추출용 프로세스 풀 (처음 쓸 때 생성)"""
+    global _extract_pool
+    if _extract_pool is None:
+        _extract_pool = ProcessPoolExecutor(max_workers=EXTRACT_PROCESSES, initializer=setup_worker_logging)
+    return _extract_pool
+
+
+def shutdown_extract_pool() -> None:
+    global _extract_pool
+    if _extract_pool is not None:
+        _extract_pool.shutdown(wait=False, cancel_futures=True)
+        _extract_pool = None
+
+
+async def run_extractors_async(html: bytes) -> ExtractionResult:
+    """
+    CPU를 많이 쓰는 HTML 파싱을 프로세스 풀에서 실행 (이벤트 루프와 GIL을 막지 않음)
+    워커 프로세스가 죽으면 풀을 다시 만들고 이번 요청은 스레드에서 처리
+    """
+    global _extract_pool
+    if EXTRACT_PROCESSES <= 0:
+        return await asyncio.to_thread(run_extractors, html)
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(_get_extract_pool(), run_extractors, html)
+    except BrokenProcessPool:
+        logger.error("💥 추출 프로세스 풀 손상, 다시 생성")
+        _extract_pool = None
+        return await asyncio.to_thread(run_extractors, html)
+
+
+async def extract_news_content_async(article_url: str, http: httpx.AsyncClient) -> ExtractionResult:
+    """
+    extract_news_content의 비동기 버전
+    다운로드는 httpx로 한 번만, 추출기들은 같은 바이트로 프로세스 풀에서 실행
+    결과에 성공한 추출기 이름과 단계별 소요 시간(download 포함)이 담긴다
+    """
+    timings: Dict[str, float] = {}
+    try:
+        target_url = await decode_google_news_url_async(article_url, http)
+
+        logger.debug("본문 추출 시도: %.80s...", target_url)
+        started = time.perf_counter()
+        html = await _download_article_html_async(target_url, http)
+        timings["download"] = time.perf_counter() - started
+        if html is None:
+            return ExtractionResult(None, None, timings)
+
+        result = await run_extractors_async(html)
+        timings.update(result.timings)
+        if result.extractor:
+            logger.debug("추출기 %s 성공 (%s)", result.extractor, lazy(lambda: _format_timings(timings)))
+        return ExtractionResult(result.text, result.extractor, timings)
+
+    except ArticleThrottled:
+        raise
+    except Exception as e:
+        logger.warning("본문 추출 오류: %r", e)
+        return ExtractionResult(None, None, timings)
 
 
-# 환경 변수 로드
-load_dotenv()
 
 
 # 데이터베이스 설정
 DATABASE_URL = os.getenv("DATABASE_URL") or "sqlite:///./news.db"
+# SQL 문장 로그 (sqlalchemy.engine INFO) - 디버깅할 때만 SQL_ECHO=1
+SQL_ECHO = os.getenv("SQL_ECHO", "").lower() in ("1", "true", "yes")
+
+# 커넥션 풀 / 타임아웃 (비동기 엔진 기준, 동기 엔진은 시작 작업용이라 작게)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))  # 풀에서 연결을 기다리는 최대 시간(초)
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # 이보다 오래된 연결은 새로 맺음(초)
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "10000"))  # PostgreSQL statement_timeout (트랜잭션마다 SET LOCAL), SQLite busy timeout
+
+
+def _async_database_url(url: str) -> Tuple[URL, Dict]:
+    """
+    동기 드라이버 URL -> 비동기 드라이버 URL (aiosqlite / asyncpg) + connect_args
+    asyncpg는 sslmode/channel_binding 쿼리를 모르므로 ssl 인자로 바꿔서 넘김
+    """
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend == "sqlite":
+        return parsed.set(drivername="sqlite+aiosqlite"), {"timeout": DB_STATEMENT_TIMEOUT_MS / 1000}
+    if backend == "postgresql":
+        query = dict(parsed.query)
+        sslmode = query.pop("sslmode", None)
+        query.pop("channel_binding", None)
+        connect_args: Dict = {}
+        if sslmode and sslmode != "disable":
+            connect_args["ssl"] = "require"
+        return parsed.set(drivername="postgresql+asyncpg", query=query), connect_args
+    return parsed, {}
+
+
+def _sync_connect_args(url: str) -> Dict:
+    if make_url(url).get_backend_name() == "sqlite":
+        return {"timeout": DB_STATEMENT_TIMEOUT_MS / 1000}
+    return {}
+
+
+def _apply_statement_timeout(sync_engine) -> None:
+    """
+    PostgreSQL statement_timeout을 트랜잭션마다 SET LOCAL로 적용
+    연결 시작 파라미터(asyncpg server_settings, psycopg2 options=-c)는 Neon -pooler 같은
+    PgBouncer(transaction 모드) 뒤에서는 거부되거나 무시되므로 쓰지 않는다.
+    SET LOCAL은 트랜잭션이 끝나면 사라져서 풀러가 연결을 다른 클라이언트에 넘겨도 남지 않음
+    """
+    if sync_engine.dialect.name != "postgresql" or DB_STATEMENT_TIMEOUT_MS <= 0:
+        return
+
+    @event.listens_for(sync_engine, "begin")
+    def set_statement_timeout(conn):
+        conn.exec_driver_sql(f"SET LOCAL statement_timeout = {DB_STATEMENT_TIMEOUT_MS}")
+
 
-engine = create_engine(DATABASE_URL, echo=True)
+# 동기 엔진: 마이그레이션, 시드, 시작 시 색인/피드 구성 (스레드에서 실행)
+engine = create_engine(DATABASE_URL, echo=SQL_ECHO, pool_pre_ping=True, connect_args=_sync_connect_args(DATABASE_URL))
+_apply_statement_timeout(engine)
+# SQLite 등 advisory lock이 없는 DB에서 워커 간 시작 작업 잠금 파일
+STARTUP_LOCK_PATH = os.getenv("STARTUP_LOCK_PATH", os.path.join(BASE_DIR, ".startup.lock"))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-Base = declarative_base()
 
-# 데이터베이스 모델
-class Post(Base):
-    __tablename__ = "posts"
+# 비동기 엔진: API 요청과 수집 저장 (이벤트 루프를 막지 않음)
+ASYNC_DATABASE_URL, _async_connect_args = _async_database_url(DATABASE_URL)
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    echo=SQL_ECHO,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_pre_ping=True,
+    connect_args=_async_connect_args,
+)
+_apply_statement_timeout(async_engine.sync_engine)
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False, autoflush=False)
 
-    id = Column(Integer, primary_key=True, index=True)
-    title = Column(String, nullable=False)
-    summary = Column(Text, nullable=False)
-    content = Column(Text, nullable=False)
-    category = Column(String, nullable=False)
-    image_url = Column("image_url", String, nullable=False)
-    created_at = Column("created_at", TIMESTAMP, server_default=func.now())
 
 # Pydantic 스키마
 class PostBase(BaseModel):
@@ -337,8 +602,9 @@ class PostCreate(PostBase):
 class PostResponse(PostBase):
     id: int
     created_at: Optional[datetime] = None
+    published_at: Optional[datetime] = None
 
-    @field_serializer('created_at')
+    @field_serializer('created_at', 'published_at')
     def serialize_created_at(self, value: Optional[datetime]) -> Optional[str]:
         if value is None:
             return None
@@ -354,10 +620,200 @@ class PostResponse(PostBase):
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # startup
-    Base.metadata.create_all(bind=engine)
-    await seed_database()
+    await asyncio.to_thread(prepare_database)
+    fulltext.detect_backend(engine)
+    if SEARCH_INDEX == "ngram":
+        await asyncio.to_thread(load_search_index)
+    await asyncio.to_thread(build_category_feeds)
     yield
-    # shutdown (필요시 cleanup 코드 추가)
+    # shutdown
+    await cancel_ingest_jobs()
+    shutdown_extract_pool()
+    await http_clients.aclose()
+    await async_engine.dispose()
+    if search_index is not None:
+        search_index.save(SEARCH_INDEX_PATH)
+    if CATEGORY_FEEDS_PATH:
+        save_category_feeds()
+
+
+def prepare_database():
+    """
+    마이그레이션 + 시드 (여러 워커가 동시에 시작해도 한 번에 하나씩)
+    이미 최신이면 alembic 버전 확인과 시드 버전 조회만 하고 끝난다.
+    """
+    with startup_lock(engine, STARTUP_LOCK_PATH):
+        run_migrations()
+        if SEED_DATABASE:
+            seed_database()
+
+
+def run_migrations():
+    """alembic 마이그레이션을 head까지 적용 (스키마 변경은 migrations/versions에서만)"""
+    config = AlembicConfig(os.path.join(BASE_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BASE_DIR, "migrations"))
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        alembic_command.upgrade(config, "head")
+
+
+def _load_index_posts(ids: List[int]):
+    """색인할 글 (id, title, summary, content, category)을 DEDUP_QUERY_CHUNK개씩 읽기"""
+    with SessionLocal() as db:
+        for start in range(0, len(ids), DEDUP_QUERY_CHUNK):
+            chunk = ids[start:start + DEDUP_QUERY_CHUNK]
+            yield from db.query(Post.id, Post.title, Post.summary, Post.content, Post.category).filter(Post.id.in_(chunk))
+
+
+def load_search_index():
+    """스냅샷에서 n-gram 색인을 읽고 DB와 달라진 글만 다시 색인"""
+    global search_index, search_index_version
+    started = time.perf_counter()
+    index = NgramIndex.load(SEARCH_INDEX_PATH) or NgramIndex()
+
+    with SessionLocal() as db:
+        # 버전을 먼저 읽어서 색인이 실제 데이터보다 새 버전으로 표시되는 일이 없게
+        version = _read_data_version(db)
+        rows = db.query(Post.id, Post.title, func.length(Post.content)).all()
+    added, removed = index.sync(rows, _load_index_posts)
+    index.save(SEARCH_INDEX_PATH)
+    search_index = index
+    search_index_version = version
+    logger.info(
+        "🔎 Search index ready: %d posts (+%d / -%d) in %.2fs",
+        len(index), added, removed, time.perf_counter() - started,
+    )
+
+
+def _posts_marker(db: Session) -> Tuple[int, int]:
+    """(최대 id, 글 수) - 저장해 둔 피드가 DB와 같은지 확인용"""
+    max_id, count = db.query(func.max(Post.id), func.count(Post.id)).one()
+    return max_id or 0, count
+
+
+def _query_category_feeds(db: Session) -> Dict[str, List[Dict]]:
+    """분류별(+ 전체) 최신 CATEGORY_FEED_SIZE + 1개 목록 항목"""
+    columns = [getattr(Post, name) for name in LIST_VIEW_FIELDS]
+    order = (Post.created_at.desc(), Post.id.desc())
+    feeds = {
+        ALL_CATEGORIES: [
+            _row_to_dict(LIST_VIEW_FIELDS, row)
+            for row in db.query(*columns).order_by(*order).limit(CATEGORY_FEED_SIZE + 1)
+        ]
+    }
+    for (category,) in db.query(Post.category).distinct():
+        feeds[category] = [
+            _row_to_dict(LIST_VIEW_FIELDS, row)
+            for row in db.query(*columns).filter(Post.category == category).order_by(*order).limit(CATEGORY_FEED_SIZE + 1)
+        ]
+    return feeds
+
+
+def _read_data_version(db: Session) -> int:
+    return int(db.scalar(select_statement()) or 0)
+
+
+def build_category_feeds():
+    """분류별 최신 글 피드 만들기 (저장해 둔 파일이 DB와 같으면 그대로 사용)"""
+    started = time.perf_counter()
+    with SessionLocal() as db:
+        # 버전을 먼저 읽어서 피드가 실제 데이터보다 새 버전으로 표시되는 일이 없게
+        version = _read_data_version(db)
+        marker = _posts_marker(db)
+        if CATEGORY_FEEDS_PATH and category_feeds.load(CATEGORY_FEEDS_PATH, marker, version):
+            logger.info("📂 Category feeds loaded from %s", CATEGORY_FEEDS_PATH)
+            return
+        feeds = _query_category_feeds(db)
+    category_feeds.rebuild(feeds, version)
+    if CATEGORY_FEEDS_PATH:
+        save_category_feeds()
+    logger.info("📰 Category feeds built: %d categories in %.2fs", len(feeds) - 1, time.perf_counter() - started)
+
+
+def refresh_category_feeds():
+    """다른 워커가 글을 저장해서 데이터 버전이 앞서 나갔을 때 피드 다시 만들기"""
+    started = time.perf_counter()
+    with SessionLocal() as db:
+        version = _read_data_version(db)
+        feeds = _query_category_feeds(db)
+    category_feeds.rebuild(feeds, version)
+    logger.info("📰 Category feeds refreshed to data version %d in %.2fs", version, time.perf_counter() - started)
+
+
+_feeds_refresh: Optional[asyncio.Task] = None
+
+
+def _refresh_category_feeds_soon() -> None:
+    """피드 재구성을 백그라운드에서 한 번만 실행 (그동안 요청은 DB 조회로 처리)"""
+    global _feeds_refresh
+    if _feeds_refresh is None or _feeds_refresh.done():
+        _feeds_refresh = asyncio.create_task(asyncio.to_thread(refresh_category_feeds))
+
+
+def refresh_search_index():
+    """
+    다른 워커가 저장해서 데이터 버전이 앞서 나갔을 때 색인에 없는 글만 추가
+    (글은 추가만 되므로 id 목록만 비교, id 순서와 커밋 순서가 달라도 빠지지 않음)
+    """
+    global search_index_version
+    started = time.perf_counter()
+    index = search_index
+    with SessionLocal() as db:
+        version = _read_data_version(db)
+        missing = [post_id for (post_id,) in db.query(Post.id) if post_id not in index]
+    for post_id, title, summary, content, category in _load_index_posts(missing) if missing else ():
+        index.add(post_id, title, summary, content, category)
+    search_index_version = max(search_index_version or 0, version)
+    logger.info(
+        "🔎 Search index refreshed to data version %d (+%d) in %.2fs",
+        version, len(missing), time.perf_counter() - started,
+    )
+
+
+_search_refresh: Optional[asyncio.Task] = None
+
+
+def _search_index_ready(version: int) -> bool:
+    """n-gram 색인이 있고 version까지 반영돼 있는지 - 뒤처져 있으면 백그라운드 갱신 시작"""
+    global _search_refresh
+    if search_index is None:
+        return False
+    if search_index_version is not None and search_index_version >= version:
+        return True
+    if _search_refresh is None or _search_refresh.done():
+        _search_refresh = asyncio.create_task(asyncio.to_thread(refresh_search_index))
+    return False
+
+
+def save_category_feeds():
+    with SessionLocal() as db:
+        marker = _posts_marker(db)
+    category_feeds.save(CATEGORY_FEEDS_PATH, marker)
+
+
+async def _publish_posts(db: AsyncSession, post_ids: List[int], version: int) -> None:
+    """
+    새로 저장된 글을 이 워커의 읽기 경로에 반영 (version: 저장과 함께 올린 데이터 버전)
+    목록 응답 캐시 무효화, 분류별 피드 갱신, n-gram 색인 추가
+    다른 워커는 data_version을 확인해서 목록 캐시를 비운다 (get_posts)
+    """
+    global search_index_version
+    if not post_ids:
+        return
+    data_version.observe(version)
+    list_cache.sync(version)
+    result = await db.execute(select(*(getattr(Post, name) for name in POST_FIELDS)).where(Post.id.in_(post_ids)))
+    rows = result.all()
+    category_feeds.add([
+        {name: value for name, value in _row_to_dict(POST_FIELDS, row).items() if name in LIST_VIEW_FIELDS}
+        for row in rows
+    ], version)
+    if search_index is not None:
+        for row in rows:
+            search_index.add(row.id, row.title, row.summary, row.content, row.category)
+        # 바로 앞 버전까지 반영돼 있을 때만 앞으로 (사이에 다른 워커가 저장한 글이 있으면 refresh_search_index)
+        if search_index_version == version - 1:
+            search_index_version = version
 
 
 # FastAPI 앱 생성
@@ -370,28 +826,36 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "Link"],  # 목록 다음 페이지 커서
 )
+# 경로별 응답 시간 (GET /metrics)
+app.add_middleware(metrics.RequestMetricsMiddleware, histogram=metrics.HTTP_REQUEST_SECONDS)
 
 # 데이터베이스 세션 의존성
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
 # 데이터베이스 초기화 (테이블 생성)
 
 
 
-async def seed_database():
+SEED_VERSION = 1  # 시드 글 목록을 바꾸면 올리기 (새로 추가된 글만 들어감)
+SEED_DATABASE = os.getenv("SEED_DATABASE", "true").lower() in ("1", "true", "yes")
+
+
+def seed_database():
+    """
+    시드 글을 버전 단위로 한 번만 넣음 (기존 글은 지우지 않음)
+    app_meta.seed_version이 SEED_VERSION 이상이면 조회 한 번으로 끝난다.
+    """
     db = SessionLocal()
     try:
-        # 기존 데이터 모두 삭제 (스키마 변경으로 인한 리셋)
-        db.query(Post).delete()
-        db.commit()
-        print("Existing posts deleted for schema update")
+        meta = db.get(AppMeta, "seed_version")
+        if meta is not None and int(meta.value) >= SEED_VERSION:
+            return
+
         # 시드 데이터
         seed_posts = [
             {
@@ -431,14 +895,35 @@ async def seed_database():
             },
         ]
 
-        for post_data in seed_posts:
-            post = Post(**post_data)
-            db.add(post)
+        # 예전 방식(매번 삭제 후 재삽입)으로 들어간 시드 글은 dedup_key가 없으므로 제목으로 확인
+        titles = [post_data["title"] for post_data in seed_posts]
+        existing = {title for (title,) in db.query(Post.title).filter(Post.title.in_(titles))}
+        rows = [
+            {**post_data, "dedup_key": make_dedup_key(None, post_data["title"])}
+            for post_data in seed_posts
+            if post_data["title"] not in existing
+        ]
+        inserted = []
+        if rows:
+            statement = _insert_ignore_statement(engine.dialect.name, rows)
+            if statement is not None:
+                inserted = list(db.execute(statement).scalars())
+            else:
+                db.add_all([Post(**row) for row in rows])
+                db.flush()
+                inserted = rows
+        if inserted:
+            # 이미 떠 있는 다른 워커의 목록 캐시도 비워지도록
+            db.execute(bump_statement())
+        if meta is None:
+            db.add(AppMeta(key="seed_version", value=str(SEED_VERSION)))
+        else:
+            meta.value = str(SEED_VERSION)
         db.commit()
-        print("Database seeded with initial posts")
-    except Exception as e: 
+        logger.info("Database seeded: %d posts (seed version %d)", len(inserted), SEED_VERSION)
+    except Exception as e:
         db.rollback()
-        print(f"Error seeding database: {e}")
+        logger.exception("Error seeding database: %s", e)
     finally:
         db.close()
 
@@ -449,8 +934,11 @@ class GoogleNewsRSSClient:
     def __init__(self):
         # 한국 뉴스 RSS 피드
         self.base_url = "https://news.google.com/rss"
-        # 간단 버전에서는 기본 세션 사용
-        self.session = session
+        # 동기 경로는 공유 세션 사용 (호스트별 연결 풀)
+        self.session = http_clients.session()
+        # 조건부 요청/변경 감지 상태 - 수집이 끝난 뒤 commit_feed_state()로 저장
+        self.feed_state = feed_state
+        self._pending_validators: Dict[str, "tuple[str, FeedValidators]"] = {}
 
     def extract_article_content(self, url: str) -> str:
         """Trafilatura를 사용한 뉴스 본문 추출"""
@@ -459,10 +947,11 @@ class GoogleNewsRSSClient:
     def _extract_real_url(self, google_news_url: str) -> str:
         """Google News URL에서 실제 뉴스 URL 추출 (간소화된 버전)"""
         # 새로 만든 전문 디코더 사용 - self.session 전달!
+        # 이전에 본 URL은 디코딩 캐시에서 네트워크 없이 바로 반환됨
         return decode_google_news_url(google_news_url, self.session)
 
-    def get_news_by_topic(self, topic: str = "general") -> List[Dict]:
-        """Google News 검색 RSS에서 뉴스 가져오기"""
+    def _build_rss_url(self, topic: str) -> str:
+        """토픽에 해당하는 Google News 검색 RSS URL 생성"""
         # 토픽별 검색어 매핑 (더 안정적인 방식)
         topic_queries = {
             "business": "비즈니스 OR 경제 OR 기업 OR 금융",
@@ -483,285 +972,996 @@ class GoogleNewsRSSClient:
             rss_url = f"{base_url}{encoded_query}&hl=ko&gl=KR&ceid=KR:ko"
         else:
             rss_url = "https://news.google.com/rss?hl=ko&gl=KR&ceid=KR:ko"
+        return rss_url
+
+    def _parse_rss(self, rss_content: str) -> List[Dict]:
+        """RSS 텍스트를 기사 목록으로 변환 (url에는 아직 Google News 링크가 들어 있음)"""
+        # 가져온 RSS 텍스트를 feedparser로 파싱
+        feed = feedparser.parse(rss_content)
+
+        logger.debug("📰 Feed entries count: %d, title: %s", len(feed.entries), lazy(lambda: getattr(feed.feed, 'title', 'No title')))
+        # 상세한 디버깅 정보 - 피드 전체를 문자열로 만드는 값은 DEBUG일 때만 계산
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📡 Feed status: %s", getattr(feed, 'status', 'unknown'))
+            logger.debug("🔍 Feed keys: %s", list(feed.keys()))
+            logger.debug("📄 Raw feed data (first 500 chars): %.500s", feed)
+            if feed.entries:
+                logger.debug("✅ First entry keys: %s", list(feed.entries[0].keys()))
+                logger.debug("✅ First entry title: %s", getattr(feed.entries[0], 'title', 'No title'))
+
+        if hasattr(feed, 'bozo') and feed.bozo:
+            logger.warning("⚠️ Feed parsing error: %s", feed.bozo_exception)
+        if not feed.entries:
+            logger.warning("❌ No entries found in feed")
+
+        articles = []
+        for entry in feed.entries[:20]:  # 최대 20개 뉴스
+            # 이미지 URL 추출 개선
+            image_url = ""
+            if hasattr(entry, 'media_thumbnail') and entry.media_thumbnail:
+                image_url = entry.media_thumbnail[0].get('url', '')
+            elif hasattr(entry, 'media_content') and entry.media_content:
+                image_url = entry.media_content[0].get('url', '')
+            elif hasattr(entry, 'enclosures') and entry.enclosures:
+                for enclosure in entry.enclosures:
+                    if enclosure.get('type', '').startswith('image/'):
+                        image_url = enclosure.get('url', '')
+                        break
+
+            # 날짜 처리 개선
+            published_at = getattr(entry, 'published', '')
+            if published_at:
+                try:
+                    from email.utils import parsedate_to_datetime
+                    published_at = parsedate_to_datetime(published_at).isoformat()
+                except:
+                    published_at = datetime.now().isoformat()
+
+            article = {
+                "guid": getattr(entry, 'id', '') or entry.link,
+                "title": entry.title,
+                "description": getattr(entry, 'summary', ''),
+                "content": getattr(entry, 'summary', ''),  # RSS에서는 콘텐츠가 제한적
+                "url": entry.link,  # 실제 URL은 호출측에서 디코딩
+                "urlToImage": image_url,
+                "publishedAt": published_at
+            }
+            articles.append(article)
+        return articles
+
+    def get_news_by_topic(self, topic: str = "general") -> List[Dict]:
+        """Google News 검색 RSS에서 뉴스 가져오기"""
+        rss_url = self._build_rss_url(topic)
 
         try:
             # RSS 피드 파싱
-            print(f"🌐 Fetching RSS from: {rss_url}")  # 디버깅 로그
+            logger.debug("🌐 Fetching RSS from: %s", rss_url)
 
-            # SSL 검증 없이 RSS 가져오기 (requests 사용) - 강화된 SSL 우회
-            try:
-                # 첫 번째 시도: 일반적인 SSL 우회
-                response = self.session.get(rss_url, verify=False, timeout=30)
-                response.raise_for_status()
-                rss_content = response.text
-            except Exception as ssl_error:
-                print(f"⚠️ SSL 오류 발생, 인증서 검증 완전 우회 시도: {ssl_error}")
-                try:
-                    # 두 번째 시도: 더 강력한 SSL 우회
-                    import ssl
-                    from urllib3.util import ssl_
-
-                    # SSL 컨텍스트 생성 (인증서 검증 완전 비활성화)
-                    ssl_context = ssl.create_default_context()
-                    ssl_context.check_hostname = False
-                    ssl_context.verify_mode = ssl.CERT_NONE
-
-                    response = self.session.get(
-                        rss_url,
-                        verify=False,
-                        timeout=30,
-                        cert_reqs=ssl.CERT_NONE
-                    )
-                    response.raise_for_status()
-                    rss_content = response.text
-                except Exception as fallback_error:
-                    print(f"💥 SSL 우회 실패, 마지막 시도: {fallback_error}")
-                    # 세 번째 시도: urllib 사용
-                    try:
-                        import urllib.request
-                        import urllib.error
-
-                        req = urllib.request.Request(rss_url)
-                        req.add_header('User-Agent', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-                        with urllib.request.urlopen(req, timeout=30) as response:
-                            rss_content = response.read().decode('utf-8')
-                    except Exception as urllib_error:
-                        print(f"💥 모든 SSL 우회 방법 실패: {urllib_error}")
-                        return []
-
-            # 가져온 RSS 텍스트를 feedparser로 파싱
-            feed = feedparser.parse(rss_content)
-
-            # 상세한 디버깅 정보
-            print(f"📡 Feed status: {feed.status if hasattr(feed, 'status') else 'unknown'}")
-            print(f"📰 Feed entries count: {len(feed.entries)}")
-            print(f"📝 Feed title: {getattr(feed.feed, 'title', 'No title')}")
-            print(f"🔍 Feed keys: {list(feed.keys())}")
-            print(f"📄 Raw feed data (first 500 chars): {str(feed)[:500]}")
-
-            if hasattr(feed, 'bozo') and feed.bozo:
-                print(f"⚠️ Feed parsing error: {feed.bozo_exception}")
-
-            # entries 상세 정보
-            if feed.entries:
-                print(f"✅ First entry keys: {list(feed.entries[0].keys()) if feed.entries else 'No entries'}")
-                print(f"✅ First entry title: {getattr(feed.entries[0], 'title', 'No title') if feed.entries else 'No entries'}")
-            else:
-                print(f"❌ No entries found in feed")
-
-            articles = []
-            for entry in feed.entries[:20]:  # 최대 20개 뉴스
-                # 이미지 URL 추출 개선
-                image_url = ""
-                if hasattr(entry, 'media_thumbnail') and entry.media_thumbnail:
-                    image_url = entry.media_thumbnail[0].get('url', '')
-                elif hasattr(entry, 'media_content') and entry.media_content:
-                    image_url = entry.media_content[0].get('url', '')
-                elif hasattr(entry, 'enclosures') and entry.enclosures:
-                    for enclosure in entry.enclosures:
-                        if enclosure.get('type', '').startswith('image/'):
-                            image_url = enclosure.get('url', '')
-                            break
-
-                # 날짜 처리 개선
-                published_at = getattr(entry, 'published', '')
-                if published_at:
-                    try:
-                        from email.utils import parsedate_to_datetime
-                        published_at = parsedate_to_datetime(published_at).isoformat()
-                    except:
-                        published_at = datetime.now().isoformat()
+            # 공용 세션 + 호스트 스케줄러로 요청 (429/503이면 Retry-After만큼 기다렸다가 재시도)
+            response = http_clients.scheduler.run(
+                rss_url, lambda: self.session.get(rss_url, verify=False, timeout=30)
+            )
+            response.raise_for_status()
+            rss_content = response.text
 
+            articles = self._parse_rss(rss_content)
+            for article in articles:
                 # Google News 링크에서 실제 뉴스 URL 추출 시도
-                actual_url = self._extract_real_url(entry.link)
-
-                article = {
-                    "title": entry.title,
-                    "description": getattr(entry, 'summary', ''),
-                    "content": getattr(entry, 'summary', ''),  # RSS에서는 콘텐츠가 제한적
-                    "url": actual_url,  # 실제 뉴스 URL 사용
-                    "urlToImage": image_url,
-                    "publishedAt": published_at
-                }
-                articles.append(article)
-
-            print(f"✅ Returning {len(articles)} articles")
+                article["url"] = self._extract_real_url(article["url"])
+
+            logger.info("✅ Returning %d articles", len(articles))
             return articles
 
         except Exception as e:
-            print(f"💥 Error parsing RSS feed for {topic}: {e}")
-            import traceback
-            print(f"💥 Full traceback: {traceback.format_exc()}")
+            logger.exception("💥 Error parsing RSS feed for %s: %s", topic, e)
+            return []
+
+    async def get_news_by_topic_async(self, topic: str, http: httpx.AsyncClient) -> List[Dict]:
+        """
+        get_news_by_topic의 비동기 버전
+        - If-None-Match/If-Modified-Since 조건부 요청, 304나 본문 해시가 같으면 빈 목록
+        - 이미 수집한 guid의 기사는 제외
+        링크 디코딩은 하지 않음 - 정렬/선별 후 resolve_urls_async로 살아남은 기사만 변환
+        """
+        rss_url = self._build_rss_url(topic)
+        previous = self.feed_state.get_validators(rss_url)
+
+        headers = {}
+        if previous.etag:
+            headers["If-None-Match"] = previous.etag
+        if previous.last_modified:
+            headers["If-Modified-Since"] = previous.last_modified
+
+        try:
+            logger.debug("🌐 Fetching RSS from: %s", rss_url)
+            response = await http_clients.scheduler.arun(
+                rss_url, lambda: http.get(rss_url, headers=headers, timeout=30)
+            )
+            if response.status_code == 304:
+                logger.info("⏭️ Feed not modified (304): %s", topic)
+                return []
+            response.raise_for_status()
+
+            body_hash = hashlib.sha256(response.content).hexdigest()
+            validators = FeedValidators(
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                body_hash=body_hash,
+            )
+            if body_hash == previous.body_hash:
+                logger.info("⏭️ Feed body unchanged: %s", topic)
+                self.feed_state.save_validators(rss_url, validators)
+                return []
+            self._pending_validators[topic] = (rss_url, validators)
+
+            articles = await asyncio.to_thread(self._parse_rss, response.text)
+
+            unseen = self.feed_state.filter_unseen(article["guid"] for article in articles)
+            new_articles = [article for article in articles if article["guid"] in unseen]
+            logger.info(
+                "✅ Returning %d new articles (%d already ingested)", len(new_articles), len(articles) - len(new_articles)
+            )
+            return new_articles
+
+        except Exception as e:
+            logger.warning("💥 Error parsing RSS feed for %s: %r", topic, e)
             return []
-        
+
+    def commit_feed_state(self, topic: Optional[str] = None) -> None:
+        """
+        수집이 끝난 피드의 ETag/Last-Modified/해시 저장 (다음 실행부터 조건부 요청)
+        topic을 주면 해당 카테고리만 저장
+        """
+        topics = [topic] if topic is not None else list(self._pending_validators)
+        for name in topics:
+            pending = self._pending_validators.pop(name, None)
+            if pending is not None:
+                rss_url, validators = pending
+                self.feed_state.save_validators(rss_url, validators)
+
+    def discard_feed_state(self, topic: str) -> None:
+        """처리에 실패한 피드는 다음 실행에서 다시 받도록 상태를 저장하지 않음"""
+        self._pending_validators.pop(topic, None)
+
+    async def resolve_urls_async(self, articles: List[Dict], http: httpx.AsyncClient) -> Dict[str, int]:
+        """
+        기사들의 Google News 링크를 실제 URL로 일괄 변환 (article["url"]을 직접 수정)
+        캐시/오프라인 디코딩으로 풀리는 링크는 네트워크 없이 처리하고,
+        나머지만 모아서 /decode_batch/ 한 번으로 요청한다.
+        반환: 방법별 변환 수 (cache, offline, batch, redirect, failed)
+        """
+        counts = {"cache": 0, "offline": 0, "batch": 0, "redirect": 0, "failed": 0}
+        pending: Dict[str, List[Dict]] = {}
+        for article in articles:
+            url = article.get("url", "")
+            if not url or "google.com" not in url:
+                continue
+
+            cached = url_cache.get(url)
+            if cached is not None:
+                article["url"] = cached
+                counts["cache"] += 1
+                continue
+
+            real_url = _decode_article_id_offline(url)
+            if real_url:
+                url_cache.put(url, real_url)
+                article["url"] = real_url
+                counts["offline"] += 1
+                continue
+
+            pending.setdefault(url, []).append(article)
+
+        if not pending:
+            return _count_decodes(counts)
+
+        with metrics.INGEST_STAGE_SECONDS.time(stage="decode.batch"):
+            decoded = await _decode_batch_async(list(pending), http)
+        counts["batch"] = len(decoded)
+
+        # 배치에서 실패한 링크만 리다이렉트로 재시도
+        failed = [url for url in pending if url not in decoded]
+        redirected: List[Optional[str]] = []
+        if failed:
+            with metrics.INGEST_STAGE_SECONDS.time(stage="decode.redirect"):
+                redirected = await asyncio.gather(*(_resolve_by_redirect_async(url, http) for url in failed))
+        resolved = {url: real_url for url, real_url in zip(failed, redirected) if real_url}
+        decoded.update(resolved)
+        counts["redirect"] = len(resolved)
+        counts["failed"] = len(failed) - len(resolved)
+
+        for url, group in pending.items():
+            real_url = decoded.get(url)
+            url_cache.put(url, real_url)
+            for article in group:
+                article["url"] = real_url or url
+        return _count_decodes(counts)
+
+
+
+def _count_decodes(counts: Dict[str, int]) -> Dict[str, int]:
+    for method, count in counts.items():
+        if count:
+            metrics.URL_DECODES.inc(count, method=method)
+    return counts
+
+
+# 백그라운드 수집 작업
+class IngestJob:
+    """
+    뉴스 수집 작업 하나의 진행 상태 (실행하는 워커의 메모리)
+    ingest_jobs 테이블에 주기적으로 저장하고, GET /api/news/jobs/{id}는 어느 워커든 테이블에서 읽는다
+    """
+
+    def __init__(self, categories: List[str]):
+        self.id = uuid.uuid4().hex
+        self.status = "pending"  # pending -> running -> completed | failed
+        self.categories = list(categories)
+        self.categories_done: List[str] = []
+        self.articles_processed = 0
+        self.articles_saved = 0
+        self.merged_requests = 0  # 실행 중에 들어와 이 작업에 합쳐진 요청 수
+        self.stage_timings: Dict[str, float] = {}  # 단계별 누적 소요 시간(초)
+        self.extractor_wins: Dict[str, int] = {}  # 추출기별 성공 횟수 ("none"은 모두 실패)
+        self.counters: Dict[str, int] = {}  # decode.<방법>, download.<결과> 등 횟수
+        self.created_at = datetime.now()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.error: Optional[str] = None
+
+    @contextmanager
+    def stage(self, name: str):
+        """with job.stage("extract"): ... 형태로 단계별 소요 시간 누적 (metrics 히스토그램에도 기록)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._add_timing(name, time.perf_counter() - started)
+
+    def _add_timing(self, name: str, seconds: float) -> None:
+        self.stage_timings[name] = self.stage_timings.get(name, 0.0) + seconds
+        metrics.INGEST_STAGE_SECONDS.observe(seconds, stage=name)
+
+    def count(self, name: str, amount: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def record_extraction(self, result: ExtractionResult) -> None:
+        """본문 추출 결과 반영 - 다운로드/추출기별 시간은 extract.<이름> 단계로 누적"""
+        for name, seconds in result.timings.items():
+            self._add_timing(f"extract.{name}", seconds)
+            if name != "download":
+                metrics.EXTRACTOR_SECONDS.observe(seconds, extractor=name)
+        if "download" in result.timings:
+            # 다운로드에 실패하면 추출기가 돌지 않아서 download 시간만 남는다
+            self.count("download.ok" if len(result.timings) > 1 else "download.failed")
+        winner = result.extractor or "none"
+        self.extractor_wins[winner] = self.extractor_wins.get(winner, 0) + 1
+        metrics.EXTRACTOR_WINS.inc(extractor=winner)
+
+    @property
+    def is_active(self) -> bool:
+        return self.status in ACTIVE_JOB_STATUSES
+
+    def progress(self) -> Dict:
+        """ingest_jobs.progress에 저장할 진행 상황 (JSON)"""
+        return {
+            "categories": self.categories,
+            "categories_done": self.categories_done,
+            "articles_processed": self.articles_processed,
+            "articles_saved": self.articles_saved,
+            "stage_timings": {name: round(value, 3) for name, value in self.stage_timings.items()},
+            "extractor_wins": self.extractor_wins,
+            "counters": self.counters,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+
+ACTIVE_JOB_STATUSES = ("pending", "running")
+
+
+class IngestJobResponse(BaseModel):
+    id: str
+    status: str
+    categories_total: int
+    categories_done: List[str]
+    articles_processed: int
+    articles_saved: int
+    merged_requests: int
+    stage_timings: Dict[str, float]
+    extractor_wins: Dict[str, int]
+    counters: Dict[str, int]
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    elapsed_seconds: Optional[float] = None
+    error: Optional[str] = None
+
+    @classmethod
+    def from_record(cls, record: IngestJobRecord) -> "IngestJobResponse":
+        progress = json.loads(record.progress)
+        started_at = _parse_job_time(progress["started_at"])
+        finished_at = _parse_job_time(progress["finished_at"])
+        status, error = record.status, record.error
+        if status in ACTIVE_JOB_STATUSES and _is_stale_job(record):
+            status, error = "failed", STALE_JOB_ERROR
+        elapsed = None
+        if started_at:
+            elapsed = ((finished_at or datetime.now()) - started_at).total_seconds()
+        return cls(
+            id=record.id,
+            status=status,
+            categories_total=len(progress["categories"]),
+            categories_done=progress["categories_done"],
+            articles_processed=progress["articles_processed"],
+            articles_saved=progress["articles_saved"],
+            merged_requests=record.merged_requests,
+            stage_timings=progress["stage_timings"],
+            extractor_wins=progress["extractor_wins"],
+            counters=progress["counters"],
+            created_at=record.created_at,
+            started_at=started_at,
+            finished_at=finished_at,
+            elapsed_seconds=round(elapsed, 3) if elapsed is not None else None,
+            error=error,
+        )
+
+
+def _parse_job_time(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+NEWS_CATEGORIES = ["business", "technology", "science", "health", "entertainment"]
+MAX_TRACKED_JOBS = 50  # ingest_jobs 테이블에 보관할 최근 작업 수
+
+# 실행 중인 워커가 진행 상황/heartbeat를 저장하는 간격, 이보다 오래 갱신이 없으면 워커가 죽은 것으로 봄
+INGEST_JOB_SAVE_SECONDS = float(os.getenv("INGEST_JOB_SAVE_SECONDS", "1"))
+INGEST_JOB_STALE_SECONDS = float(os.getenv("INGEST_JOB_STALE_SECONDS", "60"))
+STALE_JOB_ERROR = "Worker running this job stopped responding"
+# SQLite 등 advisory lock이 없는 DB에서 워커 간 수집 작업 등록 잠금 파일
+INGEST_LOCK_PATH = os.getenv("INGEST_LOCK_PATH", os.path.join(BASE_DIR, ".ingest.lock"))
+
+_ingest_tasks: Dict[str, asyncio.Task] = {}  # 이 워커에서 실행 중인 태스크 참조 (GC 방지)
+
+
+def _is_stale_job(record: IngestJobRecord) -> bool:
+    return record.updated_at < datetime.now() - timedelta(seconds=INGEST_JOB_STALE_SECONDS)
+
+
+def _claim_ingest_job() -> Tuple[Optional[IngestJob], str, str]:
+    """
+    워커 간 잠금 안에서 실행 중인 작업을 확인하고 없으면 새 작업 등록 (스레드에서 실행)
+    heartbeat가 끊긴 작업은 failed로 정리한다.
+    반환: (새로 만든 작업 또는 None(기존 작업에 합류), 작업 id, 상태)
+    """
+    with startup_lock(engine, INGEST_LOCK_PATH, INGEST_LOCK_KEY), SessionLocal() as db:
+        active = (
+            db.query(IngestJobRecord)
+            .filter(IngestJobRecord.status.in_(ACTIVE_JOB_STATUSES))
+            .order_by(IngestJobRecord.created_at.desc())
+            .all()
+        )
+        running = None
+        for record in active:
+            if _is_stale_job(record):
+                record.status, record.error = "failed", STALE_JOB_ERROR
+            elif running is None:
+                running = record
+        if running is not None:
+            running.merged_requests += 1
+            db.commit()
+            return None, running.id, running.status
+
+        job = IngestJob(NEWS_CATEGORIES)
+        db.add(IngestJobRecord(
+            id=job.id,
+            status=job.status,
+            merged_requests=0,
+            progress=json.dumps(job.progress()),
+            created_at=job.created_at,
+            updated_at=job.created_at,
+        ))
+        db.flush()
+        keep = select(IngestJobRecord.id).order_by(IngestJobRecord.created_at.desc()).limit(MAX_TRACKED_JOBS)
+        db.query(IngestJobRecord).filter(IngestJobRecord.id.not_in(keep)).delete(synchronize_session=False)
+        db.commit()
+        return job, job.id, job.status
+
+
+async def _save_ingest_job(job: IngestJob) -> None:
+    """진행 상황과 heartbeat 저장 (실패해도 수집은 계속)"""
+    try:
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(IngestJobRecord)
+                .where(IngestJobRecord.id == job.id)
+                .values(status=job.status, progress=json.dumps(job.progress()), error=job.error, updated_at=datetime.now())
+            )
+            await db.commit()
+    except Exception as e:
+        logger.warning("⚠️ Failed to save ingest job %s: %r", job.id, e)
 
 
+async def _save_ingest_job_periodically(job: IngestJob) -> None:
+    while True:
+        await asyncio.sleep(INGEST_JOB_SAVE_SECONDS)
+        await _save_ingest_job(job)
 
 
+async def _run_ingest_job(job: IngestJob) -> None:
+    """백그라운드에서 수집 실행 - 요청 세션과 분리된 자체 DB 세션 사용"""
+    job.status = "running"
+    job.started_at = datetime.now()
+    await _save_ingest_job(job)
+    saver = asyncio.create_task(_save_ingest_job_periodically(job))
+    try:
+        async with AsyncSessionLocal() as db:
+            await fetch_and_store_news(db, job)
+        job.status = "completed"
+    except asyncio.CancelledError:
+        # 서버 종료 - 다른 워커가 heartbeat 만료를 기다리지 않고 새 작업을 시작할 수 있게
+        job.status = "failed"
+        job.error = "Cancelled by server shutdown"
+        raise
+    except Exception as e:
+        job.status = "failed"
+        job.error = repr(e)
+        logger.exception("💥 Ingest job %s failed: %r", job.id, e)
+    finally:
+        job.finished_at = datetime.now()
+        saver.cancel()
+        await _save_ingest_job(job)
+        _ingest_tasks.pop(job.id, None)
 
 
+async def cancel_ingest_jobs() -> None:
+    """이 워커에서 실행 중인 수집 작업 취소 (상태는 failed로 저장)"""
+    tasks = list(_ingest_tasks.values())
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def start_ingest_job() -> Tuple[str, str, bool]:
+    """
+    수집 작업 시작. 어느 워커에서든 이미 실행 중인 작업이 있으면 새로 만들지 않고 합류시킨다.
+    반환값: (작업 id, 상태, 기존 작업에 합쳐졌는지 여부)
+    """
+    job, job_id, status = await asyncio.to_thread(_claim_ingest_job)
+    if job is None:
+        return job_id, status, True
+    _ingest_tasks[job.id] = asyncio.create_task(_run_ingest_job(job))
+    return job_id, status, False
+
 
 # News fetch, save Func
-async def fetch_and_store_news(db: Session):
-    """Google News RSS에서 뉴스를 가져와서 데이터베이스에 저장"""
-    client = GoogleNewsRSSClient()
+def _clean_description(description: str) -> str:
+    """RSS 요약에서 HTML 태그 제거"""
+    if not description:
+        return ""
+    soup = BeautifulSoup(description, 'html.parser')
+    return ' '.join(soup.get_text().strip().split())
 
-    # 여러 카테고리의 뉴스 가져오기
-    categories = ["business", "technology", "science", "health", "entertainment"]
 
-    total_processed = 0
-    total_saved = 0
+def _parse_published_at(value: str) -> Optional[datetime]:
+    """RSS 발행 시각(ISO 문자열) -> UTC naive datetime (DB TIMESTAMP 컬럼용)"""
+    if not value:
+        return None
+    try:
+        published = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if published.tzinfo is not None:
+        published = published.astimezone(timezone.utc).replace(tzinfo=None)
+    return published
+
+
+async def _prepare_article(
+    article: Dict,
+    category: str,
+    http: httpx.AsyncClient,
+    limiter: asyncio.Semaphore,
+    job: IngestJob,
+) -> Dict:
+    """기사 하나의 본문 추출 및 저장용 데이터 구성 (limiter로 동시 작업 수 제한)"""
+    async with limiter:
+        title = article.get("title", "").strip()
+        description = _clean_description(article.get("description", "").strip())
+        logger.debug("📰 Processing article: %.50s...", title)
+
+        # 본문 추출 시도
+        news_url = article.get("url", "")
+        content = description  # 기본값으로 RSS 요약 사용
+
+        # 실제 본문 추출 시도
+        if news_url:
+            try:
+                result = await extract_news_content_async(news_url, http)
+                job.record_extraction(result)
+                extracted_content = result.text
+                if extracted_content and len(extracted_content.strip()) > 50:
+                    content = extracted_content
+                    logger.info("✅ 본문 추출 성공: %d자", len(content), extra=SAMPLED)
+                else:
+                    logger.info("⚠️ 본문 추출 실패, RSS 요약 사용", extra=SAMPLED)
+            except ArticleThrottled:
+                # RSS 요약으로 저장하면 guid가 처리된 것으로 남으므로 이 기사는 건너뜀
+                job.count("download.throttled")
+                raise
+            except Exception as e:
+                logger.warning("💥 본문 추출 오류: %s, RSS 요약 사용", e)
+
+    job.articles_processed += 1
+    metrics.INGEST_ARTICLES.inc(result="processed")
+
+    full_content = content
+    if news_url:
+        full_content += f"\n\n🔗 전체 기사 보기: {news_url}"
+
+    image_url = article.get("urlToImage", "")
+    if not image_url:
+        image_url = "https://images.unsplash.com/photo-1504711434969-e33886168f5c?auto=format&fit=crop&q=80&w=800"
+
+    return {
+        "guid": article.get("guid", ""),
+        "dedup_key": make_dedup_key(news_url, title),
+        "title": title[:200],
+        "summary": description[:300],
+        "content": full_content,
+        "category": category.capitalize(),
+        "image_url": image_url,
+        "published_at": _parse_published_at(article.get("publishedAt", "")),
+    }
 
-    for category in categories:
-        print(f"🔍 Fetching {category} news...")  # 디버깅 로그
-        articles = client.get_news_by_topic(topic=category)
-        print(f"📊 Found {len(articles)} articles for {category}")  # 디버깅 로그
 
-        # 최신순으로 정렬하고 5개로 제한
-        print(f"🔢 Before sorting: {len(articles)} articles")  # 디버깅 로그
-        try:
-            articles = sorted(articles, key=get_sort_key, reverse=True)[:5]
-            print(f"✅ After sorting and limiting: {len(articles)} articles")  # 디버깅 로그
-        except Exception as sort_err:
-            print(f"❌ Sorting failed: {sort_err}")  # 디버깅 로그
-            # 정렬 실패시 그냥 처음 5개 사용
-            articles = articles[:5]
-        print(f"📊 Processing {len(articles)} most recent articles for {category}")  # 디버깅 로그
+async def _collect_category(
+    client: "GoogleNewsRSSClient",
+    category: str,
+    http: httpx.AsyncClient,
+    limiter: asyncio.Semaphore,
+    job: IngestJob,
+) -> List[Dict]:
+    """카테고리 하나: 피드 수집 -> 최신 5개 선별 -> URL 일괄 변환 -> 본문 추출"""
+    with job.stage("feed"):
+        articles = await client.get_news_by_topic_async(category, http)
+    logger.info("📊 Found %d articles for %s", len(articles), category)
 
-        try:
+    # 최신순으로 정렬하고 5개로 제한
+    try:
+        articles = sorted(articles, key=get_sort_key, reverse=True)[:5]
+    except Exception as sort_err:
+        logger.warning("❌ Sorting failed: %s", sort_err)
+        # 정렬 실패시 그냥 처음 5개 사용
+        articles = articles[:5]
+
+    # 선별된 기사만 실제 URL로 변환 (한 번의 배치 호출)
+    with job.stage("decode"):
+        decode_counts = await client.resolve_urls_async(articles, http)
+    for method, count in decode_counts.items():
+        if count:
+            job.count(f"decode.{method}", count)
+
+    results = await asyncio.gather(
+        *(_prepare_article(article, category, http, limiter, job) for article in articles),
+        return_exceptions=True,
+    )
+
+    posts = []
+    for result in results:
+        if isinstance(result, ArticleThrottled):
+            # guid를 기록하지 않고 피드 상태도 버려서 다음 실행에서 다시 받음
+            logger.warning("⏳ Article host throttled, retry next run (%s): %s", category, result)
+            client.discard_feed_state(category)
+            continue
+        if isinstance(result, Exception):
+            logger.error("💥 Error processing %s article: %r", category, result)
+            client.discard_feed_state(category)
+            continue
+        posts.append(result)
 
-            for i, article in enumerate(articles):
-                title = article.get("title", "").strip()
-                description = article.get("description", "").strip()
-
-                # HTML 태그 제거만 하고 끝
-                if description:
-                    soup = BeautifulSoup(description, 'html.parser')
-                    description = soup.get_text().strip()
-                    description = ' '.join(description.split())
-
-                total_processed += 1
-                print(f"📰 Processing article {i+1}: {title[:50]}...")
-
-                # 본문 추출 시도
-                news_url = article.get("url", "")
-                content = description  # 기본값으로 RSS 요약 사용
-
-                # 실제 본문 추출 시도
-                if news_url:
-                    try:
-                        extracted_content = client.extract_article_content(news_url)
-                        if extracted_content and len(extracted_content.strip()) > 50:
-                            content = extracted_content
-                            print(f"✅ 본문 추출 성공: {len(content)}자")
-                        else:
-                            print("⚠️ 본문 추출 실패, RSS 요약 사용")
-                    except Exception as e:
-                        print(f"💥 본문 추출 오류: {e}, RSS 요약 사용")
-
-                # 중복 체크 간단하게
-                existing = db.query(Post).filter(Post.title == title).first()
-                if existing:
-                    print(f"🔄 Skipped: Already exists - {title[:30]}...")
-                    continue
+    job.categories_done.append(category)
+    return posts
+
+
+DEDUP_QUERY_CHUNK = 500  # IN (...) 한 번에 넣을 키 개수
+
+
+async def _filter_new_posts(db: AsyncSession, posts: List[Dict]) -> List[Dict]:
+    """
+    배치 단위 중복 제거
+    배치 안의 같은 키는 하나만 남기고, DB에 이미 있는 키는 dedup_key IN (...) 조회로 한 번에 걸러냄
+    """
+    unique: Dict[str, Dict] = {}
+    for post_data in posts:
+        unique.setdefault(post_data["dedup_key"], post_data)
 
-                # 저장
-                full_content = content
-                if news_url:
-                    full_content += f"\n\n🔗 전체 기사 보기: {news_url}"
-
-                image_url = article.get("urlToImage", "")
-                if not image_url:
-                    image_url = "https://images.unsplash.com/photo-1504711434969-e33886168f5c?auto=format&fit=crop&q=80&w=800"
-
-                post_data = {
-                    "title": title[:200],
-                    "summary": description[:300],
-                    "content": full_content,
-                    "category": category.capitalize(),
-                    "image_url": image_url
-                }
-
-                db_post = Post(**post_data)
-                db.add(db_post)
-                total_saved += 1
-                print(f"✅ Saved article: {title[:30]}...")
-                
+    keys = list(unique)
+    existing = set()
+    for start in range(0, len(keys), DEDUP_QUERY_CHUNK):
+        chunk = keys[start:start + DEDUP_QUERY_CHUNK]
+        result = await db.execute(select(Post.dedup_key).where(Post.dedup_key.in_(chunk)))
+        existing.update(result.scalars())
+
+    skipped = len(posts) - len(unique) + len(existing)
+    if skipped:
+        logger.info("🔄 Skipped %d duplicate articles", skipped)
+    return [post_data for key, post_data in unique.items() if key not in existing]
+
+
+def _insert_ignore_statement(dialect: str, rows: List[Dict]):
+    """
+    INSERT ... ON CONFLICT (dedup_key) DO NOTHING RETURNING id
+    지원하지 않는 DB(SQLite/PostgreSQL 외)는 None
+    """
+    if dialect not in ("sqlite", "postgresql"):
+        return None
+    insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+    return (
+        insert(Post)
+        .values(rows)
+        .on_conflict_do_nothing(index_elements=[Post.dedup_key])
+        .returning(Post.id)
+    )
+
+
+async def _insert_posts(db: AsyncSession, rows: List[Dict]) -> List[int]:
+    """한 문장으로 저장하고 새로 들어간 id 반환, 지원하지 않는 DB는 키 조회 후 add_all"""
+    statement = _insert_ignore_statement(db.bind.dialect.name, rows)
+    if statement is not None:
+        return list((await db.execute(statement)).scalars())
+
+    new_posts = [Post(**row) for row in await _filter_new_posts(db, rows)]
+    db.add_all(new_posts)
+    await db.flush()
+    return [post.id for post in new_posts]
+
+
+async def _store_posts(db: AsyncSession, posts: List[Dict]) -> Tuple[List[int], List[str]]:
+    """
+    준비된 기사들을 INGEST_WRITE_CHUNK개씩 나눠서 저장하고 청크마다 커밋
+    실패한 청크만 롤백하고 나머지는 계속 저장한다.
+    반환: (새로 저장된 post id 목록, 저장이 끝난 청크의 guid 목록)
+    """
+    inserted_ids: List[int] = []
+    stored_guids: List[str] = []
+    for start in range(0, len(posts), INGEST_WRITE_CHUNK):
+        chunk = posts[start:start + INGEST_WRITE_CHUNK]
+        rows = [{key: value for key, value in post.items() if key != "guid"} for post in chunk]
+        try:
+            ids = await _insert_posts(db, rows)
+            # 데이터 버전은 저장과 같은 트랜잭션에서 올림 (다른 워커가 캐시를 비우는 기준)
+            version = await data_version.bump(db) if ids else 0
+            await db.commit()
         except Exception as e:
-            print(f"💥 Error fetching {category} news: {e}")
+            await db.rollback()
+            logger.exception("💥 Error saving %d articles: %s", len(chunk), e)
             continue
 
-    try:
-        db.commit()
-        print(f"🎉 Total processed: {total_processed}, Total saved: {total_saved}")  # 최종 결과 로그
-        print("News fetched and stored successfully")
-    except Exception as e:
-        db.rollback()
-        print(f"💥 Error saving news to database: {e}")
+        await _publish_posts(db, ids, version)
+        inserted_ids.extend(ids)
+        stored_guids.extend(post["guid"] for post in chunk)
+        skipped = len(chunk) - len(ids)
+        logger.info("✅ Saved %d articles (🔄 skipped %d duplicates)", len(ids), skipped)
+    return inserted_ids, stored_guids
+
+
+async def fetch_and_store_news(db: AsyncSession, job: Optional[IngestJob] = None):
+    """
+    Google News RSS에서 뉴스를 가져와서 데이터베이스에 저장
+    카테고리 피드는 동시에 가져오고, 기사별 디코딩/본문 추출은
+    INGEST_CONCURRENCY 크기의 작업 풀에서 병렬로 처리
+    저장은 수집이 끝난 카테고리부터 청크 단위로 커밋
+    """
+    client = GoogleNewsRSSClient()
+    if job is None:
+        job = IngestJob(NEWS_CATEGORIES)
+    limiter = asyncio.Semaphore(INGEST_CONCURRENCY)
+
+    async def collect(category: str):
+        return category, await _collect_category(client, category, http, limiter, job)
+
+    # 프로세스 공유 클라이언트 - 이전 실행에서 맺은 연결(TLS 포함)을 그대로 재사용
+    http = http_clients.client()
+
+    # 여러 카테고리를 동시에 수집하고, 끝난 카테고리부터 바로 저장
+    for finished in asyncio.as_completed([collect(category) for category in job.categories]):
+        category, posts = await finished
+        if not posts:
+            client.commit_feed_state(category)
+            continue
+
+        with job.stage("store"):
+            inserted_ids, stored_guids = await _store_posts(db, posts)
+        job.articles_saved += len(inserted_ids)
+        metrics.INGEST_ARTICLES.inc(len(inserted_ids), result="saved")
+
+        # 저장에 성공한 기사만 guid 기록, 피드 상태는 전부 저장된 경우에만 기록
+        # (실패한 청크의 기사는 다음 실행에서 다시 처리)
+        feed_state.mark_seen(stored_guids)
+        if len(stored_guids) == len(posts):
+            client.commit_feed_state(category)
+        else:
+            client.discard_feed_state(category)
+
+    if search_index is not None and job.articles_saved:
+        await asyncio.to_thread(search_index.save, SEARCH_INDEX_PATH)
+    if CATEGORY_FEEDS_PATH and job.articles_saved:
+        await asyncio.to_thread(save_category_feeds)
+    logger.info("🎉 Total processed: %d, Total saved: %d", job.articles_processed, job.articles_saved)
 
 # API 앤드 포인트들
-@app.get("/api/posts", response_model=List[PostResponse])
+POSTS_DEFAULT_LIMIT = 50
+POSTS_MAX_LIMIT = 200
+
+# fields= 로 고를 수 있는 컬럼 (id, created_at은 커서 계산에 필요해서 항상 포함)
+POST_FIELDS = ("id", "title", "summary", "content", "category", "image_url", "created_at", "published_at")
+# 목록 화면(카드)용 필드 - 본문(content)은 읽지 않음
+LIST_VIEW_FIELDS = ("id", "title", "summary", "category", "image_url", "created_at", "published_at")
+
+
+def _parse_fields(fields: Optional[str]) -> List[str]:
+    """fields=list 또는 fields=title,summary,... -> 조회할 컬럼 이름 목록"""
+    if not fields:
+        return list(POST_FIELDS)
+    if fields == "list":
+        return list(LIST_VIEW_FIELDS)
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in requested if name not in POST_FIELDS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown field(s): {', '.join(unknown)}")
+    return [name for name in POST_FIELDS if name in ("id", "created_at") or name in requested]
+
+
+def _encode_cursor(created_at: datetime, post_id: int) -> str:
+    raw = f"{created_at.isoformat()}|{post_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str):
+    """커서 -> (created_at, id), 형식이 잘못되면 400"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        created_at, post_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(post_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+# 읽기 API 응답 캐시 - 목록은 데이터가 바뀔 때마다(bump) 비우고, 상세는 글이 바뀌지 않으므로 id별로 유지
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "512"))
+POST_CACHE_SIZE = 1024  # 상세 응답 캐시에 보관할 글 수
+list_cache = ResponseCache(RESPONSE_CACHE_MAX_ENTRIES)
+post_cache = ResponseCache(POST_CACHE_SIZE)
+# 워커 간 공유 데이터 버전 (app_meta) - 이 간격마다 한 번 읽어서 목록 캐시가 최신인지 확인
+DATA_VERSION_POLL_SECONDS = float(os.getenv("DATA_VERSION_POLL_SECONDS", "1"))
+data_version = DataVersion(DATA_VERSION_POLL_SECONDS)
+
+# 분류별 최신 글 피드 (fields=list 첫 페이지 요청을 DB 조회 없이 처리)
+CATEGORY_FEED_SIZE = int(os.getenv("CATEGORY_FEED_SIZE", "100"))
+CATEGORY_FEEDS_PATH = os.getenv("CATEGORY_FEEDS_PATH", "")  # 비워 두면 파일로 저장하지 않음
+
+
+def _feed_headers(category: str, limit: int, page: List[Dict], has_more: bool) -> Dict[str, str]:
+    """미리 만든 피드 페이지의 다음 페이지 헤더 (get_posts와 같은 형식)"""
+    if not has_more:
+        return {}
+    last = page[-1]
+    next_cursor = _encode_cursor(datetime.fromisoformat(last["created_at"]), last["id"])
+    params = {**({"category": category} if category else {}), "fields": "list", "limit": limit, "cursor": next_cursor}
+    return {"X-Next-Cursor": next_cursor, "Link": f'</api/posts?{urlencode(params)}>; rel="next"'}
+
+
+category_feeds = CategoryFeeds(CATEGORY_FEED_SIZE, POSTS_DEFAULT_LIMIT, _feed_headers)
+
+
+def _cache_key(request: Request) -> str:
+    return f"{request.url.path}?{'&'.join(sorted(f'{k}={v}' for k, v in request.query_params.multi_items()))}"
+
+
+def _cached_response(request: Request, cached: CachedResponse) -> Response:
+    """If-None-Match가 같으면 304, 아니면 캐시된 JSON 그대로"""
+    headers = {"ETag": cached.etag, "Cache-Control": CACHE_CONTROL, **cached.headers}
+    if etag_matches(request.headers.get("if-none-match"), cached.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+
+@app.get("/api/posts")
 async def get_posts(
+    request: Request,
     category: Optional[str] = Query(None),
     search: Optional[str] = Query(None),
-    db: Session = Depends(get_db)
+    limit: int = Query(POSTS_DEFAULT_LIMIT, ge=1, le=POSTS_MAX_LIMIT),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+    fields: Optional[str] = Query(None, description="list 또는 쉼표로 구분한 필드 이름"),
+    db: AsyncSession = Depends(get_db)
 ):
-    query = db.query(Post)
+    """
+    최신순 글 목록 (created_at, id 기준 키셋 페이지네이션)
+    응답 본문은 기존처럼 배열이고, 다음 페이지가 있으면 X-Next-Cursor / Link 헤더로 알려준다.
+    search가 있으면 전문 검색 인덱스로 관련도 순 상위 limit개를 돌려주고
+    각 항목에 검색어가 <mark>로 표시된 snippet 필드를 붙인다.
+    같은 쿼리의 응답은 데이터가 바뀔 때까지 캐시에서 바로 돌려준다 (ETag/304).
+    다른 워커가 저장한 글은 DATA_VERSION_POLL_SECONDS 안에 반영된다.
+    """
+    version = await data_version.current(db)
+    list_cache.sync(version)
+    if fields == "list" and not search and not cursor:
+        # 목록 화면 첫 페이지는 미리 만든 분류별 피드에서 바로
+        cached = category_feeds.page(category, limit, version)
+        if cached is not None:
+            return _cached_response(request, cached)
+        if category_feeds.is_stale(version):
+            _refresh_category_feeds_soon()
+
+    # 색인이 뒤처져 있으면 갱신되는 동안 DB 전문 검색으로 (지난 검색 결과를 새 버전으로 캐시하지 않도록)
+    index = search_index if search and _search_index_ready(version) else None
+
+    key = _cache_key(request)
+    cached = list_cache.get(key)
+    if cached is None:
+        version = list_cache.version
+        items, headers = await _list_posts(request, db, category, search, limit, cursor, fields, index)
+        cached = list_cache.put(key, items, headers, version=version)
+    return _cached_response(request, cached)
+
+
+async def _list_posts(
+    request: Request,
+    db: AsyncSession,
+    category: Optional[str],
+    search: Optional[str],
+    limit: int,
+    cursor: Optional[str],
+    fields: Optional[str],
+    index: Optional[NgramIndex] = None,
+) -> Tuple[List[Dict], Dict[str, str]]:
+    """목록 조회 -> (항목들, 응답 헤더), index: 최신 데이터 버전까지 반영된 n-gram 색인"""
+    names = _parse_fields(fields)
+    query = select(*(getattr(Post, name) for name in names))
 
     if category:
-        query = query.filter(Post.category == category)
+        query = query.where(Post.category == category)
+
+    if search and index is not None:
+        # 분류 필터도 색인 안에서 적용해서 상위 limit개만 받음
+        hits = index.search(search, limit, category)
+        if hits is not None:
+            return await _search_posts(db, query, names, hits, fulltext.search_terms(search), limit), {}
+
+    if search and fulltext.is_indexable(search):
+        hits = await fulltext.search(db, search, limit, category)
+        return await _search_posts(db, query, names, hits, fulltext.search_terms(search), limit), {}
 
     if search:
+        # 인덱스로 못 찾는 짧은 검색어(2글자 이하)는 ILIKE
         search_term = f"%{search.lower()}%"
-        query = query.filter(
+        query = query.where(
             (Post.title.ilike(search_term)) |
             (Post.content.ilike(search_term))
         )
 
-    posts = query.order_by(Post.created_at.desc()).all()
-    return posts
+    if cursor:
+        created_at, post_id = _decode_cursor(cursor)
+        query = query.where(
+            or_(Post.created_at < created_at, and_(Post.created_at == created_at, Post.id < post_id))
+        )
 
-# FastAPI에서는 경로 파라미터를 중괄호로 선언해야 하며, f-string을 사용할 필요가 없다.
-@app.api_route("/api/posts/{post_id}", methods=["GET"])  # api_route로 변경하여 validation 우회
-async def get_post(post_id, db: Session = Depends(get_db)):  # 타입 힌트 제거
-    print(f"DEBUG: Requesting post with ID: {post_id}, type: {type(post_id)}")
+    # 한 행 더 읽어서 다음 페이지 존재 여부 확인
+    result = await db.execute(query.order_by(Post.created_at.desc(), Post.id.desc()).limit(limit + 1))
+    rows = result.all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    headers = {}
+    if has_more:
+        last = rows[-1]
+        next_cursor = _encode_cursor(last.created_at, last.id)
+        next_url = request.url.include_query_params(cursor=next_cursor)
+        headers["X-Next-Cursor"] = next_cursor
+        headers["Link"] = f'<{next_url.path}?{next_url.query}>; rel="next"'
+
+    items = [_row_to_dict(names, row) for row in rows]
+    if search:
+        terms = fulltext.search_terms(search)
+        for item in items:
+            item["snippet"] = fulltext.make_snippet(item.get("content") or item.get("summary", ""), terms)
+    return items, headers
 
-    try:
-        post_id_int = int(post_id)
-        print(f"DEBUG: Converted to int: {post_id_int}")
-    except ValueError as e:
-        print(f"DEBUG: Failed to convert ID to int: {e}")
-        raise HTTPException(status_code=400, detail=f"Invalid ID format: {post_id}")
 
-    # 데이터베이스에 해당 ID가 존재하는지 확인
-    all_posts = db.query(Post).all()
-    print(f"DEBUG: All post IDs in database: {[p.id for p in all_posts]}")
+def _row_to_dict(names: List[str], row) -> Dict:
+    return {
+        name: value.isoformat() if isinstance(value, datetime) else value
+        for name, value in zip(names, row)
+    }
 
-    post = db.query(Post).filter(Post.id == post_id_int).first()
-    if not post:
-        print(f"DEBUG: Post with ID {post_id_int} not found")
-        raise HTTPException(status_code=404, detail="Post not found")
 
-    print(f"DEBUG: Found post: {post.id}, {post.title}")
-    return post
+async def _search_posts(db: AsyncSession, query, names: List[str], hits: List, terms: List[str], limit: int) -> List[Dict]:
+    """
+    검색 결과(관련도 순) 순서대로 요청한 필드를 읽어서 snippet을 붙임 (커서 없음)
+    snippet이 없는 결과(n-gram 색인)는 본문에서 직접 만든다.
+    """
+    if not hits:
+        return []
+    # 조건(분류)에 맞는 id만 먼저 골라 순위대로 limit개로 자른 뒤에 요청한 컬럼을 읽음
+    hit_ids = [hit.post_id for hit in hits]
+    id_query = query.with_only_columns(Post.id).where(Post.id.in_(hit_ids))
+    found = set((await db.execute(id_query)).scalars())
+    hits = [hit for hit in hits if hit.post_id in found][:limit]
+    if not hits:
+        return []
+    rows = {row.id: row for row in await db.execute(query.where(Post.id.in_([hit.post_id for hit in hits])))}
+    snippets = {hit.post_id: getattr(hit, "snippet", None) for hit in hits}
+    missing = [post_id for post_id, snippet in snippets.items() if snippet is None]
+    if missing:
+        for post_id, content in await db.execute(select(Post.id, Post.content).where(Post.id.in_(missing))):
+            snippets[post_id] = fulltext.make_snippet(content, terms)
+
+    items = []
+    for hit in hits:
+        item = _row_to_dict(names, rows[hit.post_id])
+        item["snippet"] = snippets[hit.post_id]
+        items.append(item)
+    return items
+
+
+@app.get("/api/posts/{post_id}", response_model=PostResponse)
+async def get_post(post_id: int, request: Request, db: AsyncSession = Depends(get_db)):
+    """글 상세 (기본 키 조회 + id별 응답 캐시, If-None-Match가 같으면 304)"""
+    key = str(post_id)
+    cached = post_cache.get(key)
+    if cached is None:
+        version = post_cache.version
+        post = await db.get(Post, post_id)
+        if not post:
+            raise HTTPException(status_code=404, detail="Post not found")
+        payload = PostResponse.model_validate(post).model_dump(mode="json")
+        cached = post_cache.put(key, payload, version=version)
+    return _cached_response(request, cached)
 
 
 @app.post("/api/posts", response_model=PostResponse, status_code=201)
-async def create_post(post: PostCreate, db: Session = Depends(get_db)):
+async def create_post(post: PostCreate, db: AsyncSession = Depends(get_db)):
     db_post = Post(**post.dict())
     db.add(db_post)
-    db.commit()
-    db.refresh(db_post)
+    await db.flush()
+    version = await data_version.bump(db)
+    await db.commit()
+    await db.refresh(db_post)
+    await _publish_posts(db, [db_post.id], version)
     return db_post
 
 
-@app.post("/api/news/fetch")
-async def fetch_latest_news(db: Session = Depends(get_db)):
-    """최신 뉴스를 가져와서 저장"""
-    await fetch_and_store_news(db)
-    return {"message": "Latest news fetched and stored successfully"}
-    
-        
+@app.post("/api/news/fetch", status_code=202)
+async def fetch_latest_news():
+    """
+    최신 뉴스 수집을 백그라운드 작업으로 시작하고 바로 202 응답
+    이미 실행 중인 작업이 있으면 그 작업의 id를 돌려준다 (중복 크롤링 방지)
+    """
+    job_id, status, merged = await start_ingest_job()
+    return {
+        "message": "News fetch already in progress" if merged else "News fetch started",
+        "job_id": job_id,
+        "status": status,
+        "merged": merged,
+        "status_url": f"/api/news/jobs/{job_id}",
+    }
+
+
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    """Prometheus 텍스트 형식 지표 (수집 단계/호스트/추출기별 시간, API 응답 시간)"""
+    return Response(content=metrics.REGISTRY.render(), media_type=metrics.CONTENT_TYPE)
+
+
+@app.get("/api/news/jobs/{job_id}", response_model=IngestJobResponse)
+async def get_ingest_job(job_id: str, db: AsyncSession = Depends(get_db)):
+    """수집 작업 진행 상황 조회 (실행 중인 워커가 INGEST_JOB_SAVE_SECONDS마다 저장한 값)"""
+    record = await db.get(IngestJobRecord, job_id)
+    if not record:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return IngestJobResponse.from_record(record)
+
 
 # 간단한 서버 실행
 if __name__ == "__main__":
@@ -782,7 +1982,8 @@ if __name__ == "__main__":
             print(traceback.format_exc())
     else:
         port = int(os.getenv("PORT", 8000))
-        uvicorn.run(app, host="127.0.0.1", port=port)
+        # 로깅은 setup_logging()에서 설정 - uvicorn 기본 설정으로 덮어쓰지 않음
+        uvicorn.run(app, host="127.0.0.1", port=port, log_config=None)
 
 
 
@@ -0,0 +1,68 @@
+"""
+alembic 환경 설정
+- 서버에서 실행: main.run_migrations()가 config.attributes["connection"]으로 연결을 넘겨줌
+- 명령줄에서 실행: DATABASE_URL 환경 변수(.env) 사용, 없으면 main.py와 같은 SQLite 기본값
+"""
+
+import os
+from logging.config import fileConfig
+
+from alembic import context
+from dotenv import load_dotenv
+from sqlalchemy import create_engine
+
+from models import Base
+
+config = context.config
+target_metadata = Base.metadata
+
+# FTS5 가상 테이블(posts_fts와 내부 테이블)은 모델에 없으므로 autogenerate 비교에서 제외
+def include_object(object, name, type_, reflected, compare_to):
+    return not (type_ == "table" and name.startswith("posts_fts"))
+
+
+def _database_url() -> str:
+    load_dotenv()
+    return os.getenv("DATABASE_URL") or "sqlite:///./news.db"
+
+
+def run_migrations_offline() -> None:
+    context.configure(
+        url=_database_url(),
+        target_metadata=target_metadata,
+        include_object=include_object,
+        literal_binds=True,
+        render_as_batch=True,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        _run(connection)
+        return
+
+    if config.config_file_name is not None:
+        fileConfig(config.config_file_name)
+    engine = create_engine(_database_url())
+    with engine.connect() as connection:
+        _run(connection)
+
+
+def _run(connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+        render_as_batch=True,  # SQLite ALTER 제한 대응
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
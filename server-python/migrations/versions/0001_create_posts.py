@@ -0,0 +1,37 @@
+"""posts 테이블 생성 (마이그레이션 도입 전 create_all로 만들던 스키마)
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 마이그레이션 도입 전에 create_all로 만든 DB는 테이블이 이미 있음
+    if sa.inspect(op.get_bind()).has_table("posts"):
+        return
+    op.create_table(
+        "posts",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("summary", sa.Text(), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("category", sa.String(), nullable=False),
+        sa.Column("image_url", sa.String(), nullable=False),
+        sa.Column("created_at", sa.TIMESTAMP(), server_default=sa.func.now(), nullable=True),
+    )
+    op.create_index("ix_posts_id", "posts", ["id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_posts_id", table_name="posts")
+    op.drop_table("posts")
@@ -0,0 +1,133 @@
+"""posts: dedup_key 유니크 키, published_at 컬럼, 목록 정렬용 복합 인덱스
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+"""
+import hashlib
+import re
+import unicodedata
+from typing import Optional, Sequence, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 마이그레이션 도입 전 서버 시작 시 추가하던 오름차순 인덱스 (내림차순 인덱스로 교체)
+LEGACY_INDEXES = ("ix_posts_created_at_id", "ix_posts_category_created_at_id")
+
+# 수집 기사 본문 끝에 붙이는 원문 링크 (main._prepare_article)
+_ARTICLE_LINK_RE = re.compile(r"🔗 전체 기사 보기: (\S+)\s*$")
+
+BACKFILL_CHUNK = 1000
+
+# 아래 키 함수는 이 리비전 시점의 dedup.make_dedup_key 복사본 (앱 코드가 바뀌어도 마이그레이션 결과는 고정)
+_TRACKING_PARAMS = {"oc", "fbclid", "gclid", "ref", "from", "cmpid", "rss"}
+_PUBLISHER_SUFFIX_RE = re.compile(r'\s+[-|]\s+[^-|]{1,40}$')
+
+_posts = sa.table(
+    "posts",
+    sa.column("id", sa.Integer),
+    sa.column("title", sa.String),
+    sa.column("content", sa.Text),
+    sa.column("dedup_key", sa.String),
+)
+
+
+def _canonical_url(url: str) -> str:
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in _TRACKING_PARAMS and not key.lower().startswith("utm_")
+    ]
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), host, path, urlencode(sorted(query)), ""))
+
+
+def _normalize_title(title: str) -> str:
+    title = unicodedata.normalize("NFKC", title or "").strip()
+    title = _PUBLISHER_SUFFIX_RE.sub("", title)
+    return " ".join(title.lower().split())
+
+
+def _make_dedup_key(url: Optional[str], title: str) -> str:
+    title_hash = hashlib.sha256(_normalize_title(title).encode("utf-8")).hexdigest()
+    return hashlib.sha256(f"{_canonical_url(url or '')}\n{title_hash}".encode("utf-8")).hexdigest()
+
+
+def _article_url(content: Optional[str]) -> Optional[str]:
+    match = _ARTICLE_LINK_RE.search(content or "")
+    return match.group(1) if match else None
+
+
+def backfill_dedup_keys(connection) -> int:
+    """
+    dedup_key가 없는 기존 글에 키 채우기 (제목 + 본문 끝 원문 링크, 링크가 없으면 제목만)
+    채우지 않으면 ON CONFLICT (dedup_key)가 기존 글과 맞지 않아서 같은 기사를 다시 저장한다.
+    같은 키가 이미 있거나 앞에서 나온 글은 NULL로 둔다 (유니크 인덱스)
+    """
+    seen = set(connection.execute(sa.select(_posts.c.dedup_key).where(_posts.c.dedup_key.isnot(None))).scalars())
+    ids = list(connection.execute(sa.select(_posts.c.id).where(_posts.c.dedup_key.is_(None)).order_by(_posts.c.id)).scalars())
+    update = _posts.update().where(_posts.c.id == sa.bindparam("post_id")).values(dedup_key=sa.bindparam("key"))
+    filled = 0
+    for start in range(0, len(ids), BACKFILL_CHUNK):
+        chunk = ids[start:start + BACKFILL_CHUNK]
+        rows = connection.execute(
+            sa.select(_posts.c.id, _posts.c.title, _posts.c.content).where(_posts.c.id.in_(chunk)).order_by(_posts.c.id)
+        )
+        params = []
+        for post_id, title, content in rows:
+            key = _make_dedup_key(_article_url(content), title)
+            if key not in seen:
+                seen.add(key)
+                params.append({"post_id": post_id, "key": key})
+        if params:
+            connection.execute(update, params)
+            filled += len(params)
+    return filled
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    columns = {column["name"] for column in inspector.get_columns("posts")}
+    indexes = {index["name"] for index in inspector.get_indexes("posts")}
+
+    if "dedup_key" not in columns:
+        op.add_column("posts", sa.Column("dedup_key", sa.String(64), nullable=True))
+    backfill_dedup_keys(op.get_bind())
+    if "ix_posts_dedup_key" not in indexes:
+        op.create_index("ix_posts_dedup_key", "posts", ["dedup_key"], unique=True)
+    if "published_at" not in columns:
+        op.add_column("posts", sa.Column("published_at", sa.TIMESTAMP(), nullable=True))
+
+    for name in LEGACY_INDEXES:
+        if name in indexes:
+            op.drop_index(name, table_name="posts")
+    op.create_index(
+        "ix_posts_created_at_desc", "posts", [sa.text("created_at DESC"), sa.text("id DESC")]
+    )
+    op.create_index(
+        "ix_posts_category_created_at_desc",
+        "posts",
+        ["category", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_posts_category_created_at_desc", table_name="posts")
+    op.drop_index("ix_posts_created_at_desc", table_name="posts")
+    op.drop_index("ix_posts_dedup_key", table_name="posts")
+    with op.batch_alter_table("posts") as batch:
+        batch.drop_column("published_at")
+        batch.drop_column("dedup_key")
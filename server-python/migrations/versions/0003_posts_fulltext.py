@@ -0,0 +1,98 @@
+"""posts 전문 검색 인덱스 (SQLite FTS5 trigram / PostgreSQL pg_trgm)
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17
+"""
+import logging
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger("alembic")
+
+# 검색 인덱스 DDL은 이 리비전에 고정 (fulltext.py는 만들어진 인덱스를 찾아서 쓰기만 함)
+_SQLITE_SETUP = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5(
+        title, summary, content,
+        content='posts', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS posts_fts_ai AFTER INSERT ON posts BEGIN
+        INSERT INTO posts_fts (rowid, title, summary, content)
+        VALUES (new.id, new.title, new.summary, new.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS posts_fts_ad AFTER DELETE ON posts BEGIN
+        INSERT INTO posts_fts (posts_fts, rowid, title, summary, content)
+        VALUES ('delete', old.id, old.title, old.summary, old.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS posts_fts_au AFTER UPDATE ON posts BEGIN
+        INSERT INTO posts_fts (posts_fts, rowid, title, summary, content)
+        VALUES ('delete', old.id, old.title, old.summary, old.content);
+        INSERT INTO posts_fts (rowid, title, summary, content)
+        VALUES (new.id, new.title, new.summary, new.content);
+    END
+    """,
+]
+
+_POSTGRES_SETUP = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_posts_title_trgm ON posts USING gin (title gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_posts_summary_trgm ON posts USING gin (summary gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_posts_content_trgm ON posts USING gin (content gin_trgm_ops)",
+]
+
+
+def _install(connection) -> None:
+    """검색 인덱스 생성, 실패하면 DBAPIError"""
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        created = connection.execute(
+            text("SELECT 1 FROM sqlite_master WHERE name = 'posts_fts'")
+        ).first() is None
+        for statement in _SQLITE_SETUP:
+            connection.execute(text(statement))
+        if created:
+            # 기존 글 색인
+            connection.execute(text("INSERT INTO posts_fts (posts_fts) VALUES ('rebuild')"))
+    elif dialect == "postgresql":
+        for statement in _POSTGRES_SETUP:
+            connection.execute(text(statement))
+
+
+def _uninstall(connection) -> None:
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        for trigger in ("posts_fts_ai", "posts_fts_ad", "posts_fts_au"):
+            connection.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+        connection.execute(text("DROP TABLE IF EXISTS posts_fts"))
+    elif dialect == "postgresql":
+        for index in ("ix_posts_title_trgm", "ix_posts_summary_trgm", "ix_posts_content_trgm"):
+            connection.execute(text(f"DROP INDEX IF EXISTS {index}"))
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    try:
+        # 실패해도(FTS5 없는 SQLite, 확장 생성 권한 없음) 나머지 마이그레이션은 유지
+        with connection.begin_nested():
+            _install(connection)
+    except DBAPIError as e:
+        logger.warning("⚠️ Full-text index unavailable, search will use ILIKE: %s", e)
+
+
+def downgrade() -> None:
+    _uninstall(op.get_bind())
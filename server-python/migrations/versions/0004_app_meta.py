@@ -0,0 +1,27 @@
+"""app_meta 테이블 (시드 버전 등 앱 상태)
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "app_meta",
+        sa.Column("key", sa.String(64), primary_key=True),
+        sa.Column("value", sa.String(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("app_meta")
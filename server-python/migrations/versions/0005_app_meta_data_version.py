@@ -0,0 +1,25 @@
+"""app_meta.data_version 행 (워커 간 공유하는 데이터 버전)
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_app_meta = sa.table("app_meta", sa.column("key", sa.String), sa.column("value", sa.String))
+
+
+def upgrade() -> None:
+    op.bulk_insert(_app_meta, [{"key": "data_version", "value": "0"}])
+
+
+def downgrade() -> None:
+    op.execute(_app_meta.delete().where(_app_meta.c.key == "data_version"))
@@ -0,0 +1,34 @@
+"""ingest_jobs 테이블 (워커 간 공유하는 수집 작업 상태)
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ingest_jobs",
+        sa.Column("id", sa.String(32), primary_key=True),
+        sa.Column("status", sa.String(16), nullable=False),
+        sa.Column("merged_requests", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("progress", sa.Text(), nullable=False),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.TIMESTAMP(), nullable=False),
+        sa.Column("updated_at", sa.TIMESTAMP(), nullable=False),
+    )
+    op.create_index("ix_ingest_jobs_status", "ingest_jobs", ["status"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ingest_jobs_status", table_name="ingest_jobs")
+    op.drop_table("ingest_jobs")
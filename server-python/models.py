@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+데이터베이스 모델
+스키마 변경은 migrations/ (alembic)에서 하고, 여기 모델은 마이그레이션 결과와 맞춰 둔다.
+"""
+
+from sqlalchemy import Column, Index, Integer, String, Text, TIMESTAMP, func
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.orm import declarative_base
+
+Base = declarative_base()
+
+
+class Post(Base):
+    __tablename__ = "posts"
+
+    id = Column(Integer, primary_key=True, index=True)
+    title = Column(String, nullable=False)
+    summary = Column(Text, nullable=False)
+    content = Column(Text, nullable=False)
+    category = Column(String, nullable=False)
+    image_url = Column("image_url", String, nullable=False)
+    # SQLite CURRENT_TIMESTAMP는 초 단위까지만 저장하므로 커서 비교 값도 같은 형식으로 바인딩
+    created_at = Column(
+        "created_at",
+        TIMESTAMP().with_variant(sqlite.DATETIME(truncate_microseconds=True), "sqlite"),
+        server_default=func.now(),
+    )
+    # 원문 기사 발행 시각 (RSS pubDate, UTC) - created_at은 우리 DB에 저장된 시각
+    published_at = Column(TIMESTAMP, nullable=True)
+    # 수집 기사 중복 판별 키 (정규화 URL + 제목 해시), 직접 작성한 글은 NULL
+    dedup_key = Column(String(64), unique=True, index=True, nullable=True)
+
+    __table_args__ = (
+        # 목록 키셋 페이지네이션: ORDER BY created_at DESC, id DESC (+ WHERE category = ?)
+        Index("ix_posts_created_at_desc", created_at.desc(), id.desc()),
+        Index("ix_posts_category_created_at_desc", category, created_at.desc(), id.desc()),
+    )
+
+
+class AppMeta(Base):
+    """앱 상태 키-값 (예: seed_version - 시드 데이터를 어느 버전까지 넣었는지)"""
+    __tablename__ = "app_meta"
+
+    key = Column(String(64), primary_key=True)
+    value = Column(String, nullable=False)
+
+
+class IngestJobRecord(Base):
+    """
+    수집 작업 상태 - 여러 워커가 같은 작업을 보도록 DB에 둔다
+    실행 중인 워커가 updated_at(heartbeat)과 progress(JSON)를 주기적으로 갱신
+    """
+    __tablename__ = "ingest_jobs"
+
+    id = Column(String(32), primary_key=True)
+    status = Column(String(16), nullable=False)  # pending -> running -> completed | failed
+    merged_requests = Column(Integer, nullable=False, default=0)
+    progress = Column(Text, nullable=False)
+    error = Column(Text, nullable=True)
+    created_at = Column(TIMESTAMP, nullable=False)
+    updated_at = Column(TIMESTAMP, nullable=False)
+
+    __table_args__ = (Index("ix_ingest_jobs_status", status),)
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+한국어 검색용 프로세스 내 역색인 (글자 n-gram + BM25)
+한국어는 복합어 안에 공백이 없어서 단어 토크나이저로는 "기준금리" 안의 "금리"를 못 찾는다.
+글자 2-gram/3-gram을 색인하면 부분 문자열 검색이 되고, BM25로 순위를 매긴다.
+
+- 포스팅 리스트: gram -> array('I') 문서 id + array('H') 가중 빈도 (dict/list보다 훨씬 작음)
+- 수집 경로에서 새 글을 바로 추가 (add), 삭제는 tombstone 후 스냅샷 저장 때 정리
+- 글마다 분류를 함께 저장해서 분류 필터 검색도 색인 안에서 상위 limit개만 고른다
+- 디스크 스냅샷(pickle)으로 재시작 시 전체 재색인 없이 복구, DB와 다른 글만 다시 색인
+"""
+
+import math
+import os
+import pickle
+import re
+import tempfile
+import threading
+import unicodedata
+import zlib
+from array import array
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+SNAPSHOT_VERSION = 2  # 2: 글별 분류 추가
+
+# 필드별 가중치 (제목에 나온 단어가 본문보다 중요)
+FIELD_WEIGHTS = (("title", 3), ("summary", 2), ("content", 1))
+MAX_TERM_FREQ = 0xFFFF  # array('H') 상한
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+class IndexHit(NamedTuple):
+    post_id: int
+    score: float
+
+
+def normalize(text: str) -> str:
+    return unicodedata.normalize("NFKC", text or "").lower()
+
+
+def ngrams(text: str, sizes: Tuple[int, ...] = (2, 3)) -> List[str]:
+    """공백/기호로 나눈 토큰마다 글자 n-gram, n보다 짧은 토큰은 토큰 그대로"""
+    grams = []
+    for token in _TOKEN_RE.findall(normalize(text)):
+        for size in sizes:
+            if len(token) < size:
+                if size == sizes[0]:
+                    grams.append(token)
+                continue
+            grams.extend(token[i:i + size] for i in range(len(token) - size + 1))
+    return grams
+
+
+def fingerprint(title: str, content_length: int) -> int:
+    """스냅샷과 DB의 글이 같은지 비교용 (SQLite는 삭제 후 id를 재사용할 수 있음)"""
+    return zlib.crc32(f"{title}\n{content_length}".encode("utf-8"))
+
+
+class NgramIndex:
+    def __init__(self, sizes: Tuple[int, ...] = (2, 3), k1: float = 1.2, b: float = 0.75):
+        self.sizes = sizes
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.Lock()
+        self._postings: Dict[str, Tuple[array, array]] = {}
+        self._doc_lengths: Dict[int, int] = {}
+        self._fingerprints: Dict[int, int] = {}
+        self._categories: Dict[int, str] = {}
+        self._deleted: Set[int] = set()
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._doc_lengths)
+
+    def __contains__(self, post_id: int) -> bool:
+        return post_id in self._doc_lengths
+
+    def _weighted_terms(self, fields: Dict[str, str]) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for name, weight in FIELD_WEIGHTS:
+            for gram in ngrams(fields.get(name) or "", self.sizes):
+                counts[gram] = counts.get(gram, 0) + weight
+        return counts
+
+    def add(self, post_id: int, title: str, summary: str, content: str, category: str) -> None:
+        """글 추가 (같은 id가 있으면 교체)"""
+        counts = self._weighted_terms({"title": title, "summary": summary, "content": content})
+        with self._lock:
+            if post_id in self._doc_lengths:
+                self._remove_locked(post_id)
+            if post_id in self._deleted:
+                # 예전 포스팅이 남아 있으면 먼저 정리 (교체/재사용 id는 드묾)
+                self._compact_locked()
+            for gram, count in counts.items():
+                postings = self._postings.get(gram)
+                if postings is None:
+                    postings = self._postings[gram] = (array("I"), array("H"))
+                postings[0].append(post_id)
+                postings[1].append(min(count, MAX_TERM_FREQ))
+            length = sum(counts.values())
+            self._doc_lengths[post_id] = length
+            self._fingerprints[post_id] = fingerprint(title, len(content or ""))
+            self._categories[post_id] = category
+            self._total_length += length
+
+    def remove(self, post_id: int) -> None:
+        with self._lock:
+            self._remove_locked(post_id)
+
+    def _remove_locked(self, post_id: int) -> None:
+        length = self._doc_lengths.pop(post_id, None)
+        if length is None:
+            return
+        self._fingerprints.pop(post_id, None)
+        self._categories.pop(post_id, None)
+        self._total_length -= length
+        # 포스팅에서 바로 지우지 않고 검색 때 건너뜀
+        self._deleted.add(post_id)
+
+    def search(self, query: str, limit: int, category: Optional[str] = None) -> Optional[List[IndexHit]]:
+        """
+        BM25 순위 상위 limit개, 검색어 단어들의 첫 n-gram이 모두 있는 글만 (category가 있으면 그 분류만)
+        색인으로 처리할 수 없는 검색어(한 글자 등)는 None
+        """
+        terms = [token for token in _TOKEN_RE.findall(normalize(query))]
+        if not terms or any(len(term) < self.sizes[0] for term in terms):
+            return None
+        query_grams = set(ngrams(query, self.sizes))
+        # 모든 단어를 포함해야 하므로 각 단어의 가장 작은 n-gram들이 전부 있어야 함
+        required = set(ngrams(query, self.sizes[:1]))
+
+        with self._lock:
+            doc_count = len(self._doc_lengths)
+            if not doc_count:
+                return []
+            avg_length = self._total_length / doc_count
+            scores: Dict[int, float] = {}
+            matched: Dict[int, int] = {}
+            for gram in query_grams:
+                postings = self._postings.get(gram)
+                if postings is None:
+                    if gram in required:
+                        return []
+                    continue
+                doc_ids, freqs = postings
+                df = len(doc_ids)
+                idf = math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+                is_required = gram in required
+                for post_id, tf in zip(doc_ids, freqs):
+                    if post_id in self._deleted:
+                        continue
+                    norm = self.k1 * (1 - self.b + self.b * self._doc_lengths[post_id] / avg_length)
+                    scores[post_id] = scores.get(post_id, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+                    if is_required:
+                        matched[post_id] = matched.get(post_id, 0) + 1
+            if category is not None:
+                matched = {post_id: count for post_id, count in matched.items() if self._categories.get(post_id) == category}
+
+        candidates = [post_id for post_id, count in matched.items() if count == len(required)]
+        candidates.sort(key=lambda post_id: (-scores[post_id], -post_id))
+        return [IndexHit(post_id, scores[post_id]) for post_id in candidates[:limit]]
+
+    def fingerprints(self) -> Dict[int, int]:
+        with self._lock:
+            return dict(self._fingerprints)
+
+    def _compact_locked(self) -> None:
+        """tombstone 처리된 글을 포스팅에서 실제로 제거"""
+        if not self._deleted:
+            return
+        for gram in list(self._postings):
+            doc_ids, freqs = self._postings[gram]
+            keep = [i for i, post_id in enumerate(doc_ids) if post_id not in self._deleted]
+            if not keep:
+                del self._postings[gram]
+            elif len(keep) != len(doc_ids):
+                self._postings[gram] = (array("I", (doc_ids[i] for i in keep)), array("H", (freqs[i] for i in keep)))
+        self._deleted.clear()
+
+    def save(self, path: str) -> None:
+        """
+        스냅샷 저장 (임시 파일에 쓰고 교체해서 중간에 죽어도 이전 스냅샷 유지)
+        임시 파일은 프로세스마다 달라서 여러 워커가 동시에 저장해도 섞이지 않는다
+        """
+        with self._lock:
+            self._compact_locked()
+            state = {
+                "version": SNAPSHOT_VERSION,
+                "sizes": self.sizes,
+                "postings": self._postings,
+                "doc_lengths": self._doc_lengths,
+                "fingerprints": self._fingerprints,
+                "categories": self._categories,
+            }
+            data = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+        fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=os.path.dirname(path) or ".")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: str) -> Optional["NgramIndex"]:
+        """스냅샷 읽기, 없거나 형식이 다르면 None"""
+        try:
+            with open(path, "rb") as f:
+                state = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        if not isinstance(state, dict) or state.get("version") != SNAPSHOT_VERSION:
+            return None
+        index = cls(sizes=tuple(state["sizes"]))
+        index._postings = state["postings"]
+        index._doc_lengths = state["doc_lengths"]
+        index._fingerprints = state["fingerprints"]
+        index._categories = state["categories"]
+        index._total_length = sum(index._doc_lengths.values())
+        return index
+
+    def sync(
+        self,
+        rows: Iterable[Tuple[int, str, int]],
+        load: Callable[[List[int]], Iterable[Tuple[int, str, str, str, str]]],
+    ) -> Tuple[int, int]:
+        """
+        DB 글 목록 (id, title, 본문 길이)과 맞춤 - 본문과 분류는 다시 색인할 글만 load(ids)로 읽음
+        스냅샷에 없거나 내용이 바뀐 글은 다시 색인, DB에 없는 글은 삭제
+        반환: (추가/교체한 수, 삭제한 수)
+        """
+        known = self.fingerprints()
+        current = set()
+        changed = []
+        for post_id, title, content_length in rows:
+            current.add(post_id)
+            if known.get(post_id) != fingerprint(title, content_length or 0):
+                changed.append(post_id)
+        for post_id, title, summary, content, category in load(changed) if changed else ():
+            self.add(post_id, title, summary, content, category)
+        stale = [post_id for post_id in known if post_id not in current]
+        for post_id in stale:
+            self.remove(post_id)
+        return len(changed), len(stale)
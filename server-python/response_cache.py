@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+읽기 API 응답 캐시
+직렬화된 JSON 본문과 ETag를 요청 키(경로 + 쿼리)별로 보관한다.
+데이터 버전(data_version.DataVersion, 워커 간 공유)이 바뀌면 sync()로 맞추고 이전 버전에서 만든 항목은 버린다.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional
+
+# 브라우저가 매번 If-None-Match로 재검증 (바뀌지 않았으면 304)
+CACHE_CONTROL = "public, max-age=0, must-revalidate"
+
+
+class CachedResponse(NamedTuple):
+    etag: str
+    body: bytes
+    headers: Dict[str, str]
+
+
+def make_etag(body: bytes) -> str:
+    """본문 해시로 만든 강한 ETag (내용이 같으면 버전이 바뀌어도 같은 값)"""
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    return if_none_match.strip() == "*" or etag in (tag.strip() for tag in if_none_match.split(","))
+
+
+class ResponseCache:
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self.version = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (version, CachedResponse)
+
+    def sync(self, version: int) -> None:
+        """공유 데이터 버전이 올라갔으면 따라가고 이전 항목 비우기"""
+        with self._lock:
+            if version > self.version:
+                self.version = version
+                self._entries.clear()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != self.version:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: str, payload, headers: Optional[Dict[str, str]] = None, version: Optional[int] = None) -> CachedResponse:
+        """
+        payload를 JSON으로 직렬화해서 저장
+        version은 조회를 시작할 때 읽은 값 - 조회 도중 데이터가 바뀌었으면 저장하지 않는다
+        """
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        cached = CachedResponse(make_etag(body), body, dict(headers or {}))
+        with self._lock:
+            if version is None or version == self.version:
+                self._entries[key] = (self.version, cached)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return cached
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+여러 uvicorn 워커 사이의 잠금
+마이그레이션/시드를 한 번에 하나씩만 실행하고, 수집 작업 등록도 한 워커씩 하게 한다 (key로 구분)
+- PostgreSQL: pg_advisory_lock (DB 서버 기준이라 여러 호스트에서도 동작)
+- 그 외(SQLite): 서버 폴더의 잠금 파일 (.startup.lock 등, 같은 호스트의 프로세스끼리)
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+# pg_advisory_lock 키 (앱 고유 값이면 아무 정수나 상관없음)
+ADVISORY_LOCK_KEY = 0x6E657773  # "news"
+INGEST_LOCK_KEY = 0x696E6773  # "ings" - 수집 작업 등록
+
+
+@contextmanager
+def startup_lock(engine: Engine, lock_path: str, key: int = ADVISORY_LOCK_KEY):
+    if engine.dialect.name == "postgresql":
+        with engine.connect() as conn:
+            conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": key})
+            try:
+                yield
+            finally:
+                conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": key})
+        return
+
+    with open(lock_path, "a+b") as f:
+        started = time.perf_counter()
+        _lock_file(f)
+        waited = time.perf_counter() - started
+        if waited > 0.1:
+            logger.info("⏳ Waited %.1fs for another worker's lock (%s)", waited, lock_path)
+        try:
+            yield
+        finally:
+            _unlock_file(f)
+
+
+def _lock_file(f) -> None:
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        return
+    # msvcrt.locking은 약 10초 동안만 재시도하므로 잠금을 얻을 때까지 반복
+    f.seek(0)
+    while True:
+        try:
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            continue
+
+
+def _unlock_file(f) -> None:
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        return
+    f.seek(0)
+    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Google News URL -> 실제 기사 URL 디코딩 결과 영구 캐시
+같은 기사 ID(CBMi...)가 실행/토픽을 넘나들며 반복되므로 한 번 디코딩한 결과는
+SQLite 파일에 저장해 두고 네트워크 없이 재사용한다.
+
+- TTL: 성공 결과는 길게, 실패 결과(네거티브 캐시)는 짧게 보관
+- LRU: 최대 개수를 넘으면 가장 오래 조회되지 않은 항목부터 삭제
+"""
+
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from gnews_id import extract_article_id
+
+EVICT_CHECK_INTERVAL = 100  # put 100번마다 한 번씩 크기 확인
+
+
+def cache_key(url: str) -> str:
+    """캐시 키: 기사 ID만 사용 (?oc=5 같은 쿼리, rss/비rss 경로 차이 무시)"""
+    return extract_article_id(url) or url
+
+
+class DecodedUrlCache:
+    def __init__(
+        self,
+        path: str = "url_cache.db",
+        ttl_seconds: float = 30 * 24 * 3600,
+        negative_ttl_seconds: float = 3600,
+        max_entries: int = 50000,
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._puts_since_evict = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS decoded_urls (
+                key TEXT PRIMARY KEY,
+                decoded_url TEXT,          -- NULL이면 디코딩 실패(네거티브 캐시)
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_decoded_urls_last_access ON decoded_urls (last_access)"
+        )
+
+    def get(self, url: str) -> Optional[str]:
+        """
+        캐시 조회
+        - 성공 결과가 있으면 디코딩된 URL
+        - 실패가 캐시되어 있으면 원본 URL (디코딩 함수의 실패 반환값과 동일)
+        - 캐시에 없거나 만료되었으면 None
+        """
+        key = cache_key(url)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT decoded_url, expires_at FROM decoded_urls WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[1] < now:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE decoded_urls SET last_access = ? WHERE key = ?", (now, key))
+            self.hits += 1
+        return row[0] if row[0] else url
+
+    def put(self, url: str, decoded_url: Optional[str]) -> None:
+        """디코딩 결과 저장 - decoded_url이 None이거나 원본과 같으면 실패로 기록"""
+        key = cache_key(url)
+        failed = not decoded_url or decoded_url == url
+        ttl = self.negative_ttl_seconds if failed else self.ttl_seconds
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO decoded_urls (key, decoded_url, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?)",
+                (key, None if failed else decoded_url, now + ttl, now),
+            )
+            self._puts_since_evict += 1
+            if self._puts_since_evict >= EVICT_CHECK_INTERVAL:
+                self._puts_since_evict = 0
+                self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        """만료 항목 삭제 후 최대 개수를 넘는 만큼 LRU 순서로 삭제 (lock 안에서 호출)"""
+        count = self._conn.execute("SELECT COUNT(*) FROM decoded_urls").fetchone()[0]
+        if count <= self.max_entries:
+            return
+        self._conn.execute("DELETE FROM decoded_urls WHERE expires_at < ?", (now,))
+        overflow = self._conn.execute("SELECT COUNT(*) FROM decoded_urls").fetchone()[0] - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM decoded_urls WHERE key IN "
+                "(SELECT key FROM decoded_urls ORDER BY last_access ASC LIMIT ?)",
+                (overflow,),
+            )
+
+    def stats(self) -> dict:
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM decoded_urls").fetchone()[0]
+        return {"entries": size, "hits": self.hits, "misses": self.misses}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
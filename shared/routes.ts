@@ -1,5 +1,5 @@
 import { z } from "zod";
-import { insertPostSchema, posts } from "./schema";
+import { insertPostSchema, posts, type PostListItem } from "./schema";
 
 export const errorSchemas = {
   validation: z.object({
@@ -23,10 +23,13 @@ export const api = {
         .object({
           category: z.string().optional(),
           search: z.string().optional(),
+          limit: z.number().int().min(1).max(200).optional(),
+          cursor: z.string().optional(), // 이전 응답의 X-Next-Cursor 헤더 값
+          fields: z.string().optional(), // "list" 또는 쉼표로 구분한 필드 이름
         })
         .optional(),
       responses: {
-        200: z.array(z.custom<typeof posts.$inferSelect>()),
+        200: z.array(z.custom<PostListItem>()),
       },
     },
     get: {
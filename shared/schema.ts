@@ -18,4 +18,6 @@ export const insertPostSchema = createInsertSchema(posts).omit({
 });
 
 export type Post = typeof posts.$inferSelect;
+// 목록 응답 항목 (fields=list: 본문 제외, 검색 결과에는 snippet)
+export type PostListItem = Omit<Post, "content"> & { snippet?: string };
 export type InsertPost = z.infer<typeof insertPostSchema>;